@@ -6,6 +6,11 @@ client: single-sig and multisig inception, delegated inception, interactions,
 rotations, endpoint-role publication, location publication, and identifier-
 local signing helpers.
 """
+import copy
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import asdict
 from math import ceil
 from urllib.parse import urlsplit
@@ -15,17 +20,250 @@ from keri.app.keeping import Algos
 from keri.core import eventing
 from keri.core.coring import MtrDex, Tholder
 from keri.kering import Roles
+from requests import HTTPError
 
 from signify.app.clienting import SignifyClient
 from signify.core import httping, api
 
 
+class HabStateCache:
+    """Client-wide cache of identifier habitat state keyed by alias.
+
+    Entries are filled by :meth:`Identifiers.get` and advanced in place from
+    interaction events KERIA accepted, so callers that anchor continuously on
+    one AID skip the ``GET /identifiers/{name}`` read before each event. Any
+    entry whose state can no longer be derived locally, after a rotation or a
+    failed submission, is dropped and re-read on next use.
+    """
+
+    def __init__(self):
+        self._habs = dict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._habs)
+
+    def get(self, name):
+        """Return a copy of the cached habitat for ``name`` or None."""
+        with self._lock:
+            hab = self._habs.get(name)
+            return copy.deepcopy(hab) if hab is not None else None
+
+    def put(self, hab):
+        """Cache a habitat freshly read from KERIA under its alias.
+
+        Group habitats are never cached because their state also advances
+        through events other members submit. A read that is older than the
+        cached entry, because :meth:`advance` moved the entry on while the
+        read was in flight, never replaces it.
+        """
+        with self._lock:
+            if "group" in hab:
+                self._habs.pop(hab["name"], None)
+                return
+
+            cached = self._habs.get(hab["name"])
+            if cached is not None and self._sn(cached) > self._sn(hab):
+                return
+
+            self._habs[hab["name"]] = copy.deepcopy(hab)
+
+    @staticmethod
+    def _sn(hab):
+        """Return the sequence number of the key state in ``hab``."""
+        return int(hab["state"].get("s", "0"), 16)
+
+    def advance(self, name, serder):
+        """Move the cached state for ``name`` onto the accepted interaction event ``serder``.
+
+        The entry is dropped instead when it is not the prior event of ``serder``.
+        """
+        with self._lock:
+            hab = self._habs.get(name)
+            if hab is None:
+                return
+
+            state = hab["state"]
+            if serder.ked["t"] != "ixn" or serder.ked["p"] != state["d"]:
+                del self._habs[name]
+                return
+
+            state["p"] = state["d"]
+            state["s"] = serder.ked["s"]
+            state["d"] = serder.said
+            state["et"] = serder.ked["t"]
+
+    def invalidate(self, name=None):
+        """Drop the cached habitat for ``name`` or every habitat when ``name`` is None."""
+        with self._lock:
+            if name is None:
+                self._habs.clear()
+            else:
+                self._habs.pop(name, None)
+
+
+class EventSequencer:
+    """Serialize key event construction and submission per identifier.
+
+    Each AID prefix gets its own reentrant lock, so aliases that resolve to
+    the same prefix, such as an alias before and after a rename, share it. A
+    caller holding it reads the current state, builds its event at the next
+    sequence number and submits it before the next caller for that identifier
+    can read the state, so concurrent anchors never race for the same ``sn``.
+    Together with the :class:`HabStateCache` the next holder starts from the
+    locally advanced state instead of reading KERIA again. Different
+    identifiers never wait on each other. The sequencer is client-wide, so
+    only callers of the same :class:`~signify.app.clienting.SignifyClient`
+    are serialized.
+    """
+
+    def __init__(self):
+        self._locks = dict()
+        self._names = dict()
+        self._lock = threading.Lock()
+
+    def hold(self, pre):
+        """Return the lock serializing events for the identifier with prefix ``pre``."""
+        return self._get(self._locks, pre)
+
+    def resolving(self, name):
+        """Return the lock held while alias ``name`` is resolved to its prefix.
+
+        Concurrent callers on a cold alias then share one KERIA read instead
+        of each reading the state before they can pick a prefix lock.
+        """
+        return self._get(self._names, name)
+
+    def _get(self, locks, key):
+        with self._lock:
+            lock = locks.get(key)
+            if lock is None:
+                lock = locks[key] = threading.RLock()
+
+            return lock
+
+
+class IdentifierCreateItem:
+    """Outcome of one identifier requested from :meth:`Identifiers.create_many`.
+
+    Attributes:
+        name (str): Alias of the requested identifier.
+        pidx (int): Salty key index reserved for the identifier.
+        serder: Local inception event serder, None when building it failed.
+        sigs (list[str]): Signatures over ``serder``.
+        op (dict): Latest known state of the KERIA inception operation.
+        error: The exception raised while building, submitting or waiting, or
+            the ``error`` payload of a failed operation. None on success.
+    """
+
+    def __init__(self, name, pidx):
+        self.name = name
+        self.pidx = pidx
+        self.serder = None
+        self.sigs = None
+        self.op = None
+        self.error = None
+
+    @property
+    def ok(self):
+        """True when the identifier was submitted and its operation did not fail."""
+        return self.error is None
+
+
+class IdentifierCreateResult:
+    """Per-identifier outcomes of one :meth:`Identifiers.create_many` call, in request order."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    @property
+    def succeeded(self):
+        """Items whose identifier was created."""
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self):
+        """Items that failed at any stage."""
+        return [item for item in self.items if not item.ok]
+
+
+class ReplyPublishItem:
+    """Outcome of one reply requested from :meth:`Identifiers.add_end_roles` or :meth:`Identifiers.add_loc_schemes`.
+
+    Attributes:
+        name (str): Alias of the publishing identifier.
+        rpy: Signed reply serder, None when building it failed.
+        sigs (list[str]): Signatures over ``rpy``.
+        op (dict): KERIA response, the latest known state of its operation when it returned one.
+        error: The exception raised while building, submitting or waiting, or
+            the ``error`` payload of a failed operation. None on success.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.rpy = None
+        self.sigs = None
+        self.op = None
+        self.error = None
+
+    @property
+    def ok(self):
+        """True when the reply was submitted and its operation did not fail."""
+        return self.error is None
+
+
+class ReplyPublishResult:
+    """Per-reply outcomes of one bulk endpoint publication, in request order."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    @property
+    def succeeded(self):
+        """Items whose reply was published."""
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self):
+        """Items that failed at any stage."""
+        return [item for item in self.items if not item.ok]
+
+    def summary(self):
+        """Return counts of the outcomes and of the distinct operations KERIA started."""
+        ops = {item.op["name"] for item in self.items if isinstance(item.op, dict) and "name" in item.op}
+        pending = {item.op["name"] for item in self.items
+                   if isinstance(item.op, dict) and "name" in item.op and item.op.get("done") is not True}
+        return dict(total=len(self.items), succeeded=len(self.succeeded), failed=len(self.failed),
+                    operations=len(ops), pending=len(pending))
+
+
 class Identifiers:
     """Resource wrapper for identifier lifecycle and endpoint publication."""
 
-    def __init__(self, client: SignifyClient):
-        """Create an identifier resource bound to one Signify client."""
+    def __init__(self, client: SignifyClient, cache=None, sequencer=None):
+        """Create an identifier resource bound to one Signify client.
+
+        Parameters:
+            client (SignifyClient): Signify client used to access KERIA
+            cache (HabStateCache | None): client-wide habitat state cache, None disables caching
+            sequencer (EventSequencer | None): client-wide per-identifier event sequencer, None disables
+                sequencing
+        """
         self.client = client
+        self.cache = cache
+        self.sequencer = sequencer
 
     def list(self, start=0, end=24):
         """List identifiers visible to the current agent within a range window."""
@@ -37,10 +275,104 @@ class Identifiers:
 
         return dict(start=start, end=end, total=total, aids=res.json())
 
+    def iter_all(self, page_size=25, prefetch=4):
+        """Yield every identifier record in order, fetching range windows concurrently.
+
+        The first window supplies the ``total`` from ``Content-Range``; the
+        remaining windows are requested up to ``prefetch`` at a time ahead of
+        the consumer, so at most ``prefetch`` pages are held in memory.
+
+        Parameters:
+            page_size (int): number of identifiers requested per ``Range`` window
+            prefetch (int): maximum number of windows fetched ahead of the consumer
+        """
+        if page_size < 1:
+            raise ValueError(f"invalid page_size={page_size}, must be at least 1")
+        if prefetch < 1:
+            raise ValueError(f"invalid prefetch={prefetch}, must be at least 1")
+
+        first = self.list(start=0, end=page_size - 1)
+        yield from first["aids"]
+
+        # KERIA may cap the window size, the first page tells the effective one
+        step = len(first["aids"])
+        if not step or step >= first["total"]:
+            return
+
+        starts = iter(range(step, first["total"], step))
+        pool = ThreadPoolExecutor(max_workers=prefetch)
+        try:
+            pending = deque()
+            for start in starts:
+                pending.append(pool.submit(self.list, start=start, end=start + step - 1))
+                if len(pending) >= prefetch:
+                    break
+
+            while pending:
+                page = pending.popleft().result()
+                start = next(starts, None)
+                if start is not None:
+                    pending.append(pool.submit(self.list, start=start, end=start + step - 1))
+                yield from page["aids"]
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def get(self, name):
-        """Return the stored habitat state for one identifier by name."""
+        """Return the stored habitat state for one identifier by name.
+
+        Always reads from KERIA and refreshes the habitat state cache.
+        """
         habState = self.client.get(f"/identifiers/{name}")
-        return habState.json()
+        hab = habState.json()
+        if self.cache is not None:
+            self.cache.put(hab)
+
+        return hab
+
+    def getCached(self, name):
+        """Return habitat state for ``name`` from the habitat state cache, reading KERIA on a miss."""
+        if self.cache is not None:
+            hab = self.cache.get(name)
+            if hab is not None:
+                return hab
+
+        return self.get(name)
+
+    def sequence(self, name):
+        """Return a context manager holding the event sequence for the identifier ``name`` resolves to.
+
+        Wrap the state read, event build and submission of one key event in it
+        so concurrent callers anchoring on the same identifier take turns. The
+        alias is resolved to its prefix through the habitat state cache.
+        """
+        if self.sequencer is None:
+            return nullcontext()
+
+        with self.sequencer.resolving(name):
+            pre = self.getCached(name)["prefix"]
+
+        return self.sequencer.hold(pre)
+
+    def advance(self, name, serder):
+        """Record that KERIA accepted interaction event ``serder`` for ``name``."""
+        if self.cache is not None:
+            self.cache.advance(name, serder)
+
+    def invalidate(self, name=None):
+        """Drop cached habitat state for ``name``, or for every identifier when ``name`` is None."""
+        if self.cache is not None:
+            self.cache.invalidate(name)
+
+    def postEvent(self, name, path, body, serder):
+        """Post an event for ``name`` and keep the cached state in step with the outcome."""
+        try:
+            res = self.client.post(path, json=body)
+        except Exception:
+            self.invalidate(name)
+            raise
+
+        self.advance(name, serder)
+        return res
 
     def rename(self, name, newName):
         """Rename an identifier alias without changing its underlying AID."""
@@ -60,8 +392,125 @@ class Identifiers:
             its signatures, and the KERIA long-running operation payload.
         """
 
+        pidx = self.client.reservePidx()
+        try:
+            serder, sigs, body = self._buildInception(name, pidx, transferable=transferable, isith=isith,
+                                                      nsith=nsith, wits=wits, toad=toad, proxy=proxy, delpre=delpre,
+                                                      dcode=dcode, data=data, algo=algo, estOnly=estOnly, DnD=DnD,
+                                                      **kwargs)
+        except Exception:
+            self.client.releasePidx(pidx)
+            raise
+
+        res = self._postInception(pidx, body)
+        return serder, sigs, res.json()
+
+    def create_many(self, specs, *, max_workers=8, wait=True, timeout=None):
+        """Create many identifiers with parallel key derivation and bounded submission concurrency.
+
+        One contiguous block of salty key indexes is reserved for the whole
+        batch up front. Key derivation, event signing and ``POST /identifiers``
+        then run for up to ``max_workers`` identifiers at a time, and the
+        resulting operations are waited on together with one
+        :class:`~signify.app.coring.OperationWaiter`. A failure of one
+        identifier never stops the others. The index of an identifier that
+        fails to build or that KERIA rejects is released again, see
+        :meth:`SignifyClient.releasePidx`.
+
+        Parameters:
+            specs (Iterable[str | dict]): an alias, or a dict of :meth:`create` keyword arguments
+                including ``name``, per identifier
+            max_workers (int): maximum number of identifiers derived and submitted concurrently
+            wait (bool): wait for every submitted inception operation to complete
+            timeout (float | None): seconds to wait for the operations, items still pending
+                afterwards fail with ``TimeoutError``
+
+        Returns:
+            IdentifierCreateResult: one :class:`IdentifierCreateItem` per spec in request order
+
+        Raises:
+            ValueError: when a spec has no ``name``, before any key index is reserved
+        """
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        names, specs = self._namedSpecs(specs)
+        if not specs:
+            return IdentifierCreateResult([])
+
+        start = self.client.reservePidx(len(specs))
+        try:
+            items = [IdentifierCreateItem(name, start + offset) for offset, name in enumerate(names)]
+            pool = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+        except Exception:
+            self.client.releasePidx(start, len(specs))
+            raise
+
+        def submit(item, spec):
+            try:
+                item.serder, item.sigs, body = self._buildInception(item.name, item.pidx, **spec)
+            except Exception as ex:
+                item.error = ex
+                self.client.releasePidx(item.pidx)
+                return
+
+            try:
+                item.op = self._postInception(item.pidx, body).json()
+            except Exception as ex:
+                item.error = ex
+
+        with pool:
+            list(pool.map(submit, items, specs))
+
+        submitted = {item.op["name"]: item for item in items if item.ok}
+        if wait and submitted:
+            waiter = self.client.operations().waiter([item.op for item in submitted.values()], timeout=timeout)
+            try:
+                for op in waiter:
+                    item = submitted.pop(op["name"])
+                    item.op = op
+                    if op.get("error") is not None:
+                        item.error = op["error"]
+            except TimeoutError as ex:
+                for name, item in submitted.items():
+                    item.op = waiter.latest[name]
+                    item.error = ex
+
+        return IdentifierCreateResult(items)
+
+    @staticmethod
+    def _namedSpecs(specs):
+        """Split alias or keyword-argument specs into their names and copies of their remaining arguments.
+
+        Raises:
+            ValueError: when a spec has no ``name``, before any work is done
+        """
+        specs = [dict(name=spec) if isinstance(spec, str) else dict(spec) for spec in specs]
+        missing = [idx for idx, spec in enumerate(specs) if "name" not in spec]
+        if missing:
+            raise ValueError(f"specs at {missing} have no name")
+
+        return [spec.pop("name") for spec in specs], specs
+
+    def _postInception(self, pidx, body):
+        """Submit an inception request body, releasing ``pidx`` when KERIA rejects it.
+
+        Only a 4xx response proves KERIA did not store the identifier, after
+        any other failure ``pidx`` stays reserved.
+        """
+        try:
+            return self.client.post("/identifiers", json=body)
+        except HTTPError as ex:
+            if ex.response is not None and 400 <= ex.response.status_code < 500:
+                self.client.releasePidx(pidx)
+            raise
+
+    def _buildInception(self, name, pidx, transferable=True, isith="1", nsith="1", wits=None, toad="0", proxy=None,
+                        delpre=None, dcode=MtrDex.Blake3_256, data=None, algo=Algos.salty, estOnly=False, DnD=False,
+                        **kwargs):
+        """Derive keys for ``pidx`` and build the signed inception request body without submitting it."""
         # Get the algo specific key params
-        keeper = self.client.manager.new(algo, self.client.pidx, **kwargs)
+        keeper = self.client.manager.new(algo, pidx, **kwargs)
 
         keys, ndigs = keeper.incept(transferable=transferable)
 
@@ -110,10 +559,7 @@ class Identifiers:
         if 'rstates' in kwargs:
             body['rmids'] = [state['i'] for state in kwargs['rstates']]
 
-        self.client.pidx = self.client.pidx + 1
-
-        res = self.client.post("/identifiers", json=body)
-        return serder, sigs, res.json()
+        return serder, sigs, body
 
     def update(self, name, info=None, typ=None, **kwas):
         """Update identifier metadata or dispatch an interaction/rotation flow.
@@ -123,6 +569,7 @@ class Identifiers:
         ``update(name, typ="interact", ...)`` or ``update(name, "interact", ...)``.
         """
         if isinstance(info, dict) and typ is None:
+            self.invalidate(name)
             res = self.client.put(f"/identifiers/{name}", json=info)
             return res.json()
 
@@ -138,17 +585,28 @@ class Identifiers:
 
     def delete(self, name):
         """Delete an identifier by alias from the remote agent."""
+        self.invalidate(name)
         self.client.delete(f"/identifiers/{name}")
 
     def interact(self, name, data=None):
         """Create and submit a signed interaction event for an identifier."""
-        serder, sigs, body = self.createInteract(name, data=data)
-        res = self.client.post(f"/identifiers/{name}/events", json=body)
+        with self.sequence(name):
+            serder, sigs, body = self.createInteract(name, data=data)
+            res = self.postEvent(name, f"/identifiers/{name}/events", body, serder)
+
         return serder, sigs, res.json()
 
+    def coalescer(self, name, **kwargs):
+        """Return an :class:`AnchorCoalescer` that batches seals for ``name`` into shared interaction events."""
+        return AnchorCoalescer(self, name, **kwargs)
+
     def createInteract(self, name, data=None):
         """Create the local interaction event payload without submitting it."""
-        hab = self.get(name)
+        hab = self.getCached(name)
+        return self._buildInteract(hab, data=data)
+
+    def _buildInteract(self, hab, data=None):
+        """Build and sign an interaction event on top of the supplied habitat state."""
         pre = hab["prefix"]
 
         state = hab["state"]
@@ -175,7 +633,20 @@ class Identifiers:
         current signing-member and rotating-member state into the KERIA request
         body.
         """
-        hab = self.get(name)
+        with self.sequence(name):
+            hab = self.getCached(name)
+            serder, sigs, body = self._buildRotate(hab, transferable=transferable, nsith=nsith, toad=toad, cuts=cuts,
+                                                   adds=adds, data=data, ncode=ncode, ncount=ncount, ncodes=ncodes,
+                                                   states=states, rstates=rstates)
+
+            # keys and keeper parameters change with the rotation so the cached state is always dropped
+            res = self.postEvent(name, f"/identifiers/{name}/events", body, serder)
+
+        return serder, sigs, res.json()
+
+    def _buildRotate(self, hab, *, transferable=True, nsith=None, toad=None, cuts=None, adds=None, data=None,
+                     ncode=MtrDex.Ed25519_Seed, ncount=1, ncodes=None, states=None, rstates=None):
+        """Rotate the keeper for ``hab`` and build the signed rotation request body without submitting it."""
         pre = hab["prefix"]
 
         state = hab["state"]
@@ -236,8 +707,7 @@ class Identifiers:
         if rstates is not None:
             body['rmids'] = [state['i'] for state in rstates]
 
-        res = self.client.post(f"/identifiers/{name}/events", json=body)
-        return serder, sigs, res.json()
+        return serder, sigs, body
 
     def addEndRole(self, name, *, role=Roles.agent, eid=None, stamp=None):
         """Publish an endpoint-role authorization reply for an identifier.
@@ -248,18 +718,21 @@ class Identifiers:
         becomes available.
         """
         resolved_eid = self._resolveEndRoleEid(role=role, eid=eid)
-        hab = self.get(name)
-        pre = hab["prefix"]
+        hab = self.getCached(name)
+        rpy, sigs, body = self._buildEndRole(hab, role=role, eid=resolved_eid, stamp=stamp)
+
+        res = self.client.post(f"/identifiers/{name}/endroles", json=body)
+        return rpy, sigs, res.json()
 
-        rpy = self.makeEndRole(pre, role, resolved_eid, stamp)
+    def _buildEndRole(self, hab, *, role, eid, stamp=None):
+        """Build and sign an endpoint-role reply for ``hab`` without submitting it."""
+        rpy = self.makeEndRole(hab["prefix"], role, eid, stamp)
         keeper = self.client.manager.get(aid=hab)
         sigs = keeper.sign(ser=rpy.raw)
         rpy_msg = api.ReplyMessage(
             rpy=rpy.ked,
             sigs=sigs)
-
-        res = self.client.post(f"/identifiers/{name}/endroles", json=asdict(rpy_msg))
-        return rpy, sigs, res.json()
+        return rpy, sigs, asdict(rpy_msg)
 
     def _resolveEndRoleEid(self, *, role, eid):
         """Resolve the endpoint provider AID for endpoint-role authorization."""
@@ -284,21 +757,123 @@ class Identifiers:
         `/end/role/add` and `/loc/scheme` replies when a workflow needs a
         controller, agent, or witness OOBI to resolve into a usable endpoint.
         """
-        habState = self.get(name)
+        habState = self.getCached(name)
+        rpy, sigs, body = self._buildLocScheme(habState, url=url, eid=eid, scheme=scheme, stamp=stamp)
+
+        res = self.client.post(f"/identifiers/{name}/locschemes", json=body)
+        return rpy, sigs, res.json()
 
+    def _buildLocScheme(self, hab, *, url, eid=None, scheme=None, stamp=None):
+        """Build and sign a location-scheme reply for ``hab`` without submitting it."""
         rpy = self.makeLocScheme(url=url, eid=eid, scheme=scheme, stamp=stamp)
-        keeper = self.client.manager.get(aid=habState)
+        keeper = self.client.manager.get(aid=hab)
         sigs = keeper.sign(ser=rpy.raw)
         rpy_msg = api.ReplyMessage(
             rpy=rpy.ked,
             sigs=sigs)
+        return rpy, sigs, asdict(rpy_msg)
 
-        res = self.client.post(f"/identifiers/{name}/locschemes", json=asdict(rpy_msg))
-        return rpy, sigs, res.json()
+    def add_end_roles(self, specs, *, max_workers=8, wait=True, timeout=None):
+        """Publish endpoint-role authorizations for many identifiers, see :meth:`addEndRole`.
+
+        Parameters:
+            specs (Iterable[str | dict]): an alias, or a dict of :meth:`addEndRole` keyword arguments
+                including ``name``, per reply
+            max_workers (int): maximum number of replies signed and submitted concurrently
+            wait (bool): wait for every operation KERIA started to complete
+            timeout (float | None): seconds to wait for the operations, items still pending
+                afterwards fail with ``TimeoutError``
+
+        Returns:
+            ReplyPublishResult: one :class:`ReplyPublishItem` per spec in request order
+        """
+        def build(hab, role=Roles.agent, eid=None, stamp=None):
+            return self._buildEndRole(hab, role=role, eid=self._resolveEndRoleEid(role=role, eid=eid), stamp=stamp)
+
+        return self._publishReplies(specs, "endroles", build, max_workers=max_workers, wait=wait, timeout=timeout)
+
+    def add_loc_schemes(self, specs, *, max_workers=8, wait=True, timeout=None):
+        """Publish location-scheme replies for many identifiers, see :meth:`addLocScheme`.
+
+        Parameters:
+            specs (Iterable[dict]): :meth:`addLocScheme` keyword arguments including ``name`` and
+                ``url``, per reply
+            max_workers (int): maximum number of replies signed and submitted concurrently
+            wait (bool): wait for every operation KERIA started to complete
+            timeout (float | None): seconds to wait for the operations, items still pending
+                afterwards fail with ``TimeoutError``
+
+        Returns:
+            ReplyPublishResult: one :class:`ReplyPublishItem` per spec in request order
+        """
+        return self._publishReplies(specs, "locschemes", self._buildLocScheme, max_workers=max_workers, wait=wait,
+                                    timeout=timeout)
+
+    def _publishReplies(self, specs, path, build, *, max_workers, wait, timeout):
+        """Sign and submit many replies with bounded concurrency and wait on their operations together.
+
+        Each distinct identifier is read once through the habitat state cache
+        and its keeper comes from the manager's keeper cache, so only the
+        signatures are computed per reply. A failure of one reply never stops
+        the others.
+        """
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        names, specs = self._namedSpecs(specs)
+        items = [ReplyPublishItem(name) for name in names]
+        if not items:
+            return ReplyPublishResult([])
+
+        habs = dict()
+
+        def read(name):
+            try:
+                habs[name] = self.getCached(name)
+            except Exception as ex:
+                habs[name] = ex
+
+        def submit(item, spec):
+            try:
+                hab = habs[item.name]
+                if isinstance(hab, Exception):
+                    raise hab
+
+                item.rpy, item.sigs, body = build(hab, **spec)
+                item.op = self.client.post(f"/identifiers/{item.name}/{path}", json=body).json()
+            except Exception as ex:
+                item.error = ex
+
+        names = list(dict.fromkeys(item.name for item in items))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            list(pool.map(read, names))
+            list(pool.map(submit, items, specs))
+
+        submitted = dict()
+        for item in items:
+            if item.ok and isinstance(item.op, dict) and "name" in item.op and "done" in item.op:
+                submitted.setdefault(item.op["name"], []).append(item)
+
+        if wait and submitted:
+            waiter = self.client.operations().waiter([waiting[0].op for waiting in submitted.values()],
+                                                     timeout=timeout)
+            try:
+                for op in waiter:
+                    for item in submitted.pop(op["name"]):
+                        item.op = op
+                        if op.get("error") is not None:
+                            item.error = op["error"]
+            except TimeoutError as ex:
+                for name, waiting in submitted.items():
+                    for item in waiting:
+                        item.op = waiter.latest[name]
+                        item.error = ex
+
+        return ReplyPublishResult(items)
 
     def sign(self, name, ser):
         """Sign an already-built KERI event or reply with an identifier keeper."""
-        hab = self.get(name)
+        hab = self.getCached(name)
         keeper = self.client.manager.get(aid=hab)
         sigs = keeper.sign(ser=ser.raw)
 
@@ -329,3 +904,157 @@ class Identifiers:
             url=url,
         )
         return eventing.reply(route="/loc/scheme", data=data, stamp=stamp)
+
+
+class AnchorResult:
+    """Outcome of one coalesced interaction event as seen by a single caller.
+
+    Attributes:
+        serder: The shared interaction event serder.
+        sigs (list[str]): Signatures over ``serder`` from the local keeper.
+        op (dict): The shared operation returned by KERIA for ``serder``.
+        index (int): Position of the caller's first seal in ``serder.ked['a']``.
+    """
+
+    def __init__(self, serder, sigs, op, index):
+        self.serder = serder
+        self.sigs = sigs
+        self.op = op
+        self.index = index
+
+
+class AnchorCoalescer:
+    """Merge anchor requests for one identifier into shared interaction events.
+
+    Each :meth:`anchor` call queues its seals and returns a
+    :class:`concurrent.futures.Future` without waiting on KERIA. Seals queued
+    within ``window`` seconds of the first pending one, or until ``max_seals``
+    are pending, are emitted together as one ``ixn`` through
+    :meth:`Identifiers.interact` from a worker thread, and every caller's
+    future resolves to an :class:`AnchorResult` carrying the shared event and
+    operation. No event carries more than ``max_seals`` seals. A failed
+    submission fails every future in the batch.
+
+    Usage:
+        with client.identifiers().coalescer("aid1", window=0.05) as anchors:
+            futures = [anchors.anchor(seal) for seal in seals]
+        ops = [future.result().op for future in futures]
+    """
+
+    def __init__(self, identifiers, name, *, window=0.05, max_seals=32):
+        if window < 0:
+            raise ValueError(f"invalid window={window}, must not be negative")
+        if max_seals < 1:
+            raise ValueError(f"invalid max_seals={max_seals}, must be at least 1")
+
+        self.identifiers = identifiers
+        self.name = name
+        self.window = window
+        self.max_seals = max_seals
+
+        self._pending = []
+        self._count = 0
+        self._timer = None
+        self._closed = False
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def anchor(self, data):
+        """Queue seal ``data``, or a list of at most ``max_seals`` seals, for the next shared interaction event.
+
+        Returns:
+            Future: resolves to the :class:`AnchorResult` of the event carrying ``data``
+        """
+        seals = data if isinstance(data, list) else [data]
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot anchor after the coalescer is closed")
+
+            for batch in self._queue(seals, future):
+                self._dispatch(batch)
+
+            if self._pending and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        return future
+
+    def flush(self):
+        """Hand every pending seal to the worker now instead of waiting for the window to close."""
+        with self._lock:
+            self._dispatch(self._take())
+
+    def close(self):
+        """Flush pending seals, refuse further anchors and wait for every submission to finish."""
+        with self._lock:
+            self._closed = True
+            self._dispatch(self._take())
+            executor = self._executor
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _queue(self, seals, future):
+        """Queue one caller's seals and return the batches that are full. Call with the lock held.
+
+        A pending batch the new seals would push over ``max_seals`` is closed
+        first, so the seals of one caller always share one event.
+        """
+        if len(seals) > self.max_seals:
+            raise ValueError(f"cannot anchor {len(seals)} seals in one event, max_seals={self.max_seals}")
+
+        full = []
+        if self._count + len(seals) > self.max_seals:
+            full.append(self._take())
+
+        self._pending.append((seals, future))
+        self._count += len(seals)
+        if self._count >= self.max_seals:
+            full.append(self._take())
+
+        return full
+
+    def _dispatch(self, batch):
+        """Submit ``batch`` from the worker thread, batches go out in the order they were closed."""
+        if not batch:
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="signify-anchor-coalescer")
+        self._executor.submit(self._submit, batch)
+
+    def _take(self):
+        """Detach the pending batch and stop its window timer. Call with the lock held."""
+        batch, self._pending, self._count = self._pending, [], 0
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        return batch
+
+    def _submit(self, batch):
+        """Anchor every seal of ``batch`` in one interaction event and resolve the callers' futures."""
+        batch = [(seals, future) for seals, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        data = [seal for seals, _ in batch for seal in seals]
+        try:
+            serder, sigs, op = self.identifiers.interact(self.name, data=data)
+        except Exception as ex:
+            for _, future in batch:
+                future.set_exception(ex)
+            return
+
+        index = 0
+        for seals, future in batch:
+            future.set_result(AnchorResult(serder, sigs, op, index))
+            index += len(seals)
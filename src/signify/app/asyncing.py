@@ -0,0 +1,1575 @@
+# -*- encoding: utf-8 -*-
+"""Asyncio client and awaitable resource wrappers for SignifyPy.
+
+``AsyncSignifyClient`` mirrors :class:`signify.app.clienting.SignifyClient`
+on top of an ``httpx.AsyncClient`` so many agent calls can share one event
+loop instead of a thread pool. Boot, connect, Signify request signing and
+``Authenticater.verify`` response checks behave exactly as in the blocking
+client.
+
+The async resource wrappers subclass their blocking counterparts. Local
+event building, signing and payload helpers are inherited unchanged; only the
+methods that talk to KERIA are redefined as coroutines. Resource families not
+listed on :class:`AsyncSignifyClient` remain blocking-only.
+
+``httpx`` is an optional dependency, install it with ``signifypy[async]``.
+"""
+import asyncio
+import inspect
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+from urllib.parse import quote, urljoin, urlparse, urlsplit
+
+from keri import kering
+from keri.core.coring import Tiers
+from keri.help import helping
+from requests import HTTPError
+
+from signify.app.aiding import (AnchorCoalescer, AnchorResult, HabStateCache, IdentifierCreateItem,
+                                 IdentifierCreateResult, Identifiers, ReplyPublishItem, ReplyPublishResult)
+from signify.app.clienting import SignifyClient
+from signify.app.coring import KeyEvents, KeyStates, Oobis, OperationWaiter, Operations
+from signify.app.credentialing import (CredentialBatchResult, CredentialIssueResult, CredentialRevokeResult,
+                                       Credentials, Ipex)
+from signify.app.notifying import Notifications
+from signify.app.schemas import Schemas
+from signify.core import api, authing, httping, keeping
+from signify.core.caching import verifyExchange, verifySchema
+from signify.peer.exchanging import ExchangeSendError, Exchanges
+from signify.signifying import SignifyState
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    httpx = None
+
+
+class AsyncSignifyClient:
+    """Asyncio edge-signing client bound to one controller AID and delegated agent."""
+
+    def __init__(self, passcode, url=None, boot_url=None, tier=Tiers.low, extern_modules=None, transport=None,
+                 limits=None, said_cache=None, key_state_cache=None):
+        """Create a new AsyncSignifyClient.
+
+        Parameters:
+            passcode (str | bytes): 21 character passphrase for the local controller
+            url (str): admin interface URL of the KERIA instance to connect to
+            boot_url (str): boot interface URL of the KERIA instance used for initial boot
+            tier (Tiers): tier of the controller (low, med, high)
+            extern_modules (dict): external key management modules such as for Google KMS, Trezor, etc.
+            transport (httpx.AsyncBaseTransport): optional transport, mainly for tests
+            limits (httpx.Limits): optional connection pool limits for the shared session
+            said_cache (SaidCache): cache for schemas and exn messages fetched by SAID, None disables it
+            key_state_cache (KeyStateCache): cache for key states read through keyStates(), None disables it
+        """
+        if httpx is None:
+            raise kering.ConfigurationError("AsyncSignifyClient requires httpx, install signifypy[async]")
+
+        if len(passcode) < 21:
+            raise kering.ConfigurationError(f"bran of length {len(passcode)} is too short, must be 21 characters")
+
+        self.bran = passcode
+        self.pidx = 0
+        self.tier = tier
+        self.extern_modules = extern_modules
+        self.transport = transport
+        self.limits = limits
+        self.said_cache = said_cache
+        self.key_state_cache = key_state_cache
+
+        self.mgr = None
+        self.session = None
+        self.agent = None
+        self.authn = None
+        self.base = None
+        self.resolved_oobis = set()
+        self.hab_cache = None
+        self.sequencer = None
+        self._booted_agent = None
+        self._released = set()
+        self._pidx_lock = asyncio.Lock()
+
+        self.ctrl = authing.Controller(bran=self.bran, tier=self.tier)
+        self.url = url
+        self.boot_url = boot_url
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self.session is not None:
+            await self.session.aclose()
+            self.session = None
+
+    def _session(self):
+        kwargs = dict()
+        if self.transport is not None:
+            kwargs["transport"] = self.transport
+        if self.limits is not None:
+            kwargs["limits"] = self.limits
+        return httpx.AsyncClient(**kwargs)
+
+    async def boot(self) -> dict:
+        """Create the remote cloud agent delegated to this controller AID."""
+        evt, siger = self.ctrl.event()
+        agent_boot = api.AgentBoot(
+            icp=evt.ked,
+            sig=siger.qb64,
+            stem=self.ctrl.stem,
+            pidx=1,
+            tier=self.ctrl.tier
+        )
+        async with self._session() as session:
+            res = await session.post(f"{self.boot_url}/boot", json=asdict(agent_boot))
+
+        if res.status_code != 202:
+            raise kering.AuthNError(f"unable to initialize cloud agent connection, {res.status_code}, {res.text}")
+        try:
+            body = res.json()
+        except ValueError as ex:
+            raise kering.AuthNError(f"invalid response from server: {ex}") from ex
+
+        try:
+            self._booted_agent = authing.Agent(state=body)
+        except (KeyError, kering.ValidationError) as ex:
+            raise kering.AuthNError(f"invalid agent state from boot response: {ex}") from ex
+        return body
+
+    async def connect(self, url=None):
+        """Connect to KERIA, restore state, and finish first-connect delegation."""
+        url = self.url if url is None else url
+        up = urlparse(url)
+        if up.scheme not in kering.Schemes:
+            raise kering.ConfigurationError(f"invalid scheme {up.scheme} for AsyncSignifyClient")
+
+        self.base = url
+
+        if self.session is not None:
+            await self.session.aclose()
+        self.session = self._session()
+        self.hab_cache = None
+        state = await self.states()
+        self.pidx = state.pidx
+        self._released.clear()
+
+        self.agent = authing.Agent(state=state.agent)
+        self.ctrl.rebind(state.controller)
+        self.mgr = keeping.Manager(salter=self.ctrl.salter, extern_modules=self.extern_modules)
+
+        if self.agent.delpre != self.ctrl.pre:
+            raise kering.ConfigurationError("commitment to controller AID missing in agent inception event")
+
+        if self.ctrl.serder.sn == 0:
+            if self._booted_agent is not None and (self.agent.pre != self._booted_agent.pre or
+                                                   self.agent.said != self._booted_agent.said):
+                raise kering.ConfigurationError("booted agent does not match connected agent state")
+            await self.approveDelegation()
+            self._booted_agent = None
+
+        self.authn = authing.Authenticater(agent=self.agent, ctrl=self.ctrl)
+        self.session.auth = AsyncSignifyAuth(self.authn)
+        self.session.event_hooks = dict(response=[self._verify])
+
+    async def _verify(self, rep):
+        """Verify the agent signature on every authenticated response."""
+        self.authn.verify(rep)
+
+    async def approveDelegation(self):
+        """Approve the controller-to-agent delegation with a signed ixn event."""
+        serder, sigs = self.ctrl.approveDelegation(self.agent)
+        data = dict(ixn=serder.ked, sigs=sigs)
+        await self.put(path=f"/agent/{self.controller}?type=ixn", json=data)
+
+    async def rotate(self, nbran, aids):
+        """Rotate the controller commitment and persist the new agent binding."""
+        data = self.ctrl.rotate(nbran=nbran, aids=aids)
+        await self.put(path=f"/agent/{self.controller}", json=data)
+        if self.mgr is not None:
+            self.mgr.invalidate()
+
+    async def reservePidx(self, count=1):
+        """Reserve ``count`` consecutive salty key indexes, see :meth:`SignifyClient.reservePidx`.
+
+        Returns:
+            int: the first reserved index, the block is ``[pidx, pidx + count)``
+        """
+        if count < 1:
+            raise ValueError(f"invalid count={count}, must be at least 1")
+
+        async with self._pidx_lock:
+            if count == 1 and self._released:
+                pidx = min(self._released)
+                self._released.remove(pidx)
+                return pidx
+
+            pidx = self.pidx
+            self.pidx = pidx + count
+
+        return pidx
+
+    async def releasePidx(self, pidx, count=1):
+        """Return unused salty key indexes for reuse, see :meth:`SignifyClient.releasePidx`."""
+        async with self._pidx_lock:
+            self._released.update(range(pidx, pidx + count))
+            while self.pidx - 1 in self._released:
+                self.pidx -= 1
+                self._released.remove(self.pidx)
+
+    @property
+    def controller(self):
+        """Return the controller AID prefix."""
+        return self.ctrl.pre
+
+    @property
+    def icp(self):
+        """Return the controller inception serder."""
+        return self.ctrl.serder
+
+    @property
+    def salter(self):
+        """Return the controller salter used by the local key manager."""
+        return self.ctrl.salter
+
+    @property
+    def manager(self):
+        """Return the active local key manager."""
+        return self.mgr
+
+    async def states(self):
+        """Fetch the current controller/agent state bundle from KERIA."""
+        caid = self.ctrl.pre
+        res = await self.session.get(urljoin(self.base, f"/agent/{caid}"))
+        if res.status_code == 404:
+            raise kering.ConfigurationError(f"agent does not exist for controller {caid}")
+
+        data = res.json()
+        state = SignifyState()
+        state.controller = data["controller"]
+        state.agent = data["agent"]
+        state.pidx = data["pidx"] if "pidx" in data else 0
+
+        return state
+
+    async def _request(self, method, path, *, params=None, headers=None, json=None):
+        """Issue an authenticated HTTP request relative to the client base URL."""
+        url = urljoin(self.base, path)
+        res = await self.session.request(method, url, params=params, headers=headers, json=json)
+        if not res.is_success:
+            SignifyClient.raiseForStatus(res)
+
+        return res
+
+    async def get(self, path, params=None, headers=None, body=None):
+        """Issue an authenticated ``GET`` request relative to the client base URL."""
+        return await self._request("GET", path, params=params, headers=headers, json=body)
+
+    async def delete(self, path, params=None, headers=None, body=None):
+        """Issue an authenticated ``DELETE`` request relative to the client base URL."""
+        return await self._request("DELETE", path, params=params, headers=headers, json=body)
+
+    async def post(self, path, json, params=None, headers=None):
+        """Issue an authenticated ``POST`` request relative to the client base URL."""
+        return await self._request("POST", path, params=params, headers=headers, json=json)
+
+    async def put(self, path, json, params=None, headers=None):
+        """Issue an authenticated ``PUT`` request relative to the client base URL."""
+        return await self._request("PUT", path, params=params, headers=headers, json=json)
+
+    def identifiers(self):
+        """Return the awaitable identifier lifecycle resource wrapper."""
+        if self.hab_cache is None:
+            self.hab_cache = HabStateCache()
+        if self.sequencer is None:
+            self.sequencer = AsyncEventSequencer()
+        return AsyncIdentifiers(client=self, cache=self.hab_cache, sequencer=self.sequencer)
+
+    def operations(self):
+        """Return the awaitable long-running operation resource wrapper."""
+        return AsyncOperations(client=self)
+
+    def oobis(self):
+        """Return the awaitable OOBI resolution and retrieval resource wrapper."""
+        return AsyncOobis(client=self)
+
+    def keyStates(self):
+        """Return the awaitable key-state read and query resource wrapper."""
+        return AsyncKeyStates(client=self, cache=self.key_state_cache)
+
+    def keyEvents(self):
+        """Return the awaitable key-event read resource wrapper."""
+        return AsyncKeyEvents(client=self)
+
+    def notifications(self):
+        """Return the awaitable notifications resource wrapper."""
+        return AsyncNotifications(client=self)
+
+    def credentials(self):
+        """Return the awaitable credential query and issuance resource wrapper."""
+        return AsyncCredentials(client=self)
+
+    def ipex(self):
+        """Return the awaitable IPEX grant/admit resource wrapper."""
+        return AsyncIpex(client=self)
+
+    def exchanges(self):
+        """Return the awaitable exchange transport resource wrapper."""
+        return AsyncExchanges(client=self, cache=self.said_cache)
+
+    def schemas(self):
+        """Return the awaitable schema read resource wrapper."""
+        return AsyncSchemas(client=self, cache=self.said_cache)
+
+
+if httpx is not None:
+    class AsyncSignifyAuth(httpx.Auth):
+        """httpx auth flow that signs outbound Signify HTTP requests."""
+
+        def __init__(self, authn):
+            """Create an auth flow around a Signify ``Authenticater``."""
+            self.authn = authn
+
+        def auth_flow(self, request):
+            """Attach Signify headers and signatures to an outbound request."""
+            headers = request.headers
+            headers['Signify-Resource'] = self.authn.ctrl.pre
+            headers['Signify-Timestamp'] = helping.nowIso8601()
+
+            if "Content-Length" not in headers and request.content:
+                headers["Content-Length"] = str(len(request.content))
+
+            p = urlsplit(str(request.url))
+            path = p.path if p.path else "/"
+            self.authn.sign(headers, request.method, quote(path))
+            yield request
+
+
+class AsyncIdentifiers(Identifiers):
+    """Awaitable identifier lifecycle resource wrapper.
+
+    :meth:`sequence` returns an async context manager, held with
+    ``async with``. ``advance`` and ``invalidate`` only touch the local
+    habitat state cache and stay synchronous.
+    """
+
+    async def list(self, start=0, end=24):
+        """List identifiers visible to the current agent within a range window."""
+        headers = dict(Range=f"aids={start}-{end}")
+        res = await self.client.get("/identifiers", headers=headers)
+
+        cr = res.headers["content-range"]
+        start, end, total = httping.parseRangeHeader(cr, "aids")
+
+        return dict(start=start, end=end, total=total, aids=res.json())
+
+    async def iter_all(self, page_size=25, prefetch=4):
+        """Asynchronously yield every identifier record in order, fetching up to ``prefetch`` windows ahead."""
+        if page_size < 1:
+            raise ValueError(f"invalid page_size={page_size}, must be at least 1")
+        if prefetch < 1:
+            raise ValueError(f"invalid prefetch={prefetch}, must be at least 1")
+
+        first = await self.list(start=0, end=page_size - 1)
+        for aid in first["aids"]:
+            yield aid
+
+        step = len(first["aids"])
+        if not step or step >= first["total"]:
+            return
+
+        starts = iter(range(step, first["total"], step))
+        pending = []
+        try:
+            for start in starts:
+                pending.append(asyncio.ensure_future(self.list(start=start, end=start + step - 1)))
+                if len(pending) >= prefetch:
+                    break
+
+            while pending:
+                page = await pending.pop(0)
+                start = next(starts, None)
+                if start is not None:
+                    pending.append(asyncio.ensure_future(self.list(start=start, end=start + step - 1)))
+                for aid in page["aids"]:
+                    yield aid
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get(self, name):
+        """Return the stored habitat state for one identifier by name and refresh the habitat state cache."""
+        res = await self.client.get(f"/identifiers/{name}")
+        hab = res.json()
+        if self.cache is not None:
+            self.cache.put(hab)
+
+        return hab
+
+    async def getCached(self, name):
+        """Return habitat state for ``name`` from the habitat state cache, reading KERIA on a miss."""
+        if self.cache is not None:
+            hab = self.cache.get(name)
+            if hab is not None:
+                return hab
+
+        return await self.get(name)
+
+    @asynccontextmanager
+    async def sequence(self, name):
+        """Hold the event sequence for the identifier ``name`` resolves to."""
+        if self.sequencer is None:
+            yield
+            return
+
+        async with self.sequencer.resolving(name):
+            pre = (await self.getCached(name))["prefix"]
+
+        async with self.sequencer.hold(pre):
+            yield
+
+    async def postEvent(self, name, path, body, serder):
+        """Post an event for ``name`` and keep the cached state in step with the outcome."""
+        try:
+            res = await self.client.post(path, json=body)
+        except Exception:
+            self.invalidate(name)
+            raise
+
+        self.advance(name, serder)
+        return res
+
+    async def rename(self, name, newName):
+        """Rename an identifier alias without changing its underlying AID."""
+        return await self.update(name, {"name": newName})
+
+    async def update(self, name, info=None, typ=None, **kwas):
+        """Update identifier metadata or dispatch an interaction/rotation flow."""
+        if isinstance(info, dict) and typ is None:
+            self.invalidate(name)
+            res = await self.client.put(f"/identifiers/{name}", json=info)
+            return res.json()
+
+        if typ is None:
+            typ = info
+
+        if typ == "interact":
+            return await self.interact(name, **kwas)
+        elif typ == "rotate":
+            return await self.rotate(name, **kwas)
+        else:
+            raise kering.KeriError(f"{typ} invalid identifier update type, only 'rotate' or 'interact' allowed")
+
+    async def create(self, name, **kwargs):
+        """Create and submit an identifier inception request.
+
+        Accepts the same keyword arguments as :meth:`Identifiers.create`.
+        """
+        pidx = await self.client.reservePidx()
+        try:
+            serder, sigs, body = self._buildInception(name, pidx, **kwargs)
+        except Exception:
+            await self.client.releasePidx(pidx)
+            raise
+
+        res = await self._postInception(pidx, body)
+        return serder, sigs, res.json()
+
+    async def create_many(self, specs, *, max_workers=8, wait=True, timeout=None):
+        """Create many identifiers concurrently, see :meth:`Identifiers.create_many`.
+
+        Key derivation and signing run in worker threads so they do not block
+        the event loop.
+        """
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        names, specs = self._namedSpecs(specs)
+        if not specs:
+            return IdentifierCreateResult([])
+
+        start = await self.client.reservePidx(len(specs))
+        try:
+            items = [IdentifierCreateItem(name, start + offset) for offset, name in enumerate(names)]
+            limit = asyncio.Semaphore(max_workers)
+        except Exception:
+            await self.client.releasePidx(start, len(specs))
+            raise
+
+        async def submit(item, spec):
+            async with limit:
+                try:
+                    item.serder, item.sigs, body = await asyncio.to_thread(self._buildInception, item.name,
+                                                                           item.pidx, **spec)
+                except Exception as ex:
+                    item.error = ex
+                    await self.client.releasePidx(item.pidx)
+                    return
+
+                try:
+                    item.op = (await self._postInception(item.pidx, body)).json()
+                except Exception as ex:
+                    item.error = ex
+
+        await asyncio.gather(*[submit(item, spec) for item, spec in zip(items, specs)])
+
+        submitted = {item.op["name"]: item for item in items if item.ok}
+        if wait and submitted:
+            waiter = self.client.operations().waiter([item.op for item in submitted.values()], timeout=timeout)
+            try:
+                async for op in waiter:
+                    item = submitted.pop(op["name"])
+                    item.op = op
+                    if op.get("error") is not None:
+                        item.error = op["error"]
+            except TimeoutError as ex:
+                for name, item in submitted.items():
+                    item.op = waiter.latest[name]
+                    item.error = ex
+
+        return IdentifierCreateResult(items)
+
+    async def _postInception(self, pidx, body):
+        """Submit an inception request body, releasing ``pidx`` when KERIA rejects it."""
+        try:
+            return await self.client.post("/identifiers", json=body)
+        except HTTPError as ex:
+            if ex.response is not None and 400 <= ex.response.status_code < 500:
+                await self.client.releasePidx(pidx)
+            raise
+
+    async def delete(self, name):
+        """Delete an identifier by alias from the remote agent."""
+        self.invalidate(name)
+        await self.client.delete(f"/identifiers/{name}")
+
+    async def interact(self, name, data=None):
+        """Create and submit a signed interaction event for an identifier."""
+        async with self.sequence(name):
+            serder, sigs, body = await self.createInteract(name, data=data)
+            res = await self.postEvent(name, f"/identifiers/{name}/events", body, serder)
+
+        return serder, sigs, res.json()
+
+    def coalescer(self, name, **kwargs):
+        """Return an :class:`AsyncAnchorCoalescer` that batches seals for ``name`` into shared interaction events."""
+        return AsyncAnchorCoalescer(self, name, **kwargs)
+
+    async def createInteract(self, name, data=None):
+        """Create the local interaction event payload without submitting it."""
+        hab = await self.getCached(name)
+        return self._buildInteract(hab, data=data)
+
+    async def rotate(self, name, **kwargs):
+        """Create and submit a rotation event for an identifier or group.
+
+        Accepts the same keyword arguments as :meth:`Identifiers.rotate`.
+        """
+        async with self.sequence(name):
+            hab = await self.getCached(name)
+            serder, sigs, body = self._buildRotate(hab, **kwargs)
+            res = await self.postEvent(name, f"/identifiers/{name}/events", body, serder)
+
+        return serder, sigs, res.json()
+
+    async def addEndRole(self, name, *, role=kering.Roles.agent, eid=None, stamp=None):
+        """Publish an endpoint-role authorization reply for an identifier."""
+        resolved_eid = self._resolveEndRoleEid(role=role, eid=eid)
+        hab = await self.getCached(name)
+        rpy, sigs, body = self._buildEndRole(hab, role=role, eid=resolved_eid, stamp=stamp)
+
+        res = await self.client.post(f"/identifiers/{name}/endroles", json=body)
+        return rpy, sigs, res.json()
+
+    async def addLocScheme(self, name, url, *, eid=None, scheme=None, stamp=None):
+        """Publish a location-scheme reply for an identifier-scoped endpoint."""
+        hab = await self.getCached(name)
+        rpy, sigs, body = self._buildLocScheme(hab, url=url, eid=eid, scheme=scheme, stamp=stamp)
+
+        res = await self.client.post(f"/identifiers/{name}/locschemes", json=body)
+        return rpy, sigs, res.json()
+
+    async def add_end_roles(self, specs, *, max_workers=8, wait=True, timeout=None):
+        """Publish endpoint-role authorizations for many identifiers, see :meth:`Identifiers.add_end_roles`."""
+        def build(hab, role=kering.Roles.agent, eid=None, stamp=None):
+            return self._buildEndRole(hab, role=role, eid=self._resolveEndRoleEid(role=role, eid=eid), stamp=stamp)
+
+        return await self._publishReplies(specs, "endroles", build, max_workers=max_workers, wait=wait,
+                                          timeout=timeout)
+
+    async def add_loc_schemes(self, specs, *, max_workers=8, wait=True, timeout=None):
+        """Publish location-scheme replies for many identifiers, see :meth:`Identifiers.add_loc_schemes`."""
+        return await self._publishReplies(specs, "locschemes", self._buildLocScheme, max_workers=max_workers,
+                                          wait=wait, timeout=timeout)
+
+    async def _publishReplies(self, specs, path, build, *, max_workers, wait, timeout):
+        """Sign and submit many replies with bounded concurrency and await their operations together."""
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        names, specs = self._namedSpecs(specs)
+        items = [ReplyPublishItem(name) for name in names]
+        if not items:
+            return ReplyPublishResult([])
+
+        habs = dict()
+        limit = asyncio.Semaphore(max_workers)
+
+        async def read(name):
+            async with limit:
+                try:
+                    habs[name] = await self.getCached(name)
+                except Exception as ex:
+                    habs[name] = ex
+
+        async def submit(item, spec):
+            async with limit:
+                try:
+                    hab = habs[item.name]
+                    if isinstance(hab, Exception):
+                        raise hab
+
+                    item.rpy, item.sigs, body = build(hab, **spec)
+                    item.op = (await self.client.post(f"/identifiers/{item.name}/{path}", json=body)).json()
+                except Exception as ex:
+                    item.error = ex
+
+        await asyncio.gather(*[read(name) for name in dict.fromkeys(item.name for item in items)])
+        await asyncio.gather(*[submit(item, spec) for item, spec in zip(items, specs)])
+
+        submitted = dict()
+        for item in items:
+            if item.ok and isinstance(item.op, dict) and "name" in item.op and "done" in item.op:
+                submitted.setdefault(item.op["name"], []).append(item)
+
+        if wait and submitted:
+            waiter = self.client.operations().waiter([waiting[0].op for waiting in submitted.values()],
+                                                     timeout=timeout)
+            try:
+                async for op in waiter:
+                    for item in submitted.pop(op["name"]):
+                        item.op = op
+                        if op.get("error") is not None:
+                            item.error = op["error"]
+            except TimeoutError as ex:
+                for name, waiting in submitted.items():
+                    for item in waiting:
+                        item.op = waiter.latest[name]
+                        item.error = ex
+
+        return ReplyPublishResult(items)
+
+    async def sign(self, name, ser):
+        """Sign an already-built KERI event or reply with an identifier keeper."""
+        hab = await self.getCached(name)
+        keeper = self.client.manager.get(aid=hab)
+        return keeper.sign(ser=ser.raw)
+
+    async def members(self, name):
+        """Return multisig member state for a group identifier."""
+        res = await self.client.get(f"/identifiers/{name}/members")
+        return res.json()
+
+
+class AsyncEventSequencer:
+    """Serialize key event construction and submission per identifier on one event loop.
+
+    Awaitable counterpart of :class:`~signify.app.aiding.EventSequencer`,
+    keyed by AID prefix. The per-identifier ``asyncio.Lock`` is not
+    reentrant, so a task holding the sequence for an identifier must not
+    enter it again.
+    """
+
+    def __init__(self):
+        self._locks = dict()
+        self._names = dict()
+
+    def hold(self, pre):
+        """Return the lock serializing events for the identifier with prefix ``pre``."""
+        return self._get(self._locks, pre)
+
+    def resolving(self, name):
+        """Return the lock held while alias ``name`` is resolved to its prefix."""
+        return self._get(self._names, name)
+
+    @staticmethod
+    def _get(locks, key):
+        lock = locks.get(key)
+        if lock is None:
+            lock = locks[key] = asyncio.Lock()
+
+        return lock
+
+
+class AsyncAnchorCoalescer(AnchorCoalescer):
+    """Merge anchor requests for one identifier into shared interaction events on the running event loop.
+
+    Awaitable counterpart of :class:`~signify.app.aiding.AnchorCoalescer`,
+    :meth:`anchor` returns an ``asyncio.Future`` and every batch is submitted
+    through :meth:`AsyncIdentifiers.interact` from its own task.
+
+    Usage:
+        async with client.identifiers().coalescer("aid1", window=0.05) as anchors:
+            futures = [anchors.anchor(seal) for seal in seals]
+        ops = [(await future).op for future in futures]
+    """
+
+    def __init__(self, identifiers, name, *, window=0.05, max_seals=32):
+        super().__init__(identifiers, name, window=window, max_seals=max_seals)
+        self._tasks = set()
+
+    def __enter__(self):
+        raise TypeError("AsyncAnchorCoalescer is entered with async with")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def anchor(self, data):
+        """Queue seal ``data``, or a list of seals, for the next shared interaction event.
+
+        Returns:
+            asyncio.Future: resolves to the :class:`AnchorResult` of the event carrying ``data``
+        """
+        if self._closed:
+            raise RuntimeError("cannot anchor after the coalescer is closed")
+
+        seals = data if isinstance(data, list) else [data]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        for batch in self._queue(seals, future):
+            self._dispatch(batch)
+
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+
+        return future
+
+    def flush(self):
+        """Start submitting every pending seal now instead of waiting for the window to close."""
+        self._dispatch(self._take())
+
+    async def close(self):
+        """Flush pending seals, refuse further anchors and wait for every submission to finish."""
+        self._closed = True
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _dispatch(self, batch):
+        """Submit ``batch`` from its own task on the running event loop."""
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._submit(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _submit(self, batch):
+        """Anchor every seal of ``batch`` in one interaction event and resolve the callers' futures."""
+        batch = [(seals, future) for seals, future in batch if not future.cancelled()]
+        if not batch:
+            return
+
+        data = [seal for seals, _ in batch for seal in seals]
+        try:
+            serder, sigs, op = await self.identifiers.interact(self.name, data=data)
+        except Exception as ex:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        index = 0
+        for seals, future in batch:
+            if not future.done():
+                future.set_result(AnchorResult(serder, sigs, op, index))
+            index += len(seals)
+
+
+class AsyncOperations(Operations):
+    """Awaitable long-running operation resource wrapper."""
+
+    async def get(self, name):
+        """Fetch one long-running operation by operation name."""
+        res = await self.client.get(f"/operations/{name}")
+        return res.json()
+
+    async def list(self, type=None):
+        """List long-running operations, optionally filtered by operation type."""
+        params = {}
+        if type is not None:
+            params["type"] = type
+
+        res = await self.client.get("/operations", params=params or None)
+        return res.json()
+
+    async def delete(self, name):
+        """Delete one long-running operation by operation name."""
+        await self.client.delete(f"/operations/{name}")
+
+    def waiter(self, ops, **kwargs):
+        """Return an :class:`AsyncOperationWaiter` that awaits ``ops`` on one shared polling schedule."""
+        return AsyncOperationWaiter(self, ops, **kwargs)
+
+    async def wait(self, op, *, timeout=None, interval=0.01, max_interval=10.0, backoff=2.0, check_abort=None,
+                   _deadline=None):
+        """Poll an operation until it completes without blocking the event loop.
+
+        Parameters match :meth:`Operations.wait`, except that the TS-style
+        ``options`` dictionary is not supported.
+        """
+        deadline = _deadline
+        if deadline is None and timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        depends = self._depends(op)
+        if depends is not None and depends.get("done") is False:
+            await self.wait(depends, interval=interval, max_interval=max_interval, backoff=backoff,
+                            check_abort=check_abort, _deadline=deadline)
+
+        if op.get("done") is True:
+            return op
+
+        retries = 0
+
+        while True:
+            op = await self.get(op["name"])
+
+            if op.get("done") is True:
+                return op
+
+            self._raise_if_timed_out(deadline, op)
+            self._check_abort(check_abort, op)
+
+            delay = min(max_interval, interval * (backoff ** retries))
+            retries += 1
+
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+                self._raise_if_timed_out(deadline, op)
+
+            await asyncio.sleep(delay)
+
+
+class AsyncOperationWaiter(OperationWaiter):
+    """Await many long-running operations on one shared polling schedule.
+
+    Awaitable counterpart of :class:`~signify.app.coring.OperationWaiter`,
+    completed operations are yielded in completion order by ``async for``
+    over the waiter or over :meth:`as_completed`.
+    """
+
+    def __iter__(self):
+        raise TypeError("AsyncOperationWaiter is iterated with async for")
+
+    def __aiter__(self):
+        return self.as_completed()
+
+    async def _refresh(self):
+        """Fetch fresh state for every unfinished tracked operation."""
+        for typ, names in self._stale().items():
+            if typ is not None and len(names) >= self.list_threshold:
+                listed = {op["name"]: op for op in await self.operations.list(type=typ)}
+                for name in names:
+                    if name in listed:
+                        self._track(listed.pop(name))
+                    else:
+                        self._track(await self.operations.get(name))
+            else:
+                for name in names:
+                    self._track(await self.operations.get(name))
+
+    async def as_completed(self):
+        """Yield operations as they complete, raising ``TimeoutError`` when the timeout expires."""
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        retries = 0
+
+        while True:
+            for op in self._harvest():
+                yield op
+            if not self.pending:
+                return
+
+            if retries:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"timed out waiting for operations {sorted(self.pending)}")
+
+                delay = min(self.max_interval, self.interval * (self.backoff ** (retries - 1)))
+                if deadline is not None:
+                    delay = max(0, min(delay, deadline - time.monotonic()))
+                await asyncio.sleep(delay)
+
+            retries += 1
+            await self._refresh()
+
+    async def wait(self):
+        """Wait until every operation completes and return them in completion order."""
+        return [op async for op in self.as_completed()]
+
+
+class AsyncOobis(Oobis):
+    """Awaitable OOBI resolution and retrieval resource wrapper."""
+
+    async def get(self, name, role="agent"):
+        """Return role-specific OOBIs published for one identifier alias."""
+        res = await self.client.get(f"/identifiers/{name}/oobis?role={role}")
+        return res.json()
+
+    async def resolve(self, oobi, alias=None):
+        """Submit an OOBI for resolution, optionally storing it under an alias."""
+        body = dict(url=oobi)
+        if alias is not None:
+            body["oobialias"] = alias
+
+        res = await self.client.post("/oobis", json=body)
+        return res.json()
+
+    async def resolve_many(self, oobis, *, concurrency=8, timeout=None, force=False):
+        """Resolve many OOBIs concurrently, see :meth:`Oobis.resolve_many`."""
+        if concurrency < 1:
+            raise ValueError(f"invalid concurrency={concurrency}, must be at least 1")
+
+        items, pending = self._dedupe(oobis, force)
+        limit = asyncio.Semaphore(concurrency)
+        operations = self.client.operations()
+
+        async def one(item):
+            try:
+                async with limit:
+                    item.started = time.monotonic()
+                    item.op = await self.resolve(item.url, alias=item.alias)
+                self._finish(item, await operations.wait(item.op, timeout=timeout))
+            except Exception as ex:
+                item.error = ex
+
+        await asyncio.gather(*[one(item) for item in pending.values()])
+        return self._result(items, pending)
+
+
+class AsyncKeyStates(KeyStates):
+    """Awaitable key-state read and query resource wrapper."""
+
+    async def get(self, pre):
+        """Fetch the current key state for one AID prefix."""
+        if self.cache is not None and (state := self.cache.get(pre)) is not None:
+            return [state]
+
+        res = await self.client.get(f"/states?pre={pre}")
+        return self._remember(res.json())
+
+    async def list(self, pres, chunk=40, max_workers=4):
+        """Fetch key states for multiple prefixes in concurrent chunks, ordered like ``pres``."""
+        pres = list(dict.fromkeys(pres))
+        if self.cache is None:
+            return await self._fetch(pres, chunk, max_workers)
+
+        cached, missing = self._cached(pres)
+        if missing:
+            cached.update((state["i"], state)
+                          for state in self._remember(await self._fetch(missing, chunk, max_workers)))
+
+        return [cached[pre] for pre in pres if pre in cached]
+
+    async def refresh(self, pres, chunk=40, max_workers=4):
+        """Refetch key states for ``pres`` into the cache and return the changed ``(old, new)`` pairs."""
+        if self.cache is None:
+            raise ValueError("refreshing key states requires a key-state cache")
+
+        return self._replace(await self._fetch(list(dict.fromkeys(pres)), chunk, max_workers))
+
+    def watch(self, callback, pres=None, interval=10.0):
+        """Start and return an :class:`AsyncKeyStateWatcher` refreshing the cache on the running event loop."""
+        if self.cache is None:
+            raise ValueError("refreshing key states requires a key-state cache")
+
+        return AsyncKeyStateWatcher(self, callback, pres=pres, interval=interval).start()
+
+    async def _fetch(self, pres, chunk=40, max_workers=4):
+        limit = asyncio.Semaphore(max(1, max_workers))
+
+        async def one(part):
+            async with limit:
+                return await self._fetchChunk(part)
+
+        pages = await asyncio.gather(*[one(pres[i:i + chunk]) for i in range(0, len(pres), chunk)])
+        return self._merge(pres, pages)
+
+    async def _fetchChunk(self, pres):
+        args = "&".join([f"pre={pre}" for pre in pres])
+        res = await self.client.get(f"/states?{args}")
+        return res.json()
+
+    async def query(self, pre, sn=None, anchor=None):
+        """Submit a key-state query with optional sequence or anchor hints."""
+        body = dict(pre=pre)
+        if sn is not None:
+            body["sn"] = sn
+        if anchor is not None:
+            body["anchor"] = anchor
+
+        res = await self.client.post("/queries", json=body)
+        return res.json()
+
+
+class AsyncKeyStateWatcher:
+    """Keep cached key states fresh from an asyncio task, see :class:`~signify.app.coring.KeyStateWatcher`.
+
+    ``callback(old, new)`` may be a plain function or a coroutine function.
+    Refresh and callback errors are kept in ``error`` and do not stop the
+    watcher.
+    """
+
+    def __init__(self, states, callback, pres=None, interval=10.0):
+        """Create a watcher over a cached awaitable key-state resource.
+
+        Parameters:
+            states (AsyncKeyStates): key-state resource with a cache
+            callback (Callable): called as ``callback(old, new)`` for every changed key state
+            pres (list | None): prefixes to watch, None watches every cached prefix
+            interval (float): seconds between refresh rounds
+        """
+        self.states = states
+        self.callback = callback
+        self.pres = pres
+        self.interval = interval
+        self.error = None
+
+        self._task = None
+
+    async def __aenter__(self):
+        return self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def start(self):
+        """Start refreshing in a task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+        return self
+
+    async def close(self):
+        """Cancel the refresh task and wait for it to end."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            pres = self.pres if self.pres is not None else self.states.cache.prefixes()
+            try:
+                changes = await self.states.refresh(pres)
+            except Exception as ex:
+                self.error = ex
+                continue
+
+            for old, new in changes:
+                try:
+                    result = self.callback(old, new)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as ex:
+                    self.error = ex
+
+
+class AsyncKeyEvents(KeyEvents):
+    """Awaitable key-event read resource wrapper."""
+
+    async def get(self, pre):
+        """Fetch KERI events for one AID prefix."""
+        res = await self.client.get(f"/events?pre={pre}")
+        return res.json()
+
+    async def verify(self, pre, verifier):
+        """Fetch the KEL of ``pre`` and of its delegation chain and verify them off the event loop."""
+        kels = dict()
+        delpre = pre
+        while delpre and delpre not in kels:
+            kels[delpre] = await self.get(delpre)
+            delpre = kels[delpre][0]["ked"].get("di") if kels[delpre] else None
+
+        return await asyncio.to_thread(verifier.verify, pre, kels.pop(pre), delegators=kels)
+
+
+class AsyncNotifications(Notifications):
+    """Awaitable notifications resource wrapper."""
+
+    async def list(self, start=0, end=24):
+        """List notifications visible to the current agent."""
+        headers = dict(Range=f"notes={start}-{end}")
+        res = await self.client.get("/notifications", headers=headers)
+        cr = res.headers["content-range"]
+        start, end, total = httping.parseRangeHeader(cr, "notes")
+
+        return dict(start=start, end=end, total=total, notes=res.json())
+
+    async def mark(self, said):
+        """Mark one notification as read."""
+        res = await self.client.put(f"/notifications/{said}", json={})
+        return res.status_code == 202
+
+    async def markAsRead(self, nid):
+        """Compatibility alias for :meth:`mark`."""
+        return await self.mark(nid)
+
+    async def delete(self, nid):
+        """Delete one notification."""
+        res = await self.client.delete(path=f"/notifications/{nid}")
+        return res.status_code == 202
+
+
+class AsyncSchemas(Schemas):
+    """Awaitable schema read resource wrapper."""
+
+    async def get(self, said):
+        """Fetch one schema by SAID, from the SAID cache when it holds it."""
+        if self.cache is not None and (raw := self.cache.get(said, verifySchema)) is not None:
+            return json.loads(raw)
+
+        res = await self.client.get(f"/schema/{said}")
+        schema = res.json()
+        if self.cache is not None:
+            self.cache.put(said, json.dumps(schema).encode("utf-8"), verifySchema)
+        return schema
+
+    async def list(self):
+        """List all schemas currently available to the remote agent."""
+        res = await self.client.get("/schema")
+        return res.json()
+
+
+class AsyncCredentials(Credentials):
+    """Awaitable stored-credential read and credential write resource wrapper."""
+
+    async def list(self, filter=None, sort=None, skip=0, limit=25):
+        """Query credentials stored by the remote agent."""
+        body = dict(
+            filter={} if filter is None else filter,
+            sort=sort if sort is not None else [],
+            skip=skip,
+            limit=limit
+        )
+        res = await self.client.post("/credentials/query", json=body)
+        return res.json()
+
+    async def iter(self, filter=None, sort=None, page_size=25, prefetch=True):
+        """Asynchronously yield every credential matching ``filter``, one query page at a time."""
+        if page_size < 1:
+            raise ValueError(f"invalid page_size={page_size}, must be at least 1")
+
+        ahead = None
+        try:
+            skip = 0
+            page = await self.list(filter=filter, sort=sort, skip=skip, limit=page_size)
+            while page:
+                skip += len(page)
+                full = len(page) >= page_size
+                if full and prefetch:
+                    ahead = asyncio.ensure_future(self.list(filter=filter, sort=sort, skip=skip, limit=page_size))
+
+                for credential in page:
+                    yield credential
+                if not full:
+                    return
+
+                if ahead is not None:
+                    page, ahead = await ahead, None
+                else:
+                    page = await self.list(filter=filter, sort=sort, skip=skip, limit=page_size)
+        finally:
+            if ahead is not None:
+                ahead.cancel()
+
+    async def get(self, said, includeCESR=False):
+        """Fetch one credential in JSON or CESR form."""
+        headers = dict(accept="application/json+cesr" if includeCESR else "application/json")
+        res = await self.client.get(f"/credentials/{said}", headers=headers)
+        return res.content if includeCESR else res.json()
+
+    async def export(self, said):
+        """Compatibility alias for CESR retrieval."""
+        return await self.get(said, includeCESR=True)
+
+    async def delete(self, said):
+        """Delete one locally stored credential by SAID."""
+        await self.client.delete(f"/credentials/{said}")
+
+    async def state(self, registry_said, credential_said):
+        """Fetch one credential TEL state record under a registry."""
+        res = await self.client.get(f"/registries/{registry_said}/{credential_said}")
+        return res.json()
+
+    async def issue(self, name, registryName, data, schema, *, recipient=None, edges=None, rules=None,
+                    private=False, timestamp=None):
+        """Create and submit a credential issuance request.
+
+        Returns:
+            CredentialIssueResult: the created credential material. The wrapped
+                response is already read, so ``op()`` does not block.
+        """
+        identifiers = self.client.identifiers()
+        async with identifiers.sequence(name):
+            hab, registry = await asyncio.gather(
+                identifiers.getCached(name),
+                self.client.get(f"/identifiers/{name}/registries/{registryName}"),
+            )
+            registry = registry.json()
+            creder, iserder, anc, sigs = self._build_issue_artifacts(hab=hab, registry=registry, data=data,
+                                                                     schema=schema, recipient=recipient, edges=edges,
+                                                                     rules=rules, private=private,
+                                                                     timestamp=timestamp)
+            try:
+                response = await self.create_from_events(hab=hab, creder=creder.sad, iss=iserder.sad, anc=anc.sad,
+                                                         sigs=sigs)
+            except Exception:
+                identifiers.invalidate(name)
+                raise
+
+            identifiers.advance(name, anc)
+
+        return CredentialIssueResult(acdc=creder, iss=iserder, anc=anc, sigs=sigs, response=response)
+
+    async def create(self, hab, registry, data, schema, recipient=None, edges=None, rules=None, private=False,
+                     timestamp=None):
+        """Compatibility wrapper for the older registry-centric issuance API, see :meth:`Credentials.create`."""
+        creder, iserder, anc, sigs = self._build_issue_artifacts(hab=hab, registry=registry, data=data,
+                                                                 schema=schema, recipient=recipient, edges=edges,
+                                                                 rules=rules, private=private, timestamp=timestamp)
+        response = await self.create_from_events(hab=hab, creder=creder.sad, iss=iserder.sad, anc=anc.sad,
+                                                 sigs=sigs)
+        return creder, iserder, anc, sigs, response.json()
+
+    async def issue_many(self, name, registryName, items, *, chunk_size=None):
+        """Issue many credentials anchored by as few interaction events as possible.
+
+        Behaves like :meth:`Credentials.issue_many`, except that the
+        credentials of one anchored chunk are submitted concurrently.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"invalid chunk_size={chunk_size}, must be at least 1")
+
+        items = list(items)
+        identifiers = self.client.identifiers()
+        registry = (await self.client.get(f"/identifiers/{name}/registries/{registryName}")).json()
+        size = len(items) if chunk_size is None else chunk_size
+
+        results = [None] * len(items)
+        anchors = []
+        responses = []
+        async with identifiers.sequence(name):
+            hab = await identifiers.getCached(name)
+            sn = int(hab["state"]["s"], 16)
+            dig = hab["state"]["d"]
+
+            for start in range(0, len(items), size):
+                events = []
+                for idx in range(start, min(start + size, len(items))):
+                    try:
+                        creder, iserder = self._build_credential_events(registry=registry, **items[idx])
+                    except Exception as ex:
+                        results[idx] = CredentialIssueResult(acdc=None, iss=None, anc=None, sigs=None, response=None,
+                                                             error=ex)
+                        continue
+                    events.append((idx, creder, iserder))
+
+                if not events:
+                    continue
+
+                try:
+                    anc, sigs, response = await self._anchor_chunk(identifiers, name, hab,
+                                                                   [iserder for _, _, iserder in events], sn + 1,
+                                                                   dig)
+                except Exception as ex:
+                    for idx, creder, iserder in events:
+                        results[idx] = CredentialIssueResult(acdc=creder, iss=iserder, anc=None, sigs=None,
+                                                             response=None, error=ex)
+                    try:
+                        hab, sn, dig = await self._reload(identifiers, name)
+                    except Exception as ex:
+                        results = [result or CredentialIssueResult(acdc=None, iss=None, anc=None, sigs=None,
+                                                                   response=None, error=ex)
+                                   for result in results]
+                        break
+                    continue
+
+                sn += 1
+                dig = anc.said
+                responses.append(response)
+                anchors.append(anc)
+
+                async def submit(creder, iserder):
+                    result = CredentialIssueResult(acdc=creder, iss=iserder, anc=anc, sigs=sigs, response=None)
+                    try:
+                        result.response = await self.create_from_events(hab=hab, creder=creder.sad, iss=iserder.sad,
+                                                                        anc=anc.sad, sigs=sigs)
+                    except Exception as ex:
+                        result.error = ex
+                    return result
+
+                submitted = await asyncio.gather(*[submit(creder, iserder) for _, creder, iserder in events])
+                for (idx, _, _), result in zip(events, submitted):
+                    results[idx] = result
+
+        return CredentialBatchResult(results=results, anchors=anchors, responses=responses)
+
+    async def revoke_many(self, name, saids, *, chunk_size=None, max_workers=8, timestamp=None):
+        """Revoke many credentials anchored by as few interaction events as possible.
+
+        Behaves like :meth:`Credentials.revoke_many`, with ``max_workers``
+        bounding the concurrent credential reads and revocation submissions.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"invalid chunk_size={chunk_size}, must be at least 1")
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        saids = list(saids)
+        identifiers = self.client.identifiers()
+        dt = timestamp or helping.nowIso8601()
+        size = len(saids) if chunk_size is None else chunk_size
+        limit = asyncio.Semaphore(max_workers)
+
+        async def build(said):
+            try:
+                async with limit:
+                    credential = await self.get(said)
+                return self._build_revoke_event(credential=credential, said=said, dt=dt), None
+            except Exception as ex:
+                return None, ex
+
+        results = [None] * len(saids)
+        anchors = []
+        responses = []
+        pending = []
+        for idx, (rserder, error) in enumerate(await asyncio.gather(*[build(said) for said in saids])):
+            if error is not None:
+                results[idx] = CredentialRevokeResult(rev=None, anc=None, sigs=None, response=None, said=saids[idx],
+                                                      error=error)
+            else:
+                pending.append((idx, rserder))
+
+        async with identifiers.sequence(name):
+            hab = await identifiers.getCached(name)
+            sn = int(hab["state"]["s"], 16)
+            dig = hab["state"]["d"]
+
+            keeper = self.client.manager.get(aid=hab)
+            for start in range(0, len(pending), size):
+                chunk = pending[start:start + size]
+
+                try:
+                    anc, sigs, response = await self._anchor_chunk(identifiers, name, hab,
+                                                                   [rserder for _, rserder in chunk], sn + 1, dig)
+                except Exception as ex:
+                    for idx, rserder in chunk:
+                        results[idx] = CredentialRevokeResult(rev=rserder, anc=None, sigs=None, response=None,
+                                                              said=saids[idx], error=ex)
+                    try:
+                        hab, sn, dig = await self._reload(identifiers, name)
+                    except Exception as ex:
+                        results = [result or CredentialRevokeResult(rev=None, anc=None, sigs=None, response=None,
+                                                                    said=said, error=ex)
+                                   for said, result in zip(saids, results)]
+                        break
+                    continue
+
+                sn += 1
+                dig = anc.said
+                responses.append(response)
+                anchors.append(anc)
+
+                async def submit(idx, rserder):
+                    said = saids[idx]
+                    result = CredentialRevokeResult(rev=rserder, anc=anc, sigs=sigs, response=None, said=said)
+                    body = dict(rev=rserder.ked, ixn=anc.ked, sigs=sigs)
+                    body[keeper.algo] = keeper.params()
+                    try:
+                        async with limit:
+                            result.response = await self.client.delete(f"/identifiers/{name}/credentials/{said}",
+                                                                       body=body)
+                    except Exception as ex:
+                        result.error = ex
+                    results[idx] = result
+
+                await asyncio.gather(*[submit(idx, rserder) for idx, rserder in chunk])
+
+        return CredentialBatchResult(results=results, anchors=anchors, responses=responses)
+
+    async def _anchor_chunk(self, identifiers, name, hab, serders, sn, dig):
+        """Anchor ``serders`` with one interaction event at ``sn`` and submit it through the events endpoint."""
+        anc, sigs = self._anchor_tel_events(hab=hab, serders=serders, sn=sn, dig=dig)
+
+        keeper = self.client.manager.get(aid=hab)
+        body = dict(ixn=anc.ked, sigs=sigs)
+        body[keeper.algo] = keeper.params()
+        return anc, sigs, await identifiers.postEvent(name, f"/identifiers/{name}/events", body, anc)
+
+    @staticmethod
+    async def _reload(identifiers, name):
+        """Read the state of ``name`` back from KERIA after an anchoring with an unknown outcome."""
+        identifiers.invalidate(name)
+        hab = await identifiers.getCached(name)
+        return hab, int(hab["state"]["s"], 16), hab["state"]["d"]
+
+    async def create_from_events(self, hab, creder, iss, anc, sigs):
+        """Submit a credential issuance request from prebuilt local events."""
+        body = dict(acdc=creder, iss=iss, ixn=anc, sigs=sigs)
+        keeper = self.client.manager.get(aid=hab)
+        body[keeper.algo] = keeper.params()
+
+        return await self.client.post(f"/identifiers/{hab['name']}/credentials", json=body)
+
+    async def revoke(self, name, said, *, timestamp=None):
+        """Create and submit a credential revocation request."""
+        identifiers = self.client.identifiers()
+        async with identifiers.sequence(name):
+            hab, credential = await asyncio.gather(identifiers.getCached(name), self.get(said))
+            hab, rserder, anc, sigs = self._make_revoke_artifacts(hab=hab, credential=credential, said=said,
+                                                                  timestamp=timestamp)
+            keeper = self.client.manager.get(aid=hab)
+            body = dict(rev=rserder.ked, ixn=anc.ked, sigs=sigs)
+            body[keeper.algo] = keeper.params()
+            try:
+                response = await self.client.delete(f"/identifiers/{name}/credentials/{said}", body=body)
+            except Exception:
+                identifiers.invalidate(name)
+                raise
+
+            identifiers.advance(name, anc)
+
+        return CredentialRevokeResult(rev=rserder, anc=anc, sigs=sigs, response=response)
+
+
+class AsyncExchanges(Exchanges):
+    """Awaitable peer exchange resource wrapper.
+
+    ``createExchangeMessage`` is inherited and stays synchronous because it
+    only builds and signs locally.
+    """
+
+    async def send(self, name, topic, sender, route, payload, embeds, recipients, dig=None, max_workers=8):
+        """Send an exn message to each recipient concurrently, see :meth:`Exchanges.send`."""
+        if not recipients:
+            raise ValueError("recipients must not be empty")
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        build = self._builder(sender, route, payload, embeds, recipients, dig)
+        if len(recipients) == 1:
+            exn, sigs, atc = build(recipients[0])
+            json = await self.sendFromEvents(name, topic, exn=exn, sigs=sigs, atc=atc, recipients=list(recipients))
+            return exn, sigs, json
+
+        limit = asyncio.Semaphore(max_workers)
+        errors = dict()
+
+        async def one(recipient):
+            try:
+                async with limit:
+                    exn, sigs, atc = build(recipient)
+                    json = await self.sendFromEvents(name, topic, exn=exn, sigs=sigs, atc=atc,
+                                                     recipients=[recipient])
+                return exn, sigs, json
+            except Exception as ex:
+                errors[recipient] = ex
+                return None
+
+        results = await asyncio.gather(*[one(recipient) for recipient in recipients])
+        if errors:
+            raise ExchangeSendError(list(results), errors)
+
+        return list(results)
+
+    async def sendFromEvents(self, name, topic, exn, sigs, atc, recipients):
+        """Send a precreated exn message to recipients."""
+        body = dict(tpc=topic, exn=exn.ked, sigs=sigs, atc=atc, rec=recipients)
+        res = await self.client.post(f"/identifiers/{name}/exchanges", json=body)
+        return res.json()
+
+    async def get(self, said):
+        """Fetch one stored exchange message by SAID, from the SAID cache when it holds it."""
+        if self.cache is not None and (raw := self.cache.get(said, verifyExchange)) is not None:
+            return json.loads(raw)
+
+        res = await self.client.get(f"/exchanges/{said}")
+        exn = res.json()
+        if self.cache is not None:
+            self.cache.put(said, json.dumps(exn).encode("utf-8"), verifyExchange)
+        return exn
+
+
+class AsyncIpex(Ipex):
+    """Awaitable IPEX resource wrapper.
+
+    The builders resolve the sender habitat asynchronously and then reuse the
+    blocking builders, which only build and sign locally.
+    """
+
+    def __init__(self, client):
+        super().__init__(client)
+        self._habs = dict()
+
+    def _hab(self, name):
+        """Return the habitat prefetched for the current builder call."""
+        return self._habs.pop(name)
+
+    async def _build(self, builder, name, *args, **kwargs):
+        if name is not None:
+            self._habs[name] = await self.client.identifiers().get(name)
+        return builder(*args, **kwargs)
+
+    async def apply(self, name, *args, **kwargs):
+        """Create an IPEX apply exchange, see :meth:`Ipex.apply`."""
+        return await self._build(super().apply, name, name, *args, **kwargs)
+
+    async def offer(self, name, *args, **kwargs):
+        """Create an IPEX offer exchange, see :meth:`Ipex.offer`."""
+        return await self._build(super().offer, name, name, *args, **kwargs)
+
+    async def agree(self, name, *args, **kwargs):
+        """Create an IPEX agree exchange, see :meth:`Ipex.agree`."""
+        return await self._build(super().agree, name, name, *args, **kwargs)
+
+    async def grant(self, hab=None, *args, name=None, **kwargs):
+        """Create an IPEX grant exchange, see :meth:`Ipex.grant`."""
+        return await self._build(super().grant, name, hab, *args, name=name, **kwargs)
+
+    async def admit(self, hab=None, *args, name=None, **kwargs):
+        """Create an IPEX admit exchange, see :meth:`Ipex.admit`."""
+        return await self._build(super().admit, name, hab, *args, name=name, **kwargs)
+
+    async def _submit(self, route, name, body):
+        res = await self.client.post(f"/identifiers/{name}/ipex/{route}", json=body)
+        return res.json()
+
+    async def submitApply(self, name, exn, sigs, recp):
+        """Send a precreated IPEX apply exchange to recipients."""
+        return await self._submit("apply", name, dict(exn=exn.ked, sigs=sigs, rec=recp))
+
+    async def submitOffer(self, name, exn, sigs, atc, recp):
+        """Send a precreated IPEX offer exchange to recipients."""
+        return await self._submit("offer", name, dict(exn=exn.ked, sigs=sigs, atc=atc, rec=recp))
+
+    async def submitAgree(self, name, exn, sigs, recp):
+        """Send a precreated IPEX agree exchange to recipients."""
+        return await self._submit("agree", name, dict(exn=exn.ked, sigs=sigs, rec=recp))
+
+    async def submitGrant(self, name, exn, sigs, atc, recp):
+        """Send a precreated IPEX grant exchange to recipients."""
+        return await self._submit("grant", name, dict(exn=exn.ked, sigs=sigs, atc=atc, rec=recp))
+
+    async def submitAdmit(self, name, exn, sigs, atc, recp):
+        """Send a precreated IPEX admit exchange to recipients."""
+        return await self._submit("admit", name, dict(exn=exn.ked, sigs=sigs, atc=atc, rec=recp))
@@ -6,6 +6,7 @@ boots and connects the remote agent, restores local controller state, signs
 HTTP requests, and exposes the resource wrappers that implement the maintained
 request families documented in the feature guide.
 """
+import threading
 from dataclasses import asdict
 from urllib.parse import quote, urlparse, urljoin, urlsplit
 
@@ -16,6 +17,7 @@ from keri.core.coring import Tiers
 from keri.end import ending
 from keri.help import helping
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 from requests.structures import CaseInsensitiveDict
 
@@ -24,11 +26,20 @@ from signify.signifying import SignifyState
 
 
 class SignifyClient:
-    """Edge-signing client bound to one controller AID and delegated agent."""
+    """Edge-signing client bound to one controller AID and delegated agent.
+
+    A connected client may be shared by many threads. Requests go through one
+    ``requests.Session`` whose connection pool holds up to ``pool_maxsize``
+    connections per host, salty key indexes are handed out atomically by
+    :meth:`reservePidx`, and key events for one identifier are serialized by
+    the shared event sequencer. ``boot``, ``connect`` and ``rotate`` change
+    the client itself and must not run concurrently with other calls.
+    """
 
     ExternalRequestFields = ["@method", "@path", "Signify-Resource", "Signify-Timestamp"]
 
-    def __init__(self, passcode, url=None, boot_url=None, tier=Tiers.low, extern_modules=None):
+    def __init__(self, passcode, url=None, boot_url=None, tier=Tiers.low, extern_modules=None, pool_maxsize=10,
+                 executor=None, said_cache=None, key_state_cache=None):
         """
         Create a new SignifyClient. Connects to the KERIA instance and delegates from the local
         Signify Client AID (caid) to the KERIA Agent AID with a delegated inception event.
@@ -44,6 +55,10 @@ class SignifyClient:
             boot_url (str): Boot interface URL of the KERIA instance to connect to for initial boot
             tier (Tiers): tier of the controller (low, med, high)
             extern_modules (dict): external key management modules such as for Google KMS, Trezor, etc.
+            pool_maxsize (int): connections kept open per host, size it to the number of threads sharing the client
+            executor (DerivationExecutor): runs salty key stretching, inline on the calling thread when None
+            said_cache (SaidCache): cache for schemas and exn messages fetched by SAID, None disables it
+            key_state_cache (KeyStateCache): cache for key states read through keyStates(), None disables it
 
         Attributes:
             bran (str | bytes): 21 character passphrase for the local controller (passcode)
@@ -51,11 +66,16 @@ class SignifyClient:
             tier (Tiers): tier of the controller (low, med, high)
             extern_modules (dict): external key management modules such as for Google KMS, Trezor, etc.
             mgr (Manager): key manager for the controller; performs signing and rotation
+            executor (DerivationExecutor): key stretching executor shared by the controller and key manager
             session (requests.Session): HTTP session for the client
             agent (Agent): Agent representing the KERIA Agent AID
             authn (Authenticater): Authenticater for the client
             base (str): Boot interface URL of the KERIA instance to connect to
             ctrl (Controller): Controller representing the local controller AID
+            hab_cache (HabStateCache): identifier habitat state cache shared by every Identifiers resource
+            sequencer (EventSequencer): per-identifier event sequencer shared by every Identifiers resource
+            resolved_oobis (set): ``(url, alias)`` pairs resolved through Oobis.resolve_many, which skips them
+                when repeated
         """
 
         if len(passcode) < 21:
@@ -65,15 +85,24 @@ class SignifyClient:
         self.pidx = 0
         self.tier = tier
         self.extern_modules = extern_modules
+        self.pool_maxsize = pool_maxsize
+        self.executor = executor
+        self.said_cache = said_cache
+        self.key_state_cache = key_state_cache
 
         self.mgr = None
         self.session = None
         self.agent = None
         self.authn = None
         self.base = None
+        self.hab_cache = None
+        self.sequencer = None
+        self.resolved_oobis = set()
         self._booted_agent = None
+        self._released = set()
+        self._lock = threading.RLock()
 
-        self.ctrl = authing.Controller(bran=self.bran, tier=self.tier)
+        self.ctrl = authing.Controller(bran=self.bran, tier=self.tier, executor=self.executor)
         self.url = url
         self.boot_url = boot_url
 
@@ -127,15 +156,21 @@ class SignifyClient:
         self.base = url
 
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_maxsize, pool_maxsize=self.pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.hab_cache = None
         state = self.states()
         self.pidx = state.pidx
+        self._released.clear()
 
         # Create agent representing the AID of the cloud agent
         self.agent = authing.Agent(state=state.agent)
 
-        # Create controller representing local auth AID
-        self.ctrl = authing.Controller(bran=self.bran, tier=self.tier, state=state.controller)
-        self.mgr = keeping.Manager(salter=self.ctrl.salter, extern_modules=self.extern_modules)
+        # Bind the controller derived in __init__ to the stored state rather than stretching the passcode again
+        self.ctrl.rebind(state.controller)
+        self.mgr = keeping.Manager(salter=self.ctrl.salter, extern_modules=self.extern_modules,
+                                   executor=self.executor)
 
         if self.agent.delpre != self.ctrl.pre:
             raise kering.ConfigurationError("commitment to controller AID missing in agent inception event")
@@ -159,6 +194,87 @@ class SignifyClient:
         """Rotate the controller commitment and persist the new agent binding."""
         data = self.ctrl.rotate(nbran=nbran, aids=aids)
         self.put(path=f"/agent/{self.controller}", json=data)
+        if self.mgr is not None:
+            # every stored salt and key cipher was re-encrypted
+            self.mgr.invalidate()
+
+    def rotatePasscode(self, nbran, *, page_size=100, max_workers=8, checkpoint=None, progress=None):
+        """Rotate the controller passcode, re-encrypting the key material of every identifier.
+
+        Unlike :meth:`rotate` the identifiers are read from KERIA page by page
+        and re-encrypted on ``max_workers`` threads. When ``checkpoint`` is a
+        file path, progress is saved there after every page and a rerun after
+        a crash skips the identifiers already done. The checkpoint is removed
+        once KERIA accepts the rotation.
+
+        Parameters:
+            nbran (str): new 21 character passcode
+            page_size (int): number of identifiers read per ``GET /identifiers`` request
+            max_workers (int): maximum number of identifiers re-encrypted concurrently
+            checkpoint (str | None): path of the progress file to save to and resume from
+            progress (Callable | None): called with ``(done, total)`` after every page
+        """
+        if page_size < 1:
+            raise ValueError(f"invalid page_size={page_size}, must be at least 1")
+
+        rotation = authing.PasscodeRotation(self.ctrl, nbran, checkpoint=checkpoint, max_workers=max_workers)
+        identifiers = self.identifiers()
+
+        start = 0
+        while True:
+            page = identifiers.list(start=start, end=start + page_size - 1)
+            rotation.recrypt(page["aids"])
+            if progress is not None:
+                progress(rotation.done, page["total"])
+
+            start += len(page["aids"])
+            if not page["aids"] or start >= page["total"]:
+                break
+
+        self.put(path=f"/agent/{self.controller}", json=rotation.finish())
+        if self.mgr is not None:
+            # every stored salt and key cipher was re-encrypted
+            self.mgr.invalidate()
+
+        rotation.discard()
+
+    def reservePidx(self, count=1):
+        """Atomically reserve ``count`` consecutive salty key indexes.
+
+        A single index is taken from the indexes returned by
+        :meth:`releasePidx` first, so they do not stay unused.
+
+        Returns:
+            int: the first reserved index, the block is ``[pidx, pidx + count)``
+        """
+        if count < 1:
+            raise ValueError(f"invalid count={count}, must be at least 1")
+
+        with self._lock:
+            if count == 1 and self._released:
+                pidx = min(self._released)
+                self._released.remove(pidx)
+                return pidx
+
+            pidx = self.pidx
+            self.pidx = pidx + count
+
+        return pidx
+
+    def releasePidx(self, pidx, count=1):
+        """Return reserved salty key indexes whose identifiers KERIA never stored.
+
+        KERIA reports its identifier count as ``pidx`` on connect, so an
+        unused index below the local ``pidx`` would later be handed out a
+        second time. Released indexes at the top of the reserved range lower
+        ``pidx`` again, the others are reused by the next single index
+        reservations.
+        """
+        with self._lock:
+            self._released.update(range(pidx, pidx + count))
+            while self.pidx - 1 in self._released:
+                self.pidx -= 1
+                self._released.remove(self.pidx)
 
     @property
     def controller(self):
@@ -342,6 +458,13 @@ class SignifyClient:
         for event in client:
             yield event
 
+    def openStream(self, path, params=None, headers=None, body=None):
+        """Open a server-sent-event stream that another thread can close, see :class:`EventSource`."""
+        url = urljoin(self.base, path)
+        kwargs = self._request_kwargs(params=params, headers=headers, json=body)
+
+        return EventSource(url, session=self.session, **kwargs)
+
     def delete(self, path, params=None, headers=None, body=None):
         """Issue an authenticated ``DELETE`` request relative to the client base URL."""
         return self._request("DELETE", path, params=params, headers=headers, json=body)
@@ -356,8 +479,13 @@ class SignifyClient:
 
     def identifiers(self):
         """Return the identifier lifecycle resource wrapper."""
-        from signify.app.aiding import Identifiers
-        return Identifiers(client=self)
+        from signify.app.aiding import EventSequencer, HabStateCache, Identifiers
+        with self._lock:
+            if self.hab_cache is None:
+                self.hab_cache = HabStateCache()
+            if self.sequencer is None:
+                self.sequencer = EventSequencer()
+        return Identifiers(client=self, cache=self.hab_cache, sequencer=self.sequencer)
 
     def operations(self):
         """Return the long-running operation polling resource wrapper."""
@@ -377,7 +505,7 @@ class SignifyClient:
     def keyStates(self):
         """Return the key-state read and query resource wrapper."""
         from signify.app.coring import KeyStates
-        return KeyStates(client=self)
+        return KeyStates(client=self, cache=self.key_state_cache)
 
     def keyEvents(self):
         """Return the key-event read resource wrapper."""
@@ -417,7 +545,7 @@ class SignifyClient:
     def schemas(self):
         """Return the schema read resource wrapper."""
         from signify.app.schemas import Schemas
-        return Schemas(client=self)
+        return Schemas(client=self, cache=self.said_cache)
 
     def config(self):
         """Return the agent-configuration read resource wrapper."""
@@ -427,7 +555,7 @@ class SignifyClient:
     def exchanges(self):
         """Return the exchange transport resource wrapper."""
         from signify.app.exchanging import Exchanges
-        return Exchanges(client=self)
+        return Exchanges(client=self, cache=self.said_cache)
 
     def ipex(self):
         """Return the IPEX grant/admit resource wrapper."""
@@ -472,6 +600,40 @@ class SignifyClient:
         raise HTTPError(http_error_msg, response=res)
 
 
+class EventSource(sseclient.SSEClient):
+    """Server-sent-event reader that can be closed while another thread reads it.
+
+    ``sseclient`` reconnects whenever the response ends. After :meth:`close`
+    the reader stops instead, so iteration ends as soon as the blocked read
+    returns.
+    """
+
+    def __init__(self, url, **kwargs):
+        self.closed = False
+        super().__init__(url, **kwargs)
+
+    def _connect(self):
+        if self.closed:
+            raise StopIteration
+
+        super()._connect()
+
+    def close(self):
+        """Close the response and end iteration instead of reconnecting."""
+        self.closed = True
+        self.retry = 0
+
+        resp = getattr(self, "resp", None)
+        if resp is None:
+            return
+
+        # urllib3 2.3 and later can shut the socket down, which unblocks a read in another thread
+        shutdown = getattr(resp.raw, "shutdown", None)
+        if shutdown is not None:
+            shutdown()
+        resp.close()
+
+
 class SignifyAuth(AuthBase):
     """Requests auth adapter that signs outbound Signify HTTP requests."""
 
@@ -5,7 +5,13 @@ This module groups smaller request families used across many workflows:
 long-running operations, OOBI retrieval and resolution, key-state reads, and
 key-event reads.
 """
+import copy
+import json
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 
 from signify.app.clienting import SignifyClient
 
@@ -35,6 +41,10 @@ class Operations:
         """Delete one long-running operation by operation name."""
         self.client.delete(f"/operations/{name}")
 
+    def waiter(self, ops, **kwargs):
+        """Return an :class:`OperationWaiter` that waits for ``ops`` on one shared polling schedule."""
+        return OperationWaiter(self, ops, **kwargs)
+
     def wait(
         self,
         op,
@@ -45,6 +55,7 @@ class Operations:
         backoff=2.0,
         check_abort=None,
         options=None,
+        stream=None,
         _deadline=None,
     ):
         """Poll an operation until it completes.
@@ -54,6 +65,13 @@ class Operations:
         seconds, ``backoff`` as the exponential multiplier, and
         ``check_abort(current_op)`` for caller-controlled cancellation. The
         TS-style ``options`` dict remains supported as a compatibility path.
+
+        Passing a connected :class:`OperationStream` as ``stream`` opts into
+        push completion: the operation is watched on the stream before the
+        first poll, and between polls the wait blocks on the stream for up to
+        ``max_interval`` seconds and returns as soon as the operation is pushed
+        as done. Once the stream disconnects the wait falls back to polling
+        with the normal backoff.
         """
         if options is not None:
             return self._wait_with_options(op, options=options)
@@ -70,6 +88,7 @@ class Operations:
                 max_interval=max_interval,
                 backoff=backoff,
                 check_abort=check_abort,
+                stream=stream,
                 _deadline=deadline,
             )
 
@@ -78,24 +97,33 @@ class Operations:
 
         retries = 0
 
-        while True:
-            op = self.get(op["name"])
+        with stream.watch(op["name"]) if stream is not None else nullcontext():
+            while True:
+                op = self.get(op["name"])
 
-            if op.get("done") is True:
-                return op
+                if op.get("done") is True:
+                    return op
+
+                self._raise_if_timed_out(deadline, op)
+                self._check_abort(check_abort, op)
 
-            self._raise_if_timed_out(deadline, op)
-            self._check_abort(check_abort, op)
+                delay = min(max_interval, interval * (backoff ** retries))
+                retries += 1
 
-            delay = min(max_interval, interval * (backoff ** retries))
-            retries += 1
+                if stream is not None and stream.connected:
+                    delay = max_interval
 
-            if deadline is not None:
-                remaining = deadline - time.monotonic()
-                self._raise_if_timed_out(deadline, op)
-                delay = min(delay, remaining)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    self._raise_if_timed_out(deadline, op)
+                    delay = min(delay, remaining)
 
-            time.sleep(delay)
+                if stream is not None and stream.connected:
+                    pushed = stream.wait(op["name"], timeout=delay)
+                    if pushed is not None:
+                        return pushed
+                else:
+                    time.sleep(delay)
 
     @staticmethod
     def _depends(op):
@@ -179,6 +207,369 @@ class Operations:
             self._throw_if_aborted(signal)
 
 
+class OperationStream:
+    """Push operation updates from a server-sent event stream to blocked waiters.
+
+    A background thread reads ``client.openStream(path)`` and expects each
+    event's data to be a JSON operation payload. Every waiter blocked in
+    :meth:`wait` on an operation is woken as soon as it is pushed as done.
+    Pushes for operations nobody watches or waits on are dropped.
+    :meth:`Operations.wait` enters :meth:`watch` before its first poll, so a
+    push landing between that poll and the wait on the stream is kept. When
+    the stream ends, fails or is closed, ``connected`` turns False and every
+    waiter is released so that :meth:`Operations.wait` can fall back to
+    polling.
+    """
+
+    def __init__(self, client: SignifyClient, path="/operations/stream"):
+        """Create an operation stream bound to one Signify client.
+
+        Parameters:
+            client (SignifyClient): connected client used to open the stream
+            path (str): path of the server-sent event endpoint publishing operation updates
+        """
+        self.client = client
+        self.path = path
+        self.connected = False
+        self.error = None
+
+        self._ops = dict()
+        self._waiting = dict()
+        self._source = None
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start(self):
+        """Start reading the stream in a daemon thread."""
+        if self._thread is None:
+            self.connected = True
+            self._thread = threading.Thread(target=self._run, name="signify-operation-stream", daemon=True)
+            self._thread.start()
+
+        return self
+
+    def close(self, timeout=5.0):
+        """Release every waiter, close the HTTP response and join the reader thread.
+
+        Parameters:
+            timeout (float | None): seconds to wait for the reader thread to finish
+        """
+        self._disconnect()
+        with self._cond:
+            source = self._source
+
+        if source is not None:
+            source.close()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _disconnect(self, error=None):
+        with self._cond:
+            self.connected = False
+            self.error = error if self.error is None else self.error
+            self._cond.notify_all()
+
+    def _run(self):
+        try:
+            source = self.client.openStream(self.path)
+            with self._cond:
+                self._source = source
+                closed = not self.connected
+            if closed:
+                source.close()
+                return
+
+            for event in source:
+                if not self.connected:
+                    return
+                self._push(event.data)
+        except Exception as ex:
+            self._disconnect(ex if self.connected else None)
+        else:
+            self._disconnect()
+
+    def _push(self, data):
+        try:
+            op = json.loads(data)
+        except (TypeError, ValueError):
+            return
+
+        if not isinstance(op, dict) or "name" not in op:
+            return
+
+        if op.get("done") is not True:
+            return
+
+        with self._cond:
+            if op["name"] in self._waiting:
+                self._ops[op["name"]] = op
+                self._cond.notify_all()
+
+    @contextmanager
+    def watch(self, name):
+        """Keep every done push for ``name`` from entering the context until it exits.
+
+        Enter it before polling the operation so a push that lands before
+        :meth:`wait` is called is not dropped.
+        """
+        with self._cond:
+            self._hold(name)
+        try:
+            yield self
+        finally:
+            with self._cond:
+                self._release(name)
+
+    def _hold(self, name):
+        """Count one more watcher of ``name``. Call with the condition held."""
+        self._waiting[name] = self._waiting.get(name, 0) + 1
+
+    def _release(self, name):
+        """Drop one watcher of ``name`` and its pushed operation after the last. Call with the condition held."""
+        self._waiting[name] -= 1
+        if not self._waiting[name]:
+            del self._waiting[name]
+            self._ops.pop(name, None)
+
+    def wait(self, name, timeout=None):
+        """Block until operation ``name`` is pushed as done.
+
+        Only pushes that arrive while at least one caller watches or waits on
+        ``name`` are kept, and they are dropped again once the last of them
+        returns.
+
+        Returns:
+            dict | None: the pushed operation, or None when ``timeout`` expires
+            or the stream disconnects first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._hold(name)
+            try:
+                while True:
+                    op = self._ops.get(name)
+                    if op is not None:
+                        return op
+
+                    if not self.connected:
+                        return None
+
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return None
+
+                    self._cond.wait(remaining)
+            finally:
+                self._release(name)
+
+
+class OperationWaiter:
+    """Wait for many long-running operations on one shared polling schedule.
+
+    Every pending operation is refreshed once per round and all rounds share
+    one exponential backoff clock, so waiting on hundreds of operations costs
+    one sleep per round instead of one blocking poller per operation. When at
+    least ``list_threshold`` pending operations share an operation type, the
+    round refreshes them with a single ``Operations.list(type=...)`` call and
+    only falls back to ``Operations.get`` for names missing from that listing.
+
+    Unfinished ``metadata.depends`` operations are polled alongside their
+    dependents, and an operation is only reported complete once its whole
+    dependency chain is done. Dependencies are not yielded themselves.
+
+    Completed operations are yielded in completion order by iterating the
+    waiter or calling :meth:`as_completed`.
+    """
+
+    def __init__(self, operations: Operations, ops=(), *, timeout=None, interval=0.01, max_interval=10.0,
+                 backoff=2.0, list_threshold=2):
+        """Create a waiter for ``ops``.
+
+        Parameters:
+            operations (Operations): operations resource used to refresh state
+            ops (Iterable[dict]): operations to wait for, more can be added later with :meth:`add`
+            timeout (float | None): seconds to wait for all operations before raising ``TimeoutError``
+            interval (float): initial delay in seconds between polling rounds
+            max_interval (float): upper bound in seconds for the delay between rounds
+            backoff (float): exponential multiplier applied to the delay after each round
+            list_threshold (int): minimum number of pending operations of one type refreshed with a list call
+        """
+        self.operations = operations
+        self.timeout = timeout
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.list_threshold = list_threshold
+
+        self.pending = dict()
+        self.latest = dict()
+        self.depends = dict()
+
+        for op in ops:
+            self.add(op)
+
+    def __len__(self):
+        return len(self.pending)
+
+    def __iter__(self):
+        return self.as_completed()
+
+    def add(self, op):
+        """Track one operation and any operation it depends on."""
+        self.pending[op["name"]] = op
+        self._track(op)
+
+    def _track(self, op):
+        name = op["name"]
+        self.latest[name] = op
+
+        depends = Operations._depends(op)
+        if depends is not None:
+            self.depends[name] = depends["name"]
+            if depends["name"] not in self.latest:
+                self._track(depends)
+
+    def _resolved(self, name):
+        """Return True when ``name`` and its whole dependency chain are done."""
+        while name is not None:
+            if self.latest[name].get("done") is not True:
+                return False
+            name = self.depends.get(name)
+
+        return True
+
+    def _harvest(self):
+        done = [name for name in self.pending if self._resolved(name)]
+        for name in done:
+            del self.pending[name]
+
+        return [self.latest[name] for name in done]
+
+    @staticmethod
+    def _type(name):
+        """Return the KERIA operation type prefix of an operation name."""
+        return name.split(".", 1)[0] if "." in name else None
+
+    def _stale(self):
+        """Return the names of every unfinished tracked operation grouped by operation type."""
+        types = dict()
+        for name, op in self.latest.items():
+            if op.get("done") is not True:
+                types.setdefault(self._type(name), []).append(name)
+
+        return types
+
+    def _refresh(self):
+        """Fetch fresh state for every unfinished tracked operation."""
+        for typ, names in self._stale().items():
+            if typ is not None and len(names) >= self.list_threshold:
+                listed = {op["name"]: op for op in self.operations.list(type=typ)}
+                for name in names:
+                    if name in listed:
+                        self._track(listed.pop(name))
+                    else:
+                        self._track(self.operations.get(name))
+            else:
+                for name in names:
+                    self._track(self.operations.get(name))
+
+    def as_completed(self):
+        """Yield operations as they complete, raising ``TimeoutError`` when the timeout expires."""
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        retries = 0
+
+        while True:
+            yield from self._harvest()
+            if not self.pending:
+                return
+
+            if retries:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"timed out waiting for operations {sorted(self.pending)}")
+
+                delay = min(self.max_interval, self.interval * (self.backoff ** (retries - 1)))
+                if deadline is not None:
+                    delay = max(0, min(delay, deadline - time.monotonic()))
+                time.sleep(delay)
+
+            retries += 1
+            self._refresh()
+
+    def wait(self):
+        """Block until every operation completes and return them in completion order."""
+        return list(self.as_completed())
+
+
+class OobiResolveItem:
+    """Outcome of one OOBI requested from :meth:`Oobis.resolve_many`.
+
+    Attributes:
+        url (str): OOBI URL.
+        alias (str): Alias the OOBI is stored under, None for none.
+        op (dict): Latest known state of the KERIA resolution operation.
+        error: The exception raised while submitting or waiting, or the
+            ``error`` payload of a failed operation. None on success.
+        skipped (bool): True when the URL was not submitted because it was
+            already resolved under the same alias through this client, or
+            repeated with the same alias earlier in the same request, in which
+            case it shares the earlier item's outcome.
+        started (float): ``time.monotonic()`` when the OOBI was submitted.
+        finished (float): ``time.monotonic()`` when its operation was seen done.
+    """
+
+    def __init__(self, url, alias=None):
+        self.url = url
+        self.alias = alias
+        self.op = None
+        self.error = None
+        self.skipped = False
+        self.started = None
+        self.finished = None
+
+    @property
+    def ok(self):
+        """True when the OOBI is resolved, either now or by an earlier request."""
+        return self.error is None
+
+    @property
+    def elapsed(self):
+        """Seconds from submission until the operation was seen done, None when it was not."""
+        if self.started is None or self.finished is None:
+            return None
+
+        return self.finished - self.started
+
+
+class OobiResolveResult:
+    """Per-OOBI outcomes of one :meth:`Oobis.resolve_many` call, in request order."""
+
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    @property
+    def succeeded(self):
+        """Items whose OOBI is resolved."""
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self):
+        """Items that failed at any stage."""
+        return [item for item in self.items if not item.ok]
+
+
 class Oobis:
     """Resource wrapper for OOBI retrieval and resolution."""
 
@@ -204,25 +595,350 @@ class Oobis:
         res = self.client.post("/oobis", json=body)
         return res.json()
 
+    def resolve_many(self, oobis, *, concurrency=8, timeout=None, force=False):
+        """Resolve many OOBIs with bounded submission concurrency and one shared operation wait.
+
+        Up to ``concurrency`` OOBIs are submitted at a time and the resulting
+        operations are waited on together with one :class:`OperationWaiter`.
+        A URL repeated in ``oobis`` or already resolved through this client
+        under the same alias is not submitted again unless ``force`` is set,
+        a new alias for it is. A failure of one OOBI never stops the others.
+
+        Parameters:
+            oobis (Iterable[str | tuple]): an OOBI URL, or a ``(url, alias)`` pair, per OOBI
+            concurrency (int): maximum number of OOBIs submitted concurrently
+            timeout (float | None): seconds to wait for the operations, items still pending
+                afterwards fail with ``TimeoutError``
+            force (bool): submit OOBIs this client already resolved
+
+        Returns:
+            OobiResolveResult: one :class:`OobiResolveItem` per OOBI in request order
+        """
+        if concurrency < 1:
+            raise ValueError(f"invalid concurrency={concurrency}, must be at least 1")
+
+        items, pending = self._dedupe(oobis, force)
+        if not pending:
+            return OobiResolveResult(items)
+
+        def submit(item):
+            item.started = time.monotonic()
+            try:
+                item.op = self.resolve(item.url, alias=item.alias)
+            except Exception as ex:
+                item.error = ex
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(pending))) as pool:
+            list(pool.map(submit, pending.values()))
+
+        submitted = dict()
+        for item in pending.values():
+            if item.ok:
+                submitted.setdefault(item.op["name"], []).append(item)
+
+        waiter = self.client.operations().waiter([waiting[0].op for waiting in submitted.values()], timeout=timeout)
+        try:
+            for op in waiter:
+                for item in submitted.pop(op["name"]):
+                    self._finish(item, op)
+        except TimeoutError as ex:
+            for name, waiting in submitted.items():
+                for item in waiting:
+                    item.op = waiter.latest[name]
+                    item.error = ex
+
+        return self._result(items, pending)
+
+    def _dedupe(self, oobis, force):
+        """Return every requested item and the items to submit keyed by ``(url, alias)``."""
+        items = [OobiResolveItem(oobi) if isinstance(oobi, str) else OobiResolveItem(*oobi) for oobi in oobis]
+        pending = dict()
+        for item in items:
+            key = (item.url, item.alias)
+            if key in pending or (not force and key in self.client.resolved_oobis):
+                item.skipped = True
+            else:
+                pending[key] = item
+
+        return items, pending
+
+    @staticmethod
+    def _result(items, pending):
+        """Copy the outcome of each submitted OOBI onto its repeats and wrap the items."""
+        for item in items:
+            if item.skipped and (item.url, item.alias) in pending:
+                submitted = pending[(item.url, item.alias)]
+                item.op, item.error = submitted.op, submitted.error
+                item.started, item.finished = submitted.started, submitted.finished
+
+        return OobiResolveResult(items)
+
+    def _finish(self, item, op):
+        """Record the completed resolution operation ``op`` of ``item``."""
+        item.op = op
+        item.finished = time.monotonic()
+        if op.get("error") is not None:
+            item.error = op["error"]
+        else:
+            self.client.resolved_oobis.add((item.url, item.alias))
+
+
+class KeyStateCache:
+    """Bounded, time limited cache of key states keyed by AID prefix.
+
+    Entries expire ``ttl`` seconds after they were fetched and the least
+    recently used prefix is evicted once more than ``size`` are held. Expired
+    entries are kept until replaced so :class:`KeyStateWatcher` can still
+    compare a refreshed state against the last one seen.
+    """
+
+    def __init__(self, ttl=30.0, size=4096, clock=time.monotonic):
+        """Create a key-state cache.
+
+        Parameters:
+            ttl (float): seconds a fetched key state is served before it is refetched
+            size (int): maximum number of prefixes held
+            clock (Callable): monotonic clock returning seconds, mainly for tests
+        """
+        self.ttl = ttl
+        self.size = size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._states = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._states)
+
+    def prefixes(self):
+        """Return every cached prefix, fresh or expired."""
+        with self._lock:
+            return list(self._states)
+
+    def get(self, pre):
+        """Return a copy of the fresh key state of ``pre`` or None when absent or expired."""
+        with self._lock:
+            entry = self._states.get(pre)
+            if entry is None or self.clock() - entry[0] >= self.ttl:
+                self.misses += 1
+                return None
+
+            self._states.move_to_end(pre)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, state):
+        """Cache a key state freshly read from KERIA and return the state it replaced, if any."""
+        with self._lock:
+            old = self._states.pop(state["i"], None)
+            self._states[state["i"]] = (self.clock(), copy.deepcopy(state))
+            while len(self._states) > self.size:
+                self._states.popitem(last=False)
+
+        return old[1] if old is not None else None
+
+    def invalidate(self, pre=None):
+        """Drop the key state of ``pre`` or every key state when ``pre`` is None."""
+        with self._lock:
+            if pre is None:
+                self._states.clear()
+            else:
+                self._states.pop(pre, None)
+
+
+class KeyStateWatcher:
+    """Keep cached key states fresh from a daemon thread and report changes.
+
+    Every ``interval`` seconds the watched prefixes, or every cached prefix
+    when none were given, are refreshed through :meth:`KeyStates.refresh` in
+    bulk requests. ``callback(old, new)`` is called for each prefix whose
+    sequence number or event digest changed. Refresh errors are kept in
+    ``error`` and retried on the next interval, callback errors are kept in
+    ``error`` too and do not stop the watcher.
+    """
+
+    def __init__(self, states, callback, pres=None, interval=10.0):
+        """Create a watcher over a cached key-state resource.
+
+        Parameters:
+            states (KeyStates): key-state resource with a cache
+            callback (Callable): called as ``callback(old, new)`` for every changed key state
+            pres (list | None): prefixes to watch, None watches every cached prefix
+            interval (float): seconds between refresh rounds
+        """
+        self.states = states
+        self.callback = callback
+        self.pres = pres
+        self.interval = interval
+        self.error = None
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def start(self):
+        """Start refreshing in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="signify-key-state-watcher", daemon=True)
+            self._thread.start()
+
+        return self
+
+    def close(self):
+        """Stop refreshing and wait for an in-flight round to finish."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            pres = self.pres if self.pres is not None else self.states.cache.prefixes()
+            try:
+                changes = self.states.refresh(pres)
+            except Exception as ex:
+                self.error = ex
+                continue
+
+            for old, new in changes:
+                try:
+                    self.callback(old, new)
+                except Exception as ex:
+                    self.error = ex
+
 
 class KeyStates:
-    """Resource wrapper for key-state reads and key-state queries."""
+    """Resource wrapper for key-state reads and key-state queries.
 
-    def __init__(self, client: SignifyClient):
-        """Create a key-state resource bound to one Signify client."""
+    With a :class:`KeyStateCache` attached, reads are served from the cache
+    while an entry is fresh and only the missing or expired prefixes are
+    fetched, in one request.
+    """
+
+    def __init__(self, client: SignifyClient, cache=None):
+        """Create a key-state resource bound to one Signify client.
+
+        Parameters:
+            client (SignifyClient): Signify client used to access KERIA key-state endpoints
+            cache (KeyStateCache | None): key-state cache, None disables caching
+        """
         self.client = client
+        self.cache = cache
 
     def get(self, pre):
         """Fetch the current key state for one AID prefix."""
+        if self.cache is not None and (state := self.cache.get(pre)) is not None:
+            return [state]
+
         res = self.client.get(f"/states?pre={pre}")
-        return res.json()
+        return self._remember(res.json())
+
+    def list(self, pres, chunk=40, max_workers=4):
+        """Fetch key states for multiple prefixes.
+
+        Repeated prefixes are fetched once. Large prefix sets are split into
+        requests of at most ``chunk`` prefixes, which keeps the query string of
+        44 character prefixes under 2KB, and the chunks are fetched
+        concurrently.
+
+        Parameters:
+            pres (list): prefixes to fetch
+            chunk (int): maximum prefixes per request
+            max_workers (int): maximum requests in flight
 
-    def list(self, pres):
-        """Fetch key states for multiple prefixes in one request."""
+        Returns:
+            list: key states in the order of ``pres``, prefixes unknown to the agent are left out
+        """
+        pres = list(dict.fromkeys(pres))
+        if self.cache is None:
+            return self._fetch(pres, chunk, max_workers)
+
+        cached, missing = self._cached(pres)
+        if missing:
+            cached.update((state["i"], state) for state in self._remember(self._fetch(missing, chunk, max_workers)))
+
+        return [cached[pre] for pre in pres if pre in cached]
+
+    def refresh(self, pres, chunk=40, max_workers=4):
+        """Refetch key states for ``pres`` into the cache, ignoring freshness.
+
+        Parameters:
+            pres (list): prefixes to refresh
+            chunk (int): maximum prefixes per request
+            max_workers (int): maximum requests in flight
+
+        Returns:
+            list: ``(old, new)`` pairs for every prefix whose ``s`` or ``d`` changed,
+            ``old`` is None for prefixes not cached before
+        """
+        if self.cache is None:
+            raise ValueError("refreshing key states requires a key-state cache")
+
+        return self._replace(self._fetch(list(dict.fromkeys(pres)), chunk, max_workers))
+
+    def watch(self, callback, pres=None, interval=10.0):
+        """Start and return a :class:`KeyStateWatcher` refreshing the cache in the background."""
+        if self.cache is None:
+            raise ValueError("refreshing key states requires a key-state cache")
+
+        return KeyStateWatcher(self, callback, pres=pres, interval=interval).start()
+
+    def _fetch(self, pres, chunk=40, max_workers=4):
+        """Fetch ``pres`` in chunks of at most ``chunk`` prefixes and merge the states in input order."""
+        chunks = [pres[i:i + chunk] for i in range(0, len(pres), chunk)]
+        if len(chunks) <= 1 or max_workers <= 1:
+            pages = [self._fetchChunk(part) for part in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                pages = list(pool.map(self._fetchChunk, chunks))
+
+        return self._merge(pres, pages)
+
+    def _fetchChunk(self, pres):
         args = "&".join([f"pre={pre}" for pre in pres])
         res = self.client.get(f"/states?{args}")
         return res.json()
 
+    @staticmethod
+    def _merge(pres, pages):
+        """Flatten chunk responses into one state per prefix, ordered like ``pres``."""
+        states = {state["i"]: state for page in pages for state in page}
+        return [states[pre] for pre in pres if pre in states]
+
+    def _cached(self, pres):
+        """Split ``pres`` into a dict of fresh cached states and a list of prefixes to fetch."""
+        cached, missing = dict(), []
+        for pre in dict.fromkeys(pres):
+            state = self.cache.get(pre)
+            if state is None:
+                missing.append(pre)
+            else:
+                cached[pre] = state
+
+        return cached, missing
+
+    def _replace(self, states):
+        """Cache ``states`` and return ``(old, new)`` pairs for those whose ``s`` or ``d`` changed."""
+        changes = []
+        for state in states:
+            old = self.cache.put(state)
+            if old is None or (old["s"], old["d"]) != (state["s"], state["d"]):
+                changes.append((old, state))
+
+        return changes
+
+    def _remember(self, states):
+        if self.cache is not None:
+            for state in states:
+                self.cache.put(state)
+
+        return states
+
     def query(self, pre, sn=None, anchor=None):
         """Submit a key-state query with optional sequence or anchor hints."""
         body = dict(
@@ -251,6 +967,24 @@ class KeyEvents:
         res = self.client.get(f"/events?pre={pre}")
         return res.json()
 
+    def verify(self, pre, verifier):
+        """Fetch the KEL of ``pre`` and of its delegation chain and verify them locally.
+
+        Parameters:
+            pre (str): qb64 AID prefix
+            verifier (KelVerifier): verifier holding the checkpoints of earlier verifications
+
+        Returns:
+            dict: key state of ``pre`` derived from its verified KEL
+        """
+        kels = dict()
+        delpre = pre
+        while delpre and delpre not in kels:
+            kels[delpre] = self.get(delpre)
+            delpre = kels[delpre][0]["ked"].get("di") if kels[delpre] else None
+
+        return verifier.verify(pre, kels.pop(pre), delegators=kels)
+
 
 class Config:
     """Resource wrapper for reading agent configuration exposed by KERIA."""
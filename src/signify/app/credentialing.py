@@ -20,6 +20,7 @@ Rule of thumb:
 - use :class:`Registries` when the operation is about the VDR registry itself.
 """
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 from keri.core import coring, counting, serdering
 from keri.core.eventing import TraitDex, interact
@@ -68,18 +69,27 @@ class CredentialIssueResult:
         anc: The KEL anchoring interaction serder.
         sigs (list[str]): Signatures over ``anc`` from the local keeper.
         response: Raw HTTP response object returned by the issuance submission.
+        error: The exception that stopped this credential in
+            :meth:`Credentials.issue_many`, None on success. Material that was
+            not built before the failure is None.
 
     ``CredentialIssueResult`` is the maintained return shape for
     :meth:`Credentials.issue`. It remains iterable for transition safety so
     older tuple-unpacking call sites can migrate gradually.
     """
 
-    def __init__(self, acdc, iss, anc, sigs, response):
+    def __init__(self, acdc, iss, anc, sigs, response, error=None):
         self.acdc = acdc
         self.iss = iss
         self.anc = anc
         self.sigs = sigs
         self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        """True when the issuance was submitted."""
+        return self.error is None
 
     def op(self):
         """Return the decoded operation payload from the stored response."""
@@ -102,17 +112,28 @@ class CredentialRevokeResult:
         anc: The KEL anchoring interaction serder for the revoke event.
         sigs (list[str]): Signatures over ``anc`` from the local keeper.
         response: Raw HTTP response object returned by the revoke submission.
+        said (str): SAID of the revoked credential.
+        error: The exception that stopped this revocation in
+            :meth:`Credentials.revoke_many`, None on success. Material that
+            was not built before the failure is None.
 
     ``CredentialRevokeResult`` is the maintained return shape for
     :meth:`Credentials.revoke`. It remains iterable for transition safety so
     older tuple-unpacking call sites can migrate gradually.
     """
 
-    def __init__(self, rev, anc, sigs, response):
+    def __init__(self, rev, anc, sigs, response, said=None, error=None):
         self.rev = rev
         self.anc = anc
         self.sigs = sigs
         self.response = response
+        self.said = said
+        self.error = error
+
+    @property
+    def ok(self):
+        """True when the revocation was submitted."""
+        return self.error is None
 
     def op(self):
         """Return the decoded operation payload from the stored response."""
@@ -126,6 +147,51 @@ class CredentialRevokeResult:
         yield self.op()
 
 
+class CredentialBatchResult:
+    """Wrapper for credentials issued or revoked together in anchored chunks.
+
+    Returned by :meth:`Credentials.issue_many` and
+    :meth:`Credentials.revoke_many`.
+
+    Attributes:
+        results (list): One ``CredentialIssueResult`` or
+            ``CredentialRevokeResult`` per requested credential, in request
+            order. Credentials in the same chunk share the same ``anc``
+            interaction event. A failure is recorded on the ``error`` of each
+            credential it affects and does not stop the rest of the batch.
+        anchors (list): The KEL anchoring interaction serders, one per
+            accepted chunk.
+        responses (list): Raw HTTP responses of the anchoring submissions,
+            one per accepted chunk.
+    """
+
+    def __init__(self, results, anchors, responses):
+        self.results = results
+        self.anchors = anchors
+        self.responses = responses
+
+    def ops(self):
+        """Return the decoded anchoring operation payload for every chunk."""
+        return [response.json() for response in self.responses]
+
+    def __len__(self):
+        return len(self.results)
+
+    def __iter__(self):
+        """Yield the per-credential results in request order."""
+        yield from self.results
+
+    @property
+    def succeeded(self):
+        """Results of the credentials that were submitted."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self):
+        """Results of the credentials that failed at any stage."""
+        return [result for result in self.results if not result.ok]
+
+
 class Registries:
     """Resource wrapper for registry lifecycle operations under one identifier.
 
@@ -220,23 +286,35 @@ class Registries:
             name = target
             if registryName is None:
                 raise TypeError("registryName is required")
-            hab = self.client.identifiers().get(name)
-            if estOnly is None:
-                state_traits = hab["state"].get("c", [])
-                estOnly = TraitDex.EstOnly in state_traits or "EO" in state_traits
-            if estOnly:
-                raise NotImplementedError("establishment only not implemented")
-        else:
-            hab = target
-            if registryName is None:
-                raise TypeError("registryName is required")
-            name = hab["name"]
-            if estOnly is None:
-                estOnly = False
+            identifiers = self.client.identifiers()
+            with identifiers.sequence(name):
+                hab = identifiers.get(name)
+                if estOnly is None:
+                    state_traits = hab["state"].get("c", [])
+                    estOnly = TraitDex.EstOnly in state_traits or "EO" in state_traits
+                if estOnly:
+                    raise NotImplementedError("establishment only not implemented")
+
+                return self._create_result(
+                    hab=hab,
+                    name=name,
+                    registryName=registryName,
+                    noBackers=noBackers,
+                    estOnly=estOnly,
+                    baks=baks,
+                    toad=toad,
+                    nonce=nonce,
+                )
+
+        hab = target
+        if registryName is None:
+            raise TypeError("registryName is required")
+        if estOnly is None:
+            estOnly = False
 
         return self._create_result(
             hab=hab,
-            name=name,
+            name=hab["name"],
             registryName=registryName,
             noBackers=noBackers,
             estOnly=estOnly,
@@ -270,26 +348,35 @@ class Registries:
             code=coring.MtrDex.Blake3_256,
         )
 
-        state = hab["state"]
-        sn = int(state["s"], 16)
-        dig = state["d"]
+        identifiers = self.client.identifiers()
+        with identifiers.sequence(name):
+            state = hab["state"]
+            sn = int(state["s"], 16)
+            dig = state["d"]
 
-        rseal = dict(i=regser.pre, s="0", d=regser.pre)
-        data = [rseal]
+            rseal = dict(i=regser.pre, s="0", d=regser.pre)
+            data = [rseal]
 
-        serder = interact(pre, sn=sn + 1, data=data, dig=dig)
+            serder = interact(pre, sn=sn + 1, data=data, dig=dig)
 
-        keeper = self.client.manager.get(aid=hab)
-        sigs = keeper.sign(ser=serder.raw)
+            keeper = self.client.manager.get(aid=hab)
+            sigs = keeper.sign(ser=serder.raw)
+
+            try:
+                response = self._submit_registry_events(
+                    hab=hab,
+                    name=name,
+                    registryName=registryName,
+                    vcp=regser.ked,
+                    ixn=serder.ked,
+                    sigs=sigs,
+                )
+            except Exception:
+                identifiers.invalidate(name)
+                raise
+
+            identifiers.advance(name, serder)
 
-        response = self._submit_registry_events(
-            hab=hab,
-            name=name,
-            registryName=registryName,
-            vcp=regser.ked,
-            ixn=serder.ked,
-            sigs=sigs,
-        )
         return RegistryResult(regser=regser, serder=serder, sigs=sigs, response=response)
 
     @staticmethod
@@ -470,6 +557,49 @@ class Credentials:
         res = self.client.post(f"/credentials/query", json=body)
         return res.json()
 
+    def iter(self, filter=None, sort=None, page_size=25, prefetch=True):
+        """Yield every credential matching ``filter``, paging through ``/credentials/query``.
+
+        Parameters:
+            filter (dict | None): Credential filter dict as accepted by :meth:`list`.
+            sort (list | None): SAD path sort expressions sent unchanged with every page.
+            page_size (int): Number of credentials requested per page.
+            prefetch (bool): Fetch the next page on a worker thread while the
+                current one is consumed.
+
+        Returns:
+            Iterator[dict]: Decoded credential records in query order.
+
+        At most two pages are held in memory, and abandoning the generator
+        stops further queries. Paging uses ``skip`` offsets, so the order is
+        only stable while no matching credentials are added or removed.
+        """
+        if page_size < 1:
+            raise ValueError(f"invalid page_size={page_size}, must be at least 1")
+
+        pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            skip = 0
+            page = self.list(filter=filter, sort=sort, skip=skip, limit=page_size)
+            while page:
+                skip += len(page)
+                full = len(page) >= page_size
+                ahead = None
+                if full and pool is not None:
+                    ahead = pool.submit(self.list, filter=filter, sort=sort, skip=skip, limit=page_size)
+
+                yield from page
+                if not full:
+                    return
+
+                if ahead is not None:
+                    page = ahead.result()
+                else:
+                    page = self.list(filter=filter, sort=sort, skip=skip, limit=page_size)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
     def export(self, said):
         """Compatibility alias for CESR retrieval.
 
@@ -568,19 +698,29 @@ class Credentials:
         habitat and registry by name, builds the ACDC, issuance event, and
         anchoring interaction locally, then submits those events to KERIA.
         """
-        hab = self.client.identifiers().get(name)
+        identifiers = self.client.identifiers()
         registry = self.client.registries().get(name, registryName)
-        return self._issue_result(
-            hab=hab,
-            registry=registry,
-            data=data,
-            schema=schema,
-            recipient=recipient,
-            edges=edges,
-            rules=rules,
-            private=private,
-            timestamp=timestamp,
-        )
+        with identifiers.sequence(name):
+            hab = identifiers.getCached(name)
+            try:
+                result = self._issue_result(
+                    hab=hab,
+                    registry=registry,
+                    data=data,
+                    schema=schema,
+                    recipient=recipient,
+                    edges=edges,
+                    rules=rules,
+                    private=private,
+                    timestamp=timestamp,
+                )
+            except Exception:
+                identifiers.invalidate(name)
+                raise
+
+            identifiers.advance(name, result.anc)
+
+        return result
 
     def create(self, hab, registry, data, schema, recipient=None, edges=None, rules=None, private=False,
                timestamp=None):
@@ -665,6 +805,218 @@ class Credentials:
         """
         return self._revoke_result(name=name, said=said, timestamp=timestamp)
 
+    def issue_many(self, name, registryName, items, *, chunk_size=None):
+        """Issue many credentials anchored by as few interaction events as possible.
+
+        Parameters:
+            name (str): Identifier alias used as the issuer.
+            registryName (str): Registry alias under the identifier.
+            items (list[dict]): One mapping per credential holding the keyword
+                arguments of :meth:`issue`: ``data`` and ``schema`` plus the
+                optional ``recipient``, ``edges``, ``rules``, ``private`` and
+                ``timestamp``.
+            chunk_size (int | None): Maximum number of issuance events sealed by
+                one interaction event. ``None`` anchors every item in a single
+                event.
+
+        Returns:
+            CredentialBatchResult: per-credential results plus one anchoring
+                operation per accepted chunk.
+
+        Each chunk is anchored by one ``ixn`` submitted through the identifier
+        events endpoint, so N credentials cost ``ceil(N / chunk_size)`` KEL
+        events and witness receipt rounds instead of N. Every credential is
+        then submitted with that shared ``ixn``, which KERIA accepts as a
+        duplicate of the already accepted event.
+
+        A credential that fails to build or submit, or whose chunk fails to
+        anchor, gets the exception as its ``error`` and the batch goes on.
+        After a failed anchoring the next chunk is built on the identifier
+        state read back from KERIA.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"invalid chunk_size={chunk_size}, must be at least 1")
+
+        items = list(items)
+        identifiers = self.client.identifiers()
+        registry = self.client.registries().get(name, registryName)
+        size = len(items) if chunk_size is None else chunk_size
+
+        results = [None] * len(items)
+        anchors = []
+        responses = []
+        with identifiers.sequence(name):
+            hab = identifiers.getCached(name)
+            sn = int(hab["state"]["s"], 16)
+            dig = hab["state"]["d"]
+
+            for start in range(0, len(items), size):
+                events = []
+                for idx in range(start, min(start + size, len(items))):
+                    try:
+                        creder, iserder = self._build_credential_events(registry=registry, **items[idx])
+                    except Exception as ex:
+                        results[idx] = CredentialIssueResult(acdc=None, iss=None, anc=None, sigs=None, response=None,
+                                                             error=ex)
+                        continue
+                    events.append((idx, creder, iserder))
+
+                if not events:
+                    continue
+
+                try:
+                    anc, sigs, response = self._anchor_chunk(identifiers, name, hab,
+                                                             [iserder for _, _, iserder in events], sn + 1, dig)
+                except Exception as ex:
+                    for idx, creder, iserder in events:
+                        results[idx] = CredentialIssueResult(acdc=creder, iss=iserder, anc=None, sigs=None,
+                                                             response=None, error=ex)
+                    try:
+                        hab, sn, dig = self._reload(identifiers, name)
+                    except Exception as ex:
+                        results = [result or CredentialIssueResult(acdc=None, iss=None, anc=None, sigs=None,
+                                                                   response=None, error=ex)
+                                   for result in results]
+                        break
+                    continue
+
+                sn += 1
+                dig = anc.said
+                responses.append(response)
+                anchors.append(anc)
+
+                for idx, creder, iserder in events:
+                    result = CredentialIssueResult(acdc=creder, iss=iserder, anc=anc, sigs=sigs, response=None)
+                    try:
+                        result.response = self.create_from_events(hab=hab, creder=creder.sad, iss=iserder.sad,
+                                                                  anc=anc.sad, sigs=sigs)
+                    except Exception as ex:
+                        result.error = ex
+                    results[idx] = result
+
+        return CredentialBatchResult(results=results, anchors=anchors, responses=responses)
+
+    def revoke_many(self, name, saids, *, chunk_size=None, max_workers=8, timestamp=None):
+        """Revoke many credentials anchored by as few interaction events as possible.
+
+        Parameters:
+            name (str): Identifier alias used as the revoking issuer.
+            saids (list[str]): SAIDs of the credentials to revoke.
+            chunk_size (int | None): Maximum number of revocation events sealed
+                by one interaction event. ``None`` anchors every revocation in
+                a single event.
+            max_workers (int): Maximum number of concurrent credential reads
+                and revocation submissions.
+            timestamp (str | None): Optional revoke timestamp override shared
+                by every revocation.
+
+        Returns:
+            CredentialBatchResult: one result per SAID, in request order, plus
+                one anchoring operation per accepted chunk.
+
+        Credential statuses are fetched concurrently and every ``rev`` event
+        is built locally. Each chunk is anchored by one ``ixn`` submitted
+        through the identifier events endpoint before its revocations are
+        submitted concurrently with that shared ``ixn``.
+
+        A SAID whose credential read, revocation build or submission fails,
+        or whose chunk fails to anchor, gets the exception as the ``error``
+        of its result and the batch goes on, so ``succeeded`` lists exactly
+        the revocations KERIA accepted. After a failed anchoring the next
+        chunk is built on the identifier state read back from KERIA.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"invalid chunk_size={chunk_size}, must be at least 1")
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        saids = list(saids)
+        identifiers = self.client.identifiers()
+        dt = timestamp or helping.nowIso8601()
+        size = len(saids) if chunk_size is None else chunk_size
+
+        def build(said):
+            try:
+                return self._build_revoke_event(credential=self.get(said), said=said, dt=dt), None
+            except Exception as ex:
+                return None, ex
+
+        results = [None] * len(saids)
+        anchors = []
+        responses = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pending = []
+            for idx, (rserder, error) in enumerate(pool.map(build, saids)):
+                if error is not None:
+                    results[idx] = CredentialRevokeResult(rev=None, anc=None, sigs=None, response=None,
+                                                          said=saids[idx], error=error)
+                else:
+                    pending.append((idx, rserder))
+
+            with identifiers.sequence(name):
+                hab = identifiers.getCached(name)
+                sn = int(hab["state"]["s"], 16)
+                dig = hab["state"]["d"]
+
+                keeper = self.client.manager.get(aid=hab)
+                for start in range(0, len(pending), size):
+                    chunk = pending[start:start + size]
+
+                    try:
+                        anc, sigs, response = self._anchor_chunk(identifiers, name, hab,
+                                                                 [rserder for _, rserder in chunk], sn + 1, dig)
+                    except Exception as ex:
+                        for idx, rserder in chunk:
+                            results[idx] = CredentialRevokeResult(rev=rserder, anc=None, sigs=None, response=None,
+                                                                  said=saids[idx], error=ex)
+                        try:
+                            hab, sn, dig = self._reload(identifiers, name)
+                        except Exception as ex:
+                            results = [result or CredentialRevokeResult(rev=None, anc=None, sigs=None,
+                                                                        response=None, said=said, error=ex)
+                                       for said, result in zip(saids, results)]
+                            break
+                        continue
+
+                    sn += 1
+                    dig = anc.said
+                    responses.append(response)
+                    anchors.append(anc)
+
+                    def submit(item):
+                        idx, rserder = item
+                        said = saids[idx]
+                        result = CredentialRevokeResult(rev=rserder, anc=anc, sigs=sigs, response=None, said=said)
+                        body = dict(rev=rserder.ked, ixn=anc.ked, sigs=sigs)
+                        body[keeper.algo] = keeper.params()
+                        try:
+                            result.response = self.client.delete(f"/identifiers/{name}/credentials/{said}",
+                                                                 body=body)
+                        except Exception as ex:
+                            result.error = ex
+                        return idx, result
+
+                    for idx, result in pool.map(submit, chunk):
+                        results[idx] = result
+
+        return CredentialBatchResult(results=results, anchors=anchors, responses=responses)
+
+    def _anchor_chunk(self, identifiers, name, hab, serders, sn, dig):
+        """Anchor ``serders`` with one interaction event at ``sn`` and submit it through the events endpoint."""
+        anc, sigs = self._anchor_tel_events(hab=hab, serders=serders, sn=sn, dig=dig)
+
+        keeper = self.client.manager.get(aid=hab)
+        body = dict(ixn=anc.ked, sigs=sigs)
+        body[keeper.algo] = keeper.params()
+        return anc, sigs, identifiers.postEvent(name, f"/identifiers/{name}/events", body, anc)
+
+    @staticmethod
+    def _reload(identifiers, name):
+        """Read the state of ``name`` back from KERIA after an anchoring with an unknown outcome."""
+        identifiers.invalidate(name)
+        hab = identifiers.getCached(name)
+        return hab, int(hab["state"]["s"], 16), hab["state"]["d"]
+
     def _issue_result(
         self,
         *,
@@ -717,7 +1069,34 @@ class Credentials:
         private=False,
         timestamp=None,
     ):
-        pre = hab["prefix"]
+        creder, iserder = self._build_credential_events(
+            registry=registry,
+            data=data,
+            schema=schema,
+            recipient=recipient,
+            edges=edges,
+            rules=rules,
+            private=private,
+            timestamp=timestamp,
+        )
+
+        state = hab["state"]
+        anc, sigs = self._anchor_tel_events(hab=hab, serders=[iserder], sn=int(state["s"], 16) + 1, dig=state["d"])
+        return creder, iserder, anc, sigs
+
+    @staticmethod
+    def _build_credential_events(
+        *,
+        registry,
+        data,
+        schema,
+        recipient=None,
+        edges=None,
+        rules=None,
+        private=False,
+        timestamp=None,
+    ):
+        """Build one ACDC and its TEL issuance event without anchoring them."""
         recp = recipient if recipient is not None else None
         body_data = dict(data)
         if timestamp is not None:
@@ -748,50 +1127,72 @@ class Credentials:
             regd = registry['state']['d']
             iserder = eventing.backerIssue(vcdig=creder.said, regk=regk, regsn=regi, regd=regd, dt=dt)
 
-        vcid = iserder.ked["i"]
-        rseq = coring.Seqner(snh=iserder.ked["s"])
-        rseal = eventing.SealEvent(vcid, rseq.snh, iserder.said)
-        anchor_data = [dict(i=rseal.i, s=rseal.s, d=rseal.d)]
+        return creder, iserder
 
-        state = hab["state"]
-        sn = int(state["s"], 16)
-        dig = state["d"]
-        anc = interact(pre, sn=sn + 1, data=anchor_data, dig=dig)
+    def _anchor_tel_events(self, *, hab, serders, sn, dig):
+        """Build and sign one interaction event at ``sn`` sealing every TEL event in ``serders``."""
+        anchor_data = []
+        for serder in serders:
+            rseq = coring.Seqner(snh=serder.ked["s"])
+            rseal = eventing.SealEvent(serder.ked["i"], rseq.snh, serder.said)
+            anchor_data.append(dict(i=rseal.i, s=rseal.s, d=rseal.d))
+
+        anc = interact(hab["prefix"], sn=sn, data=anchor_data, dig=dig)
 
         keeper = self.client.manager.get(aid=hab)
         sigs = keeper.sign(ser=anc.raw)
-        return creder, iserder, anc, sigs
+        return anc, sigs
 
     def _revoke_result(self, *, name, said, timestamp=None):
-        hab, rserder, anc, sigs = self._build_revoke_artifacts(
-            name=name,
-            said=said,
-            timestamp=timestamp,
-        )
-        keeper = self.client.manager.get(aid=hab)
-        body = dict(
-            rev=rserder.ked,
-            ixn=anc.ked,
-            sigs=sigs,
-        )
-        body[keeper.algo] = keeper.params()
-        response = self.client.delete(
-            f"/identifiers/{name}/credentials/{said}",
-            body=body,
-        )
+        identifiers = self.client.identifiers()
+        with identifiers.sequence(name):
+            hab, rserder, anc, sigs = self._build_revoke_artifacts(
+                name=name,
+                said=said,
+                timestamp=timestamp,
+            )
+            keeper = self.client.manager.get(aid=hab)
+            body = dict(
+                rev=rserder.ked,
+                ixn=anc.ked,
+                sigs=sigs,
+            )
+            body[keeper.algo] = keeper.params()
+            try:
+                response = self.client.delete(
+                    f"/identifiers/{name}/credentials/{said}",
+                    body=body,
+                )
+            except Exception:
+                identifiers.invalidate(name)
+                raise
+
+            identifiers.advance(name, anc)
+
         return CredentialRevokeResult(
             rev=rserder,
             anc=anc,
             sigs=sigs,
             response=response,
+            said=said,
         )
 
     def _build_revoke_artifacts(self, *, name, said, timestamp=None):
-        hab = self.client.identifiers().get(name)
-        pre = hab["prefix"]
-        dt = timestamp or helping.nowIso8601()
-
+        hab = self.client.identifiers().getCached(name)
         credential = self.get(said)
+        return self._make_revoke_artifacts(hab=hab, credential=credential, said=said, timestamp=timestamp)
+
+    def _make_revoke_artifacts(self, *, hab, credential, said, timestamp=None):
+        """Build the revoke event and signed anchoring interaction from already fetched state."""
+        rserder = self._build_revoke_event(credential=credential, said=said, dt=timestamp or helping.nowIso8601())
+
+        state = hab["state"]
+        anc, sigs = self._anchor_tel_events(hab=hab, serders=[rserder], sn=int(state["s"], 16) + 1, dig=state["d"])
+        return hab, rserder, anc, sigs
+
+    @staticmethod
+    def _build_revoke_event(*, credential, said, dt):
+        """Build the TEL revocation event for one fetched credential."""
         sad = credential["sad"]
         status = credential["status"]
 
@@ -802,23 +1203,13 @@ class Credentials:
         else:
             raise ValueError("credential is missing registry reference ri/rd")
 
-        rserder = eventing.revoke(
+        return eventing.revoke(
             vcdig=said,
             regk=registry_said,
             dig=status["d"],
             dt=dt,
         )
 
-        state = hab["state"]
-        sn = int(state["s"], 16)
-        dig = state["d"]
-        anchor = dict(i=rserder.ked["i"], s=rserder.ked["s"], d=rserder.said)
-        anc = interact(pre, sn=sn + 1, data=[anchor], dig=dig)
-
-        keeper = self.client.manager.get(aid=hab)
-        sigs = keeper.sign(ser=anc.raw)
-        return hab, rserder, anc, sigs
-
 
 class Ipex:
     """Resource wrapper for IPEX credential conversation and presentation.
@@ -860,7 +1251,7 @@ class Ipex:
 
     def _hab(self, name):
         """Resolve one identifier habitat for the maintained name-based API."""
-        return self.client.identifiers().get(name)
+        return self.client.identifiers().getCached(name)
 
     @staticmethod
     def _said(value):
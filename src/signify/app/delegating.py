@@ -32,16 +32,69 @@ class Delegations:
             created interaction event, `sigs` are the signatures over that
             event, and `operation` is the long-running KERIA response payload.
         """
-        hab = self.client.identifiers().get(name)
+        identifiers = self.client.identifiers()
+        with identifiers.sequence(name):
+            return self._approve(identifiers, name, [anchor])
+
+    def approve_many(self, name, anchors, *, chunk=32, wait=True, timeout=None):
+        """Approve many delegated events with as few interaction events as possible.
+
+        The anchors are split into chunks of at most ``chunk`` seals and each
+        chunk is anchored by one interaction event, built on the previous one
+        while the delegator's event sequence is held, so no other event of the
+        delegator can interleave. The resulting operations are then waited on
+        together with one :class:`~signify.app.coring.OperationWaiter`.
+
+        KERIA starts one delegation operation per interaction event and
+        tracks it for the delegate of the event's first seal only. A
+        completed operation therefore confirms that the approving event was
+        accepted, not that every delegation it anchors completed. Each
+        delegate confirms its own delegated event by waiting on the operation
+        of its own inception or rotation.
+
+        Parameters:
+            name (str): Human-readable identifier name or alias of the
+                delegator that will approve the delegations.
+            anchors (list[dict]): Anchor data of each delegated event.
+            chunk (int): Maximum number of anchors per interaction event.
+            wait (bool): Wait for the operation of every interaction event to
+                complete.
+            timeout (float | None): Seconds to wait for the operations before
+                ``TimeoutError`` is raised.
+
+        Returns:
+            list: one `(serder, sigs, operation)` tuple per interaction event,
+            in chunk order, with the completed operation when ``wait`` is set.
+            The seals an event anchors are ``serder.ked["a"]``.
+        """
+        if chunk < 1:
+            raise ValueError(f"invalid chunk={chunk}, must be at least 1")
+
+        identifiers = self.client.identifiers()
+        with identifiers.sequence(name):
+            approvals = [self._approve(identifiers, name, anchors[i:i + chunk])
+                         for i in range(0, len(anchors), chunk)]
+
+        if wait and approvals:
+            waiter = self.client.operations().waiter([op for _, _, op in approvals], timeout=timeout)
+            done = {op["name"]: op for op in waiter}
+            approvals = [(serder, sigs, done[op["name"]]) for serder, sigs, op in approvals]
+
+        return approvals
+
+    def _approve(self, identifiers, name, anchors):
+        """Build, sign and submit one interaction event anchoring ``anchors``. Hold the sequence of ``name``."""
+        hab = identifiers.getCached(name)
         state = hab["state"]
         sn = int(state["s"], 16)
         dig = state["d"]
         # Delegation approval is a normal ixn anchored to the delegator's
-        # current event state, with the delegate inception embedded as data.
-        serder = eventing.interact(pre=hab["prefix"], sn=sn + 1, data=[anchor], dig=dig)
+        # current event state, with the delegate events embedded as data.
+        serder = eventing.interact(pre=hab["prefix"], sn=sn + 1, data=anchors, dig=dig)
         keeper = self.client.manager.get(aid=hab)
         sigs = keeper.sign(ser=serder.raw)
         body = dict(ixn=serder.ked, sigs=sigs)
         body[keeper.algo] = keeper.params()
-        res = self.client.post(f"/identifiers/{name}/delegation", json=body)
+        res = identifiers.postEvent(name, f"/identifiers/{name}/delegation", body, serder)
+
         return serder, sigs, res.json()
@@ -5,6 +5,6 @@ This thin shim keeps the public client surface under ``signify.app`` while the
 peer module remains the implementation spine.
 """
 
-from signify.peer.exchanging import Exchanges
+from signify.peer.exchanging import ExchangeSendError, Exchanges
 
-__all__ = ["Exchanges"]
+__all__ = ["ExchangeSendError", "Exchanges"]
@@ -2,22 +2,32 @@
 """Schema read helpers for SignifyPy."""
 
 from signify.app.clienting import SignifyClient
+from signify.core.caching import verifySchema
 
 
 class Schemas:
     """Resource wrapper for schema read operations."""
 
-    def __init__(self, client: SignifyClient):
+    def __init__(self, client: SignifyClient, cache=None):
         """Create a schemas resource bound to one Signify client.
 
         Parameters:
             client (SignifyClient): Signify client used to access KERIA schema
                 endpoints.
+            cache (SaidCache | None): SAID cache consulted before fetching a
+                schema, None disables caching.
         """
         self.client = client
+        self.cache = cache
 
     def get(self, said):
-        """Fetch one schema by SAID."""
+        """Fetch one schema by SAID, from the SAID cache when it holds it."""
+        if self.cache is not None:
+            return self.cache.getJson(said, lambda: self._fetch(said), verifySchema)
+
+        return self._fetch(said)
+
+    def _fetch(self, said):
         res = self.client.get(f"/schema/{said}")
         return res.json()
 
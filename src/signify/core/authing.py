@@ -4,6 +4,9 @@ SIGNIFY
 signify.core.authing module
 
 """
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote, urlparse
 
 from keri import kering
@@ -56,7 +59,7 @@ class Controller:
     """
     Controller class representing a Signify controller Client AID (caid) that delegates to a KERIA Agent AID.
     """
-    def __init__(self, bran, tier, state=None):
+    def __init__(self, bran, tier, state=None, executor=None):
         """
         Create a Controller instance. Stretches the passcode to create a qb64 salt for the controller and then creates
         the controller's signing and next signing keys. If state is provided, the controller is created from the state.
@@ -65,6 +68,7 @@ class Controller:
             bran (str | bytes): passcode for the controller
             tier (str): tier of the controller
             state (dict): controller inception event state
+            executor (DerivationExecutor): optional executor for the key stretching of controller and AID keys
 
         Attributes:
             bran (str | bytes): qb64 salt for the controller
@@ -83,12 +87,14 @@ class Controller:
         self.bran = coring.MtrDex.Salt_128 + 'A' + bran[:21]  # qb64 salt for seed
         self.stem = "signify:controller"
         self.tier = tier
+        self.executor = executor
 
         self.salter = signing.Salter(qb64=self.bran)
         creator = keeping.SaltyCreator(salt=self.salter.qb64, stem=self.stem, tier=tier)
 
-        self.signer = creator.create(ridx=0, tier=tier).pop()
-        self.nsigner = creator.create(ridx=0 + 1, tier=tier).pop()
+        signers, nsigners = self._create((creator, dict(ridx=0, tier=tier)), (creator, dict(ridx=0 + 1, tier=tier)))
+        self.signer = signers.pop()
+        self.nsigner = nsigners.pop()
 
         self.keys = [self.signer.verfer.qb64]
         self.ndigs = [coring.Diger(ser=self.nsigner.verfer.qb64b).qb64]
@@ -99,6 +105,29 @@ class Controller:
     def pre(self):
         return self.serder.pre
 
+    def _create(self, *requests):
+        """Derive the signers of each ``(creator, kwargs)`` request, on the executor if any."""
+        if self.executor is None:
+            return [creator.create(**kwargs) for creator, kwargs in requests]
+
+        return self.executor.createMany(requests)
+
+    def rebind(self, state):
+        """Bind this controller to state fetched from KERIA without re-deriving its signers.
+
+        The signer and next signer only depend on the passcode, stem and tier,
+        so a controller created before ``connect()`` can adopt the server state
+        instead of stretching the passcode a second time.
+
+        Parameters:
+            state (dict | SignifyState): controller state as accepted by ``derive``
+
+        Returns:
+            Controller: this controller, bound to ``state``
+        """
+        self.serder = self.derive(state)
+        return self
+
     def event(self):
         siger = self.signer.sign(ser=self.serder.raw, index=0)
         return self.serder, siger
@@ -176,19 +205,33 @@ class Controller:
 
         """
 
+        rotation = PasscodeRotation(self, nbran)
+        rotation.recrypt(aids)
+        return rotation.finish()
+
+    def _recrypters(self):
+        """Return the encrypter and decrypter used to re-encrypt AID key material during a passcode rotation."""
+        nsigner = self.salter.signer(transferable=False)
+        encrypter = signing.Encrypter(verkey=nsigner.verfer.qb64)  # encrypter for new salt
+        decrypter = signing.Decrypter(seed=nsigner.qb64)  # decrypter with old salt
+        return encrypter, decrypter
+
+    def _rotateKeys(self, nbran, encrypter):
+        """Rotate the controller AID to the keys of ``nbran`` and return the signed rotation and saved old salt."""
         # First we create the new salter and then use it to encrypted the OLD salt
         nbran = coring.MtrDex.Salt_128 + 'A' + nbran[:21]  # qb64 salt for seed
         nsalter = signing.Salter(qb64=nbran)
-        nsigner = self.salter.signer(transferable=False)
 
         # This is the previous next signer so it will be used to sign the rotation and then have 0 signing authority
         #here
         creator = keeping.SaltyCreator(salt=self.salter.qb64, stem=self.stem, tier=self.tier)
-        signer = creator.create(ridx=0 + 1, tier=self.tier).pop()
-
         ncreator = keeping.SaltyCreator(salt=nsalter.qb64, stem=self.stem, tier=self.tier)
-        self.signer = ncreator.create(ridx=0, tier=self.tier).pop()
-        self.nsigner = ncreator.create(ridx=0 + 1, tier=self.tier).pop()
+        signers, csigners, nsigners = self._create((creator, dict(ridx=0 + 1, tier=self.tier)),
+                                                   (ncreator, dict(ridx=0, tier=self.tier)),
+                                                   (ncreator, dict(ridx=0 + 1, tier=self.tier)))
+        signer = signers.pop()
+        self.signer = csigners.pop()
+        self.nsigner = nsigners.pop()
 
         self.keys = [self.signer.verfer.qb64, signer.verfer.qb64]
         self.ndigs = [coring.Diger(ser=self.nsigner.verfer.qb64b).qb64]
@@ -203,67 +246,61 @@ class Controller:
 
         sigs = [signer.sign(ser=rot.raw, index=1, ondex=0).qb64, self.signer.sign(ser=rot.raw, index=0).qb64]
 
-        encrypter = signing.Encrypter(verkey=nsigner.verfer.qb64)  # encrypter for new salt
-        decrypter = signing.Decrypter(seed=nsigner.qb64)  # decrypter with old salt
-
         # First encrypt and save old Salt in case we need a recovery
         sxlt = encrypter.encrypt(prim=coring.Matter(qb64b=self.bran),
                                  code=coring.MtrDex.X25519_Cipher_Salt).qb64
 
-        data = dict(
+        return dict(
             rot=rot.ked,
             sigs=sigs,
             sxlt=sxlt,
         )
 
-        # Not recrypt all salts and saved keys after verifying they are decrypting correctly
-        keys = dict()
-        for aid in aids:
-            pre = aid["prefix"]
-            if "salty" in aid:
-                salty = aid["salty"]
-                cipher = signing.Cipher(qb64=salty["sxlt"])
-                dnxt = self._decryptSaltQb64(decrypter, cipher)
-
-                # Now we have the AID salt, use it to verify against the current public keys
-                acreator = keeping.SaltyCreator(dnxt, stem=salty["stem"], tier=salty["tier"])
-                signers = acreator.create(codes=salty["icodes"], pidx=salty["pidx"], kidx=salty["kidx"],
-                                          transferable=salty["transferable"])
-                pubs = aid["state"]["k"]
-                if pubs != [signer.verfer.qb64 for signer in signers]:
-                    raise kering.ValidationError(f"unable to rotate, validation of salt to public keys {pubs} failed")
-
-                asxlt = encrypter.encrypt(prim=coring.Matter(qb64=dnxt),
-                                          code=coring.MtrDex.X25519_Cipher_Salt).qb64
-                keys[pre] = dict(
-                    sxlt=asxlt
-                )
-
-            elif "randy" in aid:
-                randy = aid["randy"]
-                prxs = randy["prxs"]
-                nxts = randy["nxts"]
-
-                nprxs = []
-                signers = []
-                for prx in prxs:
-                    cipher = signing.Cipher(qb64=prx)
-                    dsigner = decrypter.decrypt(cipher=cipher, transferable=True)
-                    signers.append(dsigner)
-                    nprxs.append(encrypter.encrypt(prim=coring.Matter(qb64=dsigner.qb64)).qb64)
-
-                pubs = aid["state"]["k"]
-                if pubs != [signer.verfer.qb64 for signer in signers]:
-                    raise kering.ValidationError(f"unable to rotate, validation of encrypted public keys {pubs} failed")
-
-                nnxts = []
-                for nxt in nxts:
-                    nnxts.append(self.recrypt(nxt, decrypter, encrypter))
-
-                keys[pre] = dict(prxs=nprxs, nxts=nnxts)
-
-        data["keys"] = keys
-        return data
+    def _recryptAid(self, aid, decrypter, encrypter):
+        """Validate the stored key material of one AID and re-encrypt it, None when it has none."""
+        if "salty" in aid:
+            salty = aid["salty"]
+            cipher = signing.Cipher(qb64=salty["sxlt"])
+            dnxt = self._decryptSaltQb64(decrypter, cipher)
+
+            # Now we have the AID salt, use it to verify against the current public keys
+            acreator = keeping.SaltyCreator(dnxt, stem=salty["stem"], tier=salty["tier"])
+            signers = self._create((acreator, dict(codes=salty["icodes"], pidx=salty["pidx"], kidx=salty["kidx"],
+                                                   transferable=salty["transferable"])))[0]
+            pubs = aid["state"]["k"]
+            if pubs != [signer.verfer.qb64 for signer in signers]:
+                raise kering.ValidationError(f"unable to rotate, validation of salt to public keys {pubs} failed")
+
+            asxlt = encrypter.encrypt(prim=coring.Matter(qb64=dnxt),
+                                      code=coring.MtrDex.X25519_Cipher_Salt).qb64
+            return dict(
+                sxlt=asxlt
+            )
+
+        elif "randy" in aid:
+            randy = aid["randy"]
+            prxs = randy["prxs"]
+            nxts = randy["nxts"]
+
+            nprxs = []
+            signers = []
+            for prx in prxs:
+                cipher = signing.Cipher(qb64=prx)
+                dsigner = decrypter.decrypt(cipher=cipher, transferable=True)
+                signers.append(dsigner)
+                nprxs.append(encrypter.encrypt(prim=coring.Matter(qb64=dsigner.qb64)).qb64)
+
+            pubs = aid["state"]["k"]
+            if pubs != [signer.verfer.qb64 for signer in signers]:
+                raise kering.ValidationError(f"unable to rotate, validation of encrypted public keys {pubs} failed")
+
+            nnxts = []
+            for nxt in nxts:
+                nnxts.append(self.recrypt(nxt, decrypter, encrypter))
+
+            return dict(prxs=nprxs, nxts=nnxts)
+
+        return None
 
     @staticmethod
     def recrypt(enc, decrypter: signing.Decrypter, encrypter: signing.Encrypter):
@@ -294,7 +331,7 @@ class Authenticater:
         self.ctrl = ctrl
 
     def verify(self, rep, **kwargs):
-        url = urlparse(rep.request.url)
+        url = urlparse(str(rep.request.url))
         if "SIGNIFY-RESOURCE" not in rep.headers:
             raise kering.AuthNError("No valid signature from agent on response.")
 
@@ -390,3 +427,123 @@ class Authenticater:
             headers[key] = val
 
         return headers
+
+
+class PasscodeRotation:
+    """Parallel, resumable re-encryption of AID key material for one controller passcode rotation.
+
+    Identifiers are fed in pages to :meth:`recrypt`, which validates and
+    re-encrypts the stored salt or keys of each AID on a worker pool. With a
+    ``checkpoint`` path the finished entries are saved after every page, so a
+    rotation interrupted by a crash resumes from where it stopped instead of
+    starting over. The checkpoint holds only ciphertexts, never a passcode,
+    and is ignored once the controller has moved past the state it was
+    written for.
+
+    :meth:`finish` rotates the controller keys and returns the whole request
+    body for ``PUT /agent/{caid}``. KERIA applies the controller rotation and
+    every re-encrypted key of that body atomically, so it is never split.
+    """
+
+    def __init__(self, ctrl, nbran, *, checkpoint=None, max_workers=8):
+        """Start or resume a rotation of ``ctrl`` to passcode ``nbran``.
+
+        Parameters:
+            ctrl (Controller): controller whose passcode is rotated
+            nbran (str): new passcode
+            checkpoint (str | None): path of the JSON file progress is saved to and resumed from
+            max_workers (int): maximum number of AIDs re-encrypted concurrently
+        """
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        self.ctrl = ctrl
+        self.nbran = nbran
+        self.checkpoint = checkpoint
+        self.max_workers = max_workers
+        self.encrypter, self.decrypter = ctrl._recrypters()
+
+        self.keys = dict()
+        self.seen = set()
+        self._load()
+
+    @property
+    def done(self):
+        """Number of AIDs already processed, including those without key material to re-encrypt."""
+        return len(self.seen)
+
+    def _controller(self):
+        return dict(pre=self.ctrl.pre, said=self.ctrl.serder.said)
+
+    def _load(self):
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return
+
+        with open(self.checkpoint, "r") as f:
+            saved = json.load(f)
+
+        if saved.get("controller") != self._controller():
+            return
+
+        self.keys = saved["keys"]
+        self.seen = set(saved["seen"])
+
+    def _save(self):
+        if self.checkpoint is None:
+            return
+
+        tmp = f"{self.checkpoint}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(dict(controller=self._controller(), seen=sorted(self.seen), keys=self.keys), f)
+        os.replace(tmp, self.checkpoint)
+
+    def recrypt(self, aids):
+        """Validate and re-encrypt every AID in ``aids`` not processed yet, then save a checkpoint.
+
+        AIDs that fail validation are left unprocessed and the first failure is
+        raised after the successful ones have been checkpointed.
+
+        Returns:
+            int: number of AIDs processed by this call
+        """
+        todo = [aid for aid in aids if aid["prefix"] not in self.seen]
+        if not todo:
+            return 0
+
+        def recrypt(aid):
+            try:
+                return self.ctrl._recryptAid(aid, self.decrypter, self.encrypter), None
+            except Exception as ex:
+                return None, ex
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(todo))) as pool:
+            results = list(pool.map(recrypt, todo))
+
+        error = None
+        count = 0
+        for aid, (entry, ex) in zip(todo, results):
+            if ex is not None:
+                error = error or ex
+                continue
+
+            if entry is not None:
+                self.keys[aid["prefix"]] = entry
+            self.seen.add(aid["prefix"])
+            count += 1
+
+        self._save()
+        if error is not None:
+            raise error
+
+        return count
+
+    def finish(self):
+        """Rotate the controller keys and return the complete ``PUT /agent/{caid}`` request body."""
+        data = self.ctrl._rotateKeys(self.nbran, self.encrypter)
+        data["keys"] = dict(self.keys)
+        return data
+
+    def discard(self):
+        """Delete the checkpoint file once KERIA accepted the rotation."""
+        if self.checkpoint is not None and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
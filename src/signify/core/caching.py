@@ -0,0 +1,169 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.caching module
+
+Content-addressed cache for immutable resources fetched by SAID
+"""
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from keri.core import coring
+
+# qb64 SAIDs only use the URL safe Base64 alphabet, which also keeps them safe as file names
+SAID_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def verifySchema(said, raw):
+    """Return True when ``raw`` is a JSON schema whose ``$id`` is the SAID ``said``."""
+    try:
+        sad = json.loads(raw)
+        return coring.Saider(qb64=said).verify(sad, prefixed=True, versioned=False, label=coring.Saids.dollar)
+    except Exception:
+        return False
+
+
+def verifyExchange(said, raw):
+    """Return True when ``raw`` is a stored exchange message whose ``exn`` has the SAID ``said``."""
+    try:
+        exn = json.loads(raw)["exn"]
+        return coring.Saider(qb64=said).verify(exn, prefixed=True)
+    except Exception:
+        return False
+
+
+class SaidCache:
+    """Two tier cache of immutable content keyed by its SAID.
+
+    Entries live in a bounded in-memory LRU and, when ``directory`` is set, in
+    one file per SAID below it so they outlive the process. Content is only
+    admitted after its ``verify`` callable confirms it hashes to its SAID, and
+    disk entries are verified again when loaded, so a tampered or truncated
+    file is discarded and refetched rather than trusted.
+    """
+
+    def __init__(self, size=256, directory=None):
+        """Create a SAID cache.
+
+        Parameters:
+            size (int): maximum number of entries kept in memory, ``0`` keeps none
+            directory (str | None): directory of the on-disk tier, None disables it
+        """
+        self.size = size
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self.hitBytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Return cache counters as a dict."""
+        return dict(size=len(self), hits=self.hits, misses=self.misses, bytes=self.bytes, hitBytes=self.hitBytes)
+
+    def _path(self, said):
+        return os.path.join(self.directory, said)
+
+    def get(self, said, verify):
+        """Return the cached content for ``said`` or None.
+
+        Parameters:
+            said (str): qb64 SAID of the content
+            verify (Callable): ``verify(said, raw)`` returning True when ``raw`` matches ``said``
+        """
+        if not SAID_RE.fullmatch(said):
+            return None
+
+        with self._lock:
+            raw = self._entries.get(said)
+            if raw is not None:
+                self._entries.move_to_end(said)
+                self.hits += 1
+                self.hitBytes += len(raw)
+                return raw
+
+        raw = self._load(said, verify)
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self.hitBytes += len(raw)
+            self._remember(said, raw)
+
+        return raw
+
+    def put(self, said, raw, verify):
+        """Cache ``raw`` under ``said`` if ``verify`` confirms it, returning whether it was admitted."""
+        if not SAID_RE.fullmatch(said) or not verify(said, raw):
+            return False
+
+        with self._lock:
+            self._remember(said, raw)
+
+        if self.directory is not None:
+            tmp = f"{self._path(said)}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, self._path(said))
+
+        return True
+
+    def getJson(self, said, fetch, verify):
+        """Return the JSON document addressed by ``said``, calling ``fetch()`` for it on a miss."""
+        raw = self.get(said, verify)
+        if raw is not None:
+            return json.loads(raw)
+
+        doc = fetch()
+        self.put(said, json.dumps(doc).encode("utf-8"), verify)
+        return doc
+
+    def clear(self):
+        """Drop every in-memory entry, the on-disk tier is kept."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _load(self, said, verify):
+        """Read ``said`` from the on-disk tier, dropping the file when it fails verification."""
+        if self.directory is None:
+            return None
+
+        try:
+            with open(self._path(said), "rb") as f:
+                raw = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if not verify(said, raw):
+            os.remove(self._path(said))
+            return None
+
+        return raw
+
+    def _remember(self, said, raw):
+        """Add ``raw`` to the in-memory LRU. Call with the lock held."""
+        if self.size <= 0:
+            return
+
+        old = self._entries.pop(said, None)
+        if old is not None:
+            self.bytes -= len(old)
+
+        self._entries[said] = raw
+        self.bytes += len(raw)
+        while len(self._entries) > self.size:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= len(evicted)
@@ -6,7 +6,12 @@ signify.core.keeping module
 """
 
 
+import copy
 import importlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from keri import kering
 from keri.app import keeping
@@ -14,10 +19,237 @@ from keri.core import coring, signing
 from keri.core.coring import Tiers, MtrDex
 
 
+class SignerCache:
+    """Bounded LRU of salty signers keyed by AID salt and key path.
+
+    Salty derivation stretches the AID salt for every signer it creates, which
+    dominates the cost of signing many messages with the same AID. Callers
+    get copies of the cached signers, so signers already handed out keep
+    signing after their entry is evicted or invalidated. Only the cache's own
+    instances are scrubbed. Python ``bytes`` cannot be wiped in place, so
+    scrubbing replaces the seed with zeros and drops the cache's reference to
+    the original material.
+    """
+
+    def __init__(self, size=128):
+        """Create a signer cache holding at most ``size`` signer sets.
+
+        Parameters:
+            size (int): maximum number of cached signer sets, ``0`` disables caching
+        """
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._signers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._signers)
+
+    @property
+    def hitRate(self):
+        """Return the fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Return cache counters as a dict."""
+        return dict(size=len(self), hits=self.hits, misses=self.misses, evictions=self.evictions,
+                    hitRate=self.hitRate)
+
+    def get(self, key, create):
+        """Return cached signers for ``key``, deriving them with ``create`` on a miss.
+
+        Parameters:
+            key (tuple): hashable derivation key for one signer set
+            create (Callable): zero argument callable returning a list of signers
+
+        Returns:
+            list: copies of the signers for ``key``
+        """
+        with self._lock:
+            signers = self._signers.get(key)
+            if signers is not None:
+                self._signers.move_to_end(key)
+                self.hits += 1
+                return self.copy(signers)
+            self.misses += 1
+
+        signers = create()
+        if self.size <= 0:
+            return signers
+
+        evicted = []
+        with self._lock:
+            self._signers[key] = signers
+            self._signers.move_to_end(key)
+            while len(self._signers) > self.size:
+                _, old = self._signers.popitem(last=False)
+                evicted.append(old)
+                self.evictions += 1
+
+        for old in evicted:
+            self.scrub(old)
+
+        return self.copy(signers)
+
+    def invalidate(self, salt):
+        """Drop and scrub every cached signer set derived from one encrypted AID salt."""
+        with self._lock:
+            keys = [key for key in self._signers if key[0] == salt]
+            removed = [self._signers.pop(key) for key in keys]
+
+        for signers in removed:
+            self.scrub(signers)
+
+    def clear(self):
+        """Drop and scrub every cached signer set."""
+        with self._lock:
+            removed = list(self._signers.values())
+            self._signers.clear()
+
+        for signers in removed:
+            self.scrub(signers)
+
+    @staticmethod
+    def copy(signers):
+        """Return new signers over the same seeds so scrubbing the cached ones cannot affect them."""
+        return [signing.Signer(raw=signer.raw, code=signer.code, transferable=signer.verfer.transferable)
+                for signer in signers]
+
+    @staticmethod
+    def scrub(signers):
+        """Replace the private seed of each cache-owned signer with zeros."""
+        for signer in signers:
+            signer._raw = bytes(len(signer._raw))
+
+
+def _stretch(salt, tier, path, code, transferable, temp):
+    """Stretch one signing seed from ``salt`` and ``path`` and return it as qb64.
+
+    Module level so process pools can pickle it.
+    """
+    signer = signing.Salter(qb64=salt, tier=tier).signer(path=path, code=code, transferable=transferable,
+                                                        tier=tier, temp=temp)
+    return signer.qb64
+
+
+class DerivationExecutor:
+    """Run salty key stretching inline, on a thread pool or on a process pool.
+
+    Every signing key derived from a salt costs one deliberately expensive
+    stretch, and a request for many keys (an inception derives its current
+    and next keys, a passcode rotation re-derives the keys of every AID) is
+    dominated by them. :meth:`createMany` splits such requests into one job
+    per key and spreads the jobs over the selected backend:
+
+    - ``inline`` derives on the calling thread, the default.
+    - ``thread`` uses a thread pool; libsodium's Argon2 runs without the GIL.
+    - ``process`` uses a process pool, only seeds cross the process boundary.
+
+    Pools are created on first use and released by :meth:`close`.
+    """
+
+    Backends = ("inline", "thread", "process")
+
+    def __init__(self, backend="inline", max_workers=None):
+        """Create an executor for one backend.
+
+        Parameters:
+            backend (str): one of ``inline``, ``thread`` or ``process``
+            max_workers (int | None): pool size, defaults to the pool's own default
+        """
+        if backend not in self.Backends:
+            raise kering.ConfigurationError(f"unsupported derivation backend {backend}, must be one of "
+                                            f"{self.Backends}")
+
+        self.backend = backend
+        self.max_workers = max_workers
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shut down the backing pool, if one was started."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+
+        if pool is not None:
+            pool.shutdown()
+
+    def _executor(self):
+        with self._lock:
+            if self._pool is None:
+                if self.backend == "thread":
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+            return self._pool
+
+    def create(self, creator, **kwargs):
+        """Return the signers ``creator.create(**kwargs)`` would derive."""
+        return self.createMany([(creator, kwargs)])[0]
+
+    def createMany(self, requests):
+        """Derive the signers of many ``SaltyCreator.create`` calls together.
+
+        Parameters:
+            requests (Iterable[tuple]): ``(creator, kwargs)`` pairs, ``kwargs`` as accepted by
+                ``SaltyCreator.create``
+
+        Returns:
+            list: one list of signers per request, in request order
+        """
+        requests = list(requests)
+        if self.backend == "inline":
+            return [creator.create(**kwargs) for creator, kwargs in requests]
+
+        jobs = []
+        shape = []
+        for creator, kwargs in requests:
+            keys = self._jobs(creator, **kwargs)
+            shape.append([transferable for *_, transferable, _ in keys])
+            jobs.extend(keys)
+
+        seeds = iter(self._executor().map(_stretch, *zip(*jobs)) if jobs else [])
+        return [[signing.Signer(qb64=next(seeds), transferable=transferable) for transferable in request]
+                for request in shape]
+
+    @staticmethod
+    def _jobs(creator, codes=None, count=1, code=MtrDex.Ed25519_Seed, pidx=0, ridx=0, kidx=0, transferable=True,
+              temp=False, **_):
+        """Split one ``SaltyCreator.create`` call into per-key stretch jobs using the same key paths."""
+        if not codes:
+            codes = [code] * count
+        stem = creator.stem if creator.stem else f"{pidx:x}"
+        return [(creator.salt, creator.tier, f"{stem}{ridx:x}{kidx + i:x}", code, transferable, temp)
+                for i, code in enumerate(codes)]
+
+
 class Manager:
+    """Key manager building keepers for the AIDs of one Signify controller.
+
+    Salty and randy keepers loaded through ``get`` are cached by AID prefix,
+    establishment state digest ``d`` and stored keeper parameters, so the
+    decryption of ``sxlt`` or ``prxs`` only happens once per key state. Callers
+    always receive a shallow copy of the cached keeper, which keeps mutations
+    such as ``rotate()`` from leaking into the cache before KERIA accepts them.
+    """
 
-    def __init__(self, salter, extern_modules=None):
+    def __init__(self, salter, extern_modules=None, signer_cache_size=128, keeper_cache_size=64, executor=None):
         self.salter = salter
+        self.executor = executor if executor is not None else DerivationExecutor()
+        self.signer_cache = SignerCache(size=signer_cache_size)
+        self.keeper_cache_size = keeper_cache_size
+        self._keepers = OrderedDict()
+        self._lock = threading.Lock()
         extern_modules = extern_modules if extern_modules is not None else []
         self.modules = dict()
         for module in extern_modules:
@@ -33,7 +265,8 @@ class Manager:
     def new(self, algo, pidx, **kwargs):
         match algo:
             case keeping.Algos.salty:
-                return SaltyKeeper(salter=self.salter, pidx=pidx, **kwargs)
+                return SaltyKeeper(salter=self.salter, pidx=pidx, cache=self.signer_cache, executor=self.executor,
+                                   **kwargs)
 
             case keeping.Algos.group:
                 return GroupKeeper(mgr=self, **kwargs)
@@ -56,11 +289,14 @@ class Manager:
             kwargs = aid[keeping.Algos.salty]
             if "pidx" not in kwargs:
                 raise kering.ConfigurationError(f"missing pidx in {kwargs}")
-            return SaltyKeeper(salter=self.salter, **kwargs)
+            return self._cached(aid, keeping.Algos.salty,
+                                lambda: SaltyKeeper(salter=self.salter, cache=self.signer_cache,
+                                                    executor=self.executor, **kwargs))
 
         elif keeping.Algos.randy in aid:
             kwargs = aid[keeping.Algos.randy]
-            return RandyKeeper(salter=self.salter, transferable=pre.transferable, **kwargs)
+            return self._cached(aid, keeping.Algos.randy,
+                                lambda: RandyKeeper(salter=self.salter, transferable=pre.transferable, **kwargs))
 
         elif keeping.Algos.group in aid:
             kwargs = aid[keeping.Algos.group]
@@ -76,6 +312,40 @@ class Manager:
             eargs = kwargs["extern"]
             return mod.shim(pidx=extnprms["pidx"], **eargs)
 
+    def _cached(self, aid, algo, create):
+        """Return a keeper for ``aid`` from the keeper cache, building it with ``create`` on a miss."""
+        if self.keeper_cache_size <= 0:
+            return create()
+
+        state = aid.get("state") or {}
+        key = (aid["prefix"], state.get("d"), algo, json.dumps(aid[algo], sort_keys=True, default=str))
+
+        with self._lock:
+            keeper = self._keepers.get(key)
+            if keeper is not None:
+                self._keepers.move_to_end(key)
+                return copy.copy(keeper)
+
+        keeper = create()
+        with self._lock:
+            self._keepers[key] = copy.copy(keeper)
+            while len(self._keepers) > self.keeper_cache_size:
+                self._keepers.popitem(last=False)
+
+        return keeper
+
+    def invalidate(self, pre=None):
+        """Drop cached keepers for one AID prefix, or every cached keeper when ``pre`` is None."""
+        with self._lock:
+            if pre is None:
+                self._keepers.clear()
+            else:
+                for key in [key for key in self._keepers if key[0] == pre]:
+                    del self._keepers[key]
+
+        if pre is None:
+            self.signer_cache.clear()
+
 
 class BaseKeeper:
     """Base Keystore class for all Keeper types"""
@@ -142,7 +412,7 @@ class SaltyKeeper(BaseKeeper):
 
     def __init__(self, salter, pidx, kidx=0, tier=Tiers.low, transferable=False, stem=None,
                  code=MtrDex.Ed25519_Seed, count=1, icodes=None, ncode=MtrDex.Ed25519_Seed,
-                 ncount=1, ncodes=None, dcode=MtrDex.Blake3_256, bran=None, sxlt=None):
+                 ncount=1, ncodes=None, dcode=MtrDex.Blake3_256, bran=None, sxlt=None, cache=None, executor=None):
         """
         Create an instance of a SaltyKeeper for managing keys for a single AID.  This can be created from
         data saved externally to recreate keys at a given point in time or with values for a new AID.  The sxlt
@@ -166,6 +436,8 @@ class SaltyKeeper(BaseKeeper):
             dcode (str): derivation code for hashing algorithm for next key digests
             bran (str): AID specific salt to use for key generate for this AID inception
             sxlt (str): qualified base64 of cipher of AID salt.
+            cache (SignerCache): optional cache of current signers shared across keepers
+            executor (DerivationExecutor): optional executor running the key stretching
         """
 
         if not icodes:  # if not codes make list len count of same code
@@ -186,6 +458,8 @@ class SaltyKeeper(BaseKeeper):
         self.pidx = pidx
         self.kidx = kidx
         self.transferable = transferable
+        self.cache = cache
+        self.executor = executor
         stem = stem if stem is not None else self.stem
 
         # sxlt is encrypted salt for this AID or None if incepting
@@ -237,12 +511,10 @@ class SaltyKeeper(BaseKeeper):
         self.transferable = transferable
         self.kidx = 0
 
-        signers = self.creator.create(codes=self.icodes, pidx=self.pidx, kidx=self.kidx,
-                                      transferable=transferable)
+        signers, nsigners = self._create(
+            dict(codes=self.icodes, pidx=self.pidx, kidx=self.kidx, transferable=transferable),
+            dict(codes=self.ncodes, pidx=self.pidx, kidx=len(self.icodes), transferable=self.transferable))
         verfers = [signer.verfer.qb64 for signer in signers]
-
-        nsigners = self.creator.create(codes=self.ncodes, pidx=self.pidx, kidx=len(self.icodes),
-                                       transferable=self.transferable)
         digers = [coring.Diger(ser=nsigner.verfer.qb64b, code=self.dcode).qb64 for nsigner in nsigners]
 
         return verfers, digers
@@ -259,13 +531,16 @@ class SaltyKeeper(BaseKeeper):
             digers(list): qualified base64 of hash of rotation public keys
 
         """
-        signers = self.creator.create(codes=self.ncodes, pidx=self.pidx, kidx=self.kidx + len(self.icodes),
-                                      transferable=self.transferable)
+        if self.cache is not None:
+            self.cache.invalidate(self.sxlt)
+
+        kidx = self.kidx + len(self.icodes)
+        signers, nsigners = self._create(
+            dict(codes=self.ncodes, pidx=self.pidx, kidx=kidx, transferable=self.transferable),
+            dict(codes=ncodes, pidx=self.pidx, kidx=kidx + len(self.icodes), transferable=transferable))
         verfers = [signer.verfer.qb64 for signer in signers]
 
-        self.kidx = self.kidx + len(self.icodes)
-        nsigners = self.creator.create(codes=ncodes, pidx=self.pidx, kidx=self.kidx + len(self.icodes),
-                                       transferable=transferable)
+        self.kidx = kidx
         digers = [coring.Diger(ser=nsigner.verfer.qb64b, code=self.dcode).qb64 for nsigner in nsigners]
 
         return verfers, digers
@@ -283,15 +558,33 @@ class SaltyKeeper(BaseKeeper):
             list: qualified b64 CESR encoded signatures
 
         """
-        signers = self.creator.create(codes=self.icodes, pidx=self.pidx, kidx=self.kidx,
-                                      transferable=self.transferable)
+        signers = self.signers()
 
         return self.__sign__(ser, signers=signers, indexed=indexed, indices=indices, ondices=ondices)
 
     def signers(self):
-        """Return signer objects for the keeper's current signing keys."""
-        return self.creator.create(codes=self.icodes, pidx=self.pidx, kidx=self.kidx,
-                                   transferable=self.transferable)
+        """Return signer objects for the keeper's current signing keys.
+
+        When the keeper shares a ``SignerCache`` the signers are only derived
+        on the first call for the current key index.
+        """
+        def create():
+            return self._create(dict(codes=self.icodes, pidx=self.pidx, kidx=self.kidx,
+                                     transferable=self.transferable))[0]
+
+        if self.cache is None:
+            return create()
+
+        key = (self.sxlt, self.creator.stem, self.tier, self.pidx, self.kidx, tuple(self.icodes),
+               self.transferable)
+        return self.cache.get(key, create)
+
+    def _create(self, *requests):
+        """Derive the signers of each ``SaltyCreator.create`` keyword set in ``requests``, on the executor if any."""
+        if self.executor is None:
+            return [self.creator.create(**kwargs) for kwargs in requests]
+
+        return self.executor.createMany([(self.creator, kwargs) for kwargs in requests])
 
 
 class RandyKeeper(BaseKeeper):
@@ -318,6 +611,8 @@ class RandyKeeper(BaseKeeper):
         self.dcode = dcode
 
         self.creator = keeping.RandyCreator()
+        # shared with shallow copies handed out by Manager so decrypted signers survive across copies
+        self._decrypted = dict()
 
     def params(self):
         return dict(
@@ -351,14 +646,24 @@ class RandyKeeper(BaseKeeper):
         return verfers, digers
 
     def sign(self, ser, indexed=True, indices=None, ondices=None, **_):
-        signers = [self.decrypter.decrypt(cipher=signing.Cipher(qb64=prx), transferable=self.transferable)
-                   for prx in self.prxs]
+        signers = self.signers()
         return self.__sign__(ser, signers=signers, indexed=indexed, indices=indices, ondices=ondices)
 
     def signers(self):
-        """Return signer objects decrypted from the keeper's current key set."""
-        return [self.decrypter.decrypt(cipher=signing.Cipher(qb64=prx), transferable=self.transferable)
-                for prx in self.prxs]
+        """Return signer objects decrypted from the keeper's current key set.
+
+        Decrypted signers are remembered for the current ``prxs`` so repeated
+        signing with the same key set only decrypts once.
+        """
+        key = (tuple(self.prxs), self.transferable)
+        signers = self._decrypted.get(key)
+        if signers is None:
+            signers = [self.decrypter.decrypt(cipher=signing.Cipher(qb64=prx), transferable=self.transferable)
+                       for prx in self.prxs]
+            self._decrypted.clear()
+            self._decrypted[key] = signers
+
+        return signers
 
 
 class GroupKeeper(BaseKeeper):
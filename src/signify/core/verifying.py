@@ -0,0 +1,261 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.verifying module
+
+Offline verification of key event logs returned by KERIA
+"""
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from keri import kering
+from keri.core import eventing, parsing, serdering
+from keri.db import basing, dbing
+from keri.help import helping
+
+from signify.core.caching import SAID_RE
+
+DelegatedIlks = ("dip", "drt")
+
+
+def _tail(events, checkpoint):
+    """Return the events of a KEL after its checkpointed event.
+
+    Raises:
+        ValidationError: when the KEL no longer contains the checkpointed event
+    """
+    if checkpoint is None:
+        return events
+
+    state = checkpoint["state"]
+    for idx, event in enumerate(events):
+        if event["ked"]["d"] == state["d"]:
+            return events[idx + 1:]
+
+    raise kering.ValidationError(f"key event log of {state['i']} diverges from its checkpoint at sn={state['s']}")
+
+
+def _seed(db, pre, checkpoint):
+    """Install the checkpointed key state of ``pre`` in ``db`` so replay starts after it."""
+    state = helping.datify(basing.KeyStateRecord, checkpoint["state"])
+    db.putEvt(dbing.dgKey(pre, state.d), checkpoint["raw"].encode("utf-8"))
+    db.kevers[pre] = eventing.Kever(state=state, db=db)
+
+
+def _replay(kels, checkpoints):
+    """Verify ``kels`` in a scratch database seeded from ``checkpoints``.
+
+    Module level so process pools can run it. Delegators must come before
+    the prefixes they delegate to in ``kels``.
+
+    Returns:
+        dict: prefix to a ``(checkpoint, error)`` pair, exactly one of them is None
+    """
+    results = dict()
+    db = basing.Baser(name="signify-verify", temp=True, reopen=True)
+    try:
+        kvy = eventing.Kevery(db=db, lax=False, local=False)
+        for pre, events in kels.items():
+            try:
+                checkpoint = checkpoints.get(pre)
+                tail = _tail(events, checkpoint)
+                if checkpoint is not None:
+                    _seed(db, pre, checkpoint)
+
+                ims = bytearray()
+                for event in tail:
+                    ims.extend(serdering.SerderKERI(sad=event["ked"]).raw)
+                    ims.extend(event["atc"].encode("utf-8"))
+                parsing.Parser(kvy=kvy).parse(ims=ims)
+
+                kever = kvy.kevers.get(pre)
+                if kever is None or kever.serder.said != events[-1]["ked"]["d"]:
+                    sn = None if kever is None else kever.sner.num
+                    raise kering.ValidationError(f"key event log of {pre} failed verification after sn={sn}")
+
+                results[pre] = (dict(state=helping.dictify(kever.state()), raw=kever.serder.raw.decode("utf-8")),
+                                None)
+            except (kering.KeriError, ValueError, KeyError, IndexError) as ex:
+                results[pre] = (None, str(ex))
+    finally:
+        db.close(clear=True)
+
+    return results
+
+
+class KelVerifier:
+    """Replay and verify key event logs locally instead of trusting the agent's key state.
+
+    KELs as returned by ``KeyEvents.get`` are replayed through keripy's
+    validator: event SAIDs, controller signatures against the current
+    signing threshold, pre-rotation next-key digest commitments, witness
+    receipts against the witness threshold and, when the delegator's KEL is
+    supplied alongside, delegation source seals.
+
+    The key state after the last verified event is kept as a checkpoint per
+    prefix, in memory and, when ``directory`` is set, as one JSON file per
+    prefix. A later verification of the same prefix only replays the events
+    after the checkpoint. Checkpoints of delegators whose delegates have new
+    delegated events are not used, so the anchoring seals are replayed too.
+
+    Many prefixes are verified together by :meth:`verifyMany`, which spreads
+    independent delegation chains over the selected backend:
+
+    - ``inline`` verifies on the calling thread, the default.
+    - ``thread`` uses a thread pool.
+    - ``process`` uses a process pool, only events and checkpoints cross the process boundary.
+    """
+
+    Backends = ("inline", "thread", "process")
+
+    def __init__(self, directory=None, backend="inline", max_workers=None):
+        """Create a KEL verifier.
+
+        Parameters:
+            directory (str | None): directory of persisted checkpoints, None keeps them in memory only
+            backend (str): one of ``inline``, ``thread`` or ``process``
+            max_workers (int | None): pool size, defaults to the number of CPUs
+        """
+        if backend not in self.Backends:
+            raise kering.ConfigurationError(f"unsupported verification backend {backend}, must be one of "
+                                            f"{self.Backends}")
+
+        self.directory = directory
+        self.backend = backend
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._checkpoints = dict()
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def checkpoint(self, pre):
+        """Return the checkpoint of ``pre`` as ``dict(state=..., raw=...)`` or None."""
+        with self._lock:
+            checkpoint = self._checkpoints.get(pre)
+
+        if checkpoint is None and self.directory is not None and SAID_RE.fullmatch(pre):
+            try:
+                with open(os.path.join(self.directory, f"{pre}.json"), "r") as f:
+                    checkpoint = json.load(f)
+            except FileNotFoundError:
+                return None
+
+            with self._lock:
+                self._checkpoints.setdefault(pre, checkpoint)
+
+        return checkpoint
+
+    def state(self, pre):
+        """Return the last verified key state of ``pre`` or None."""
+        checkpoint = self.checkpoint(pre)
+        return checkpoint["state"] if checkpoint is not None else None
+
+    def verify(self, pre, events, delegators=None):
+        """Verify the KEL of one prefix and return its key state.
+
+        Parameters:
+            pre (str): qb64 prefix of the KEL
+            events (list): events as returned by ``KeyEvents.get``
+            delegators (dict | None): KELs of the delegation chain of ``pre`` keyed by prefix
+
+        Returns:
+            dict: verified key state
+
+        Raises:
+            ValidationError: when the KEL does not verify
+        """
+        kels = dict(delegators or {})
+        kels[pre] = events
+        states, errors = self.verifyMany(kels)
+        if pre in errors:
+            raise kering.ValidationError(errors[pre])
+
+        return states[pre]
+
+    def verifyMany(self, kels):
+        """Verify many KELs, fanning independent delegation chains out over the backend.
+
+        Parameters:
+            kels (dict): events as returned by ``KeyEvents.get`` keyed by prefix
+
+        Returns:
+            tuple: ``(states, errors)`` dicts keyed by prefix, holding the verified key state
+            or the reason verification failed
+        """
+        checkpoints = dict()
+        errors = dict()
+        replay = set()
+        for pre, events in kels.items():
+            if not events:
+                errors[pre] = f"key event log of {pre} is empty"
+                continue
+
+            checkpoints[pre] = self.checkpoint(pre)
+            delpre = events[0]["ked"].get("di")
+            try:
+                tail = _tail(events, checkpoints[pre])
+            except kering.ValidationError as ex:
+                errors[pre] = str(ex)
+                continue
+
+            if delpre and any(event["ked"]["t"] in DelegatedIlks for event in tail):
+                replay.add(delpre)
+
+        for delpre in replay & checkpoints.keys():
+            checkpoints[delpre] = None
+
+        groups = self._groups([pre for pre in kels if pre not in errors], kels)
+        batches = [dict() for _ in range(min(self.max_workers, len(groups)) or 1)]
+        for idx, group in enumerate(groups):
+            batches[idx % len(batches)].update((pre, kels[pre]) for pre in group)
+
+        jobs = [(batch, {pre: checkpoints[pre] for pre in batch if checkpoints[pre] is not None})
+                for batch in batches if batch]
+        if self.backend == "inline" or len(jobs) <= 1:
+            results = [_replay(*job) for job in jobs]
+        else:
+            pool = ThreadPoolExecutor if self.backend == "thread" else ProcessPoolExecutor
+            with pool(max_workers=len(jobs)) as executor:
+                results = list(executor.map(_replay, *zip(*jobs)))
+
+        states = dict()
+        for result in results:
+            for pre, (checkpoint, error) in result.items():
+                if error is not None:
+                    errors[pre] = error
+                    continue
+
+                self._save(pre, checkpoint)
+                states[pre] = checkpoint["state"]
+
+        return states, errors
+
+    @staticmethod
+    def _groups(pres, kels):
+        """Split ``pres`` into delegation chains, each ordered delegators first."""
+        def chain(pre):
+            pres = [pre]
+            while (delpre := kels[pres[-1]][0]["ked"].get("di")) and kels.get(delpre) and delpre not in pres:
+                pres.append(delpre)
+            return pres[::-1]
+
+        roots = dict()
+        for pre in pres:
+            root = chain(pre)[0]
+            roots.setdefault(root, []).append(pre)
+
+        return [sorted(members, key=lambda pre: len(chain(pre))) for members in roots.values()]
+
+    def _save(self, pre, checkpoint):
+        with self._lock:
+            self._checkpoints[pre] = checkpoint
+
+        if self.directory is not None and SAID_RE.fullmatch(pre):
+            path = os.path.join(self.directory, f"{pre}.json")
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(checkpoint, f)
+            os.replace(tmp, path)
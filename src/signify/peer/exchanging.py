@@ -4,26 +4,54 @@
 This module owns the app-level ``exn`` transport used by challenges,
 multisig coordination, and IPEX grant/admit workflows.
 """
+from concurrent.futures import ThreadPoolExecutor
+
+from keri.core import serdering
 from keri.peer import exchanging
 
 from signify.app.clienting import SignifyClient
+from signify.core.caching import verifyExchange
+
+
+class ExchangeSendError(Exception):
+    """Raised by :meth:`Exchanges.send` when delivery to some recipients of a fan-out failed.
+
+    Attributes:
+        results (list): one `(exn, sigs, response)` tuple per recipient in
+            request order, None for every recipient that failed
+        errors (dict): exception raised for each failed recipient keyed by recipient AID
+    """
+
+    def __init__(self, results, errors):
+        super().__init__(f"exn delivery failed for {len(errors)} of {len(results)} recipients: "
+                         f"{', '.join(errors)}")
+        self.results = results
+        self.errors = errors
 
 
 class Exchanges:
     """Resource wrapper for peer exchange message creation and submission."""
 
-    def __init__(self, client: SignifyClient):
+    def __init__(self, client: SignifyClient, cache=None):
         """Create an exchanges resource bound to one Signify client.
 
         Parameters:
             client (SignifyClient): Signify client used to access KERIA peer
                 exchange endpoints.
+            cache (SaidCache | None): SAID cache consulted before fetching a
+                stored exn message, None disables caching.
         """
         self.client = client
+        self.cache = cache
 
-    def send(self, name, topic, sender, route, payload, embeds, recipients, dig=None):
+    def send(self, name, topic, sender, route, payload, embeds, recipients, dig=None, max_workers=8):
         """  Send exn message to recipients
 
+        Each recipient gets its own exn addressed to it. The sender's keeper is
+        loaded and the embeds are serialized once for all of them, then the
+        per-recipient messages are signed and posted concurrently, at most
+        ``max_workers`` at a time.
+
         Parameters:
             name (str): human readable identifier alias to send from
             topic (Str): message topic
@@ -33,30 +61,74 @@ class Exchanges:
             embeds (dict): map of label to bytes of encoded KERI event to embed in exn
             recipients (list[string]): list of qb64 recipient AIDs
             dig (str): Optional qb64 SAID of exchange message reverse chain
+            max_workers (int): maximum number of recipients signed for and posted to concurrently
 
         Returns:
             tuple|list[tuple]: one `(exn, sigs, response)` tuple for a single
             recipient, or one tuple per recipient when a broadcast fan-out is
             requested.
 
+        Raises:
+            ExchangeSendError: when a fan-out to several recipients failed for
+                some of them, carrying the results of the others
+
         """
         if not recipients:
             raise ValueError("recipients must not be empty")
+        if max_workers < 1:
+            raise ValueError(f"invalid max_workers={max_workers}, must be at least 1")
+
+        build = self._builder(sender, route, payload, embeds, recipients, dig)
+        if len(recipients) == 1:
+            exn, sigs, atc = build(recipients[0])
+            json = self.sendFromEvents(name, topic, exn=exn, sigs=sigs, atc=atc, recipients=list(recipients))
+            return exn, sigs, json
+
+        errors = dict()
+
+        def one(recipient):
+            try:
+                exn, sigs, atc = build(recipient)
+                json = self.sendFromEvents(name, topic, exn=exn, sigs=sigs, atc=atc, recipients=[recipient])
+                return exn, sigs, json
+            except Exception as ex:
+                errors[recipient] = ex
+                return None
 
-        results = []
-        for recipient in recipients:
-            exn, sigs, atc = self.createExchangeMessage(
-                sender,
-                route,
-                payload,
-                embeds,
-                recipient=recipient,
-                dig=dig,
-            )
-            json = self.sendFromEvents(name, topic, exn=exn, sigs=sigs, atc=atc, recipients=[recipient])
-            results.append((exn, sigs, json))
-
-        return results[0] if len(results) == 1 else results
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(recipients))) as pool:
+            results = list(pool.map(one, recipients))
+
+        if errors:
+            raise ExchangeSendError(results, errors)
+
+        return results
+
+    def _builder(self, sender, route, payload, embeds, recipients, dig=None):
+        """Return a callable building and signing the exn for one of ``recipients``.
+
+        The exn for the first recipient is built normally, which serializes the
+        embeds and their pathed attachments. The others reuse that message and
+        only readdress it, so only the SAID and signature are computed per
+        recipient.
+        """
+        keeper = self.client.manager.get(sender)
+        first, atc = exchanging.exchange(route=route,
+                                         payload=payload,
+                                         sender=sender["prefix"],
+                                         recipient=recipients[0],
+                                         embeds=embeds,
+                                         dig=dig)
+        atc = bytes(atc).decode("utf-8")
+
+        def build(recipient):
+            exn = first
+            if recipient != recipients[0]:
+                ked = dict(first.ked, d="", rp=recipient, a=dict(i=recipient) | payload)
+                exn = serdering.SerderKERI(sad=ked, makify=True)
+
+            return exn, keeper.sign(ser=exn.raw), atc
+
+        return build
 
     def createExchangeMessage(self, sender, route, payload, embeds, recipient=None, dig=None, dt=None, datetime=None):
         """Create an ``exn`` message plus signatures and attachment material.
@@ -131,6 +203,11 @@ class Exchanges:
         Returns:
             dict: exn message
         """
+        if self.cache is not None:
+            return self.cache.getJson(said, lambda: self._fetch(said), verifyExchange)
+
+        return self._fetch(said)
 
+    def _fetch(self, said):
         res = self.client.get(f"/exchanges/{said}")
         return res.json()
@@ -7,7 +7,7 @@ Testing aiding with unit tests
 """
 
 import pytest
-from mockito import mock, verify, verifyNoUnwantedInteractions, unstub, expect
+from mockito import mock, verify, verifyNoUnwantedInteractions, unstub, expect, ANY
 
 
 def test_aiding_list():
@@ -38,6 +38,46 @@ def test_aiding_list():
     unstub()
 
 
+def test_aiding_iter_all_prefetches_windows_in_order():
+    import re
+    import threading
+    import time
+    from signify.app.aiding import Identifiers
+
+    aids = [dict(name=f"aid{i}") for i in range(11)]
+    windows = []
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def get(path, headers):
+        start, end = map(int, re.match(r"aids=(\d+)-(\d+)", headers["Range"]).groups())
+        with lock:
+            windows.append((start, end))
+            active.append(start)
+            peak.append(len(active))
+        time.sleep(0.01 if start == 3 else 0)
+        with lock:
+            active.remove(start)
+        page = aids[start:min(end, start + 2) + 1]  # the agent caps windows at 3 records
+        return mock({'headers': {'content-range': f"aids {start}-{start + len(page) - 1}/{len(aids)}"},
+                     'json': lambda: page})
+
+    ids = Identifiers(client=mock({'get': get}))  # type: ignore
+
+    assert list(ids.iter_all(page_size=5, prefetch=2)) == aids
+    assert windows[0] == (0, 4)
+    assert sorted(windows[1:]) == [(3, 5), (6, 8), (9, 11)]
+    assert max(peak) <= 2
+
+    gen = ids.iter_all(page_size=5, prefetch=2)
+    assert next(gen) == aids[0]
+    gen.close()
+
+    with pytest.raises(ValueError):
+        next(ids.iter_all(prefetch=0))
+
+
 def test_aiding_get():
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -82,7 +122,8 @@ def test_aiding_create():
     expect(mock_keeper, times=1).sign(mock_serder.raw).thenReturn(['a signature'])
 
     from signify.app.clienting import SignifyClient
-    mock_client = mock({'pidx': 0}, spec=SignifyClient, strict=True)
+    mock_client = mock(spec=SignifyClient, strict=True)
+    expect(mock_client, times=1).reservePidx().thenReturn(0)
     mock_client.manager = mock_manager  # type: ignore
 
     from signify.app.aiding import Identifiers
@@ -97,7 +138,63 @@ def test_aiding_create():
 
     ids.create(name='new_aid', states=[{'i': 'a smid'}], rstates=[{'i': 'a rmid'}])
 
-    assert mock_client.pidx == 1
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_aiding_create_many_reports_each_identifier():
+    from requests import HTTPError
+    from signify.app.aiding import Identifiers
+    from signify.app.clienting import SignifyClient
+    from signify.app.coring import Operations
+
+    mock_client = mock(spec=SignifyClient, strict=True)
+    expect(mock_client, times=1).reservePidx(4).thenReturn(7)
+    expect(mock_client, times=1).releasePidx(9)
+    expect(mock_client, times=1).operations().thenReturn(Operations(client=mock_client))  # type: ignore
+
+    ids = Identifiers(client=mock_client)  # type: ignore
+    built = []
+
+    def build(name, pidx, **kwargs):
+        if name == "bad":
+            raise ValueError("bad key params")
+        built.append((name, pidx, kwargs))
+        return f"serder-{name}", ["a signature"], dict(name=name)
+
+    ids._buildInception = build  # type: ignore
+
+    def post(path, json):
+        if json["name"] == "offline":
+            raise HTTPError("500 Server Error")
+        ops = dict(ok=dict(name="done.ok", done=True),
+                   dup=dict(name="done.dup", done=True, error=dict(code=400, message="duplicate")))
+        return mock({'json': lambda: ops[json["name"]]})
+
+    mock_client.post = post  # type: ignore
+
+    dup_spec = dict(name="dup", wits=["BWit"])
+    result = ids.create_many(["ok", dup_spec, "bad", "offline"], max_workers=2)
+
+    assert [item.name for item in result] == ["ok", "dup", "bad", "offline"]
+    assert [item.pidx for item in result] == [7, 8, 9, 10]
+    assert sorted(built) == [("dup", 8, dict(wits=["BWit"])), ("offline", 10, {}), ("ok", 7, {})]
+
+    ok, dup, bad, offline = result
+    assert result.succeeded == [ok]
+    assert ok.serder == "serder-ok" and ok.op == dict(name="done.ok", done=True)
+    assert dup.error == dict(code=400, message="duplicate")
+    assert isinstance(bad.error, ValueError) and bad.serder is None
+    assert isinstance(offline.error, HTTPError) and offline.op is None
+    assert result.failed == [dup, bad, offline]
+    assert dup_spec == dict(name="dup", wits=["BWit"])
+
+    # a spec without a name fails before any key index is reserved
+    with pytest.raises(ValueError):
+        ids.create_many(["x", dict(wits=["BWit"])])
+    with pytest.raises(ValueError):
+        ids.create_many(["x"], max_workers=0)
+    assert len(ids.create_many([])) == 0
 
     verifyNoUnwantedInteractions()
     unstub()
@@ -130,7 +227,8 @@ def test_aiding_create_randy():
     expect(mock_keeper, times=1).sign(mock_serder.raw).thenReturn(['a signature'])
 
     from signify.app.clienting import SignifyClient
-    mock_client = mock({'pidx': 0}, spec=SignifyClient, strict=True)
+    mock_client = mock(spec=SignifyClient, strict=True)
+    expect(mock_client, times=1).reservePidx().thenReturn(0)
     mock_client.manager = mock_manager  # type: ignore
 
     from signify.app.aiding import Identifiers
@@ -145,8 +243,6 @@ def test_aiding_create_randy():
 
     ids.create(name='new_aid', algo='randy')
 
-    assert mock_client.pidx == 1
-
     verifyNoUnwantedInteractions()
     unstub()
 
@@ -174,7 +270,8 @@ def test_aiding_create_cnfg():
     expect(mock_keeper, times=1).sign(mock_serder.raw).thenReturn(['a signature'])
 
     from signify.app.clienting import SignifyClient
-    mock_client = mock({'pidx': 0}, spec=SignifyClient, strict=True)
+    mock_client = mock(spec=SignifyClient, strict=True)
+    expect(mock_client, times=1).reservePidx().thenReturn(0)
     mock_client.manager = mock_manager  # type: ignore
 
     from signify.app.aiding import Identifiers
@@ -188,8 +285,6 @@ def test_aiding_create_cnfg():
 
     ids.create(name='new_aid', estOnly=True, DnD=True)
 
-    assert mock_client.pidx == 1
-
     verifyNoUnwantedInteractions()
     unstub()
 
@@ -219,7 +314,8 @@ def test_aiding_create_delegation():
     expect(mock_keeper, times=1).sign(mock_serder.raw).thenReturn(['a signature'])
 
     from signify.app.clienting import SignifyClient
-    mock_client = mock({'pidx': 0}, spec=SignifyClient, strict=True)
+    mock_client = mock(spec=SignifyClient, strict=True)
+    expect(mock_client, times=1).reservePidx().thenReturn(0)
     mock_client.manager = mock_manager  # type: ignore
 
     from signify.app.aiding import Identifiers
@@ -235,8 +331,6 @@ def test_aiding_create_delegation():
 
     ids.create(name='new_aid', delpre='my delegation', states=[{'i': 'a smid'}], rstates=[{'i': 'a rmid'}])
 
-    assert mock_client.pidx == 1
-
     verifyNoUnwantedInteractions()
     unstub()
 
@@ -387,6 +481,200 @@ def test_aiding_interact_no_data():
     unstub()
 
 
+def test_aiding_interact_advances_cached_hab_state():
+    from requests import HTTPError, Response
+    from signify.app.aiding import HabStateCache, Identifiers
+    from signify.app.clienting import SignifyClient
+    from signify.core import keeping
+
+    mock_client = mock(spec=SignifyClient, strict=True)
+    mock_manager = mock(spec=keeping.Manager, strict=True)
+    mock_client.manager = mock_manager  # type: ignore
+
+    cache = HabStateCache()
+    ids = Identifiers(client=mock_client, cache=cache)  # type: ignore
+
+    hab = {'prefix': 'EHabPrefixxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx', 'name': 'aid1',
+           'state': {'s': '0', 'd': 'EHabDigest', 'et': 'icp'}}
+    mock_get = mock({'json': lambda: hab}, spec=Response, strict=True)
+    expect(mock_client, times=2).get('/identifiers/aid1').thenReturn(mock_get)
+
+    mock_keeper = mock({'algo': 'salty', 'params': lambda: {'keeper': 'params'}}, spec=keeping.SaltyKeeper, strict=True)
+    expect(mock_manager, times=4).get(aid=ANY()).thenReturn(mock_keeper)
+    expect(mock_keeper, times=4).sign(ser=ANY()).thenReturn(['a signature'])
+
+    mock_response = mock({'json': lambda: {'done': False}}, spec=Response, strict=True)
+    posted = []
+
+    def post(path, json):
+        posted.append(json['ixn'])
+        if len(posted) == 3:
+            raise HTTPError("500 Server Error")
+        return mock_response
+
+    mock_client.post = post  # type: ignore
+
+    first, _, _ = ids.interact('aid1')
+    second, _, _ = ids.interact('aid1')
+
+    assert first.sn == 1
+    assert second.sn == 2
+    assert second.ked['p'] == first.said
+    assert cache.get('aid1')['state'] == {'s': '2', 'p': first.said, 'd': second.said, 'et': 'ixn'}
+    assert hab['state']['s'] == '0'
+
+    with pytest.raises(HTTPError):
+        ids.interact('aid1')
+
+    assert cache.get('aid1') is None
+
+    third, _, _ = ids.interact('aid1')
+    assert third.sn == 1
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_aiding_interact_sequences_concurrent_events_per_identifier():
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from requests import Response
+    from signify.app.aiding import EventSequencer, HabStateCache, Identifiers
+    from signify.app.clienting import SignifyClient
+    from signify.core import keeping
+
+    mock_client = mock(spec=SignifyClient, strict=True)
+    mock_manager = mock(spec=keeping.Manager, strict=True)
+    mock_client.manager = mock_manager  # type: ignore
+
+    ids = Identifiers(client=mock_client, cache=HabStateCache(), sequencer=EventSequencer())  # type: ignore
+
+    hab = {'prefix': 'EHabPrefixxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx', 'name': 'aid1',
+           'state': {'s': '0', 'd': 'EHabDigest', 'et': 'icp'}}
+    mock_get = mock({'json': lambda: hab}, spec=Response, strict=True)
+    expect(mock_client, times=1).get('/identifiers/aid1').thenReturn(mock_get)
+
+    mock_keeper = mock({'algo': 'salty', 'params': lambda: {'keeper': 'params'}}, spec=keeping.SaltyKeeper, strict=True)
+    expect(mock_manager, times=8).get(aid=ANY()).thenReturn(mock_keeper)
+    expect(mock_keeper, times=8).sign(ser=ANY()).thenReturn(['a signature'])
+
+    mock_response = mock({'json': lambda: {'done': False}}, spec=Response, strict=True)
+    posted = []
+
+    def post(path, json):
+        time.sleep(0.01)
+        posted.append(json['ixn'])
+        return mock_response
+
+    mock_client.post = post  # type: ignore
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: ids.interact('aid1'), range(8)))
+
+    assert [int(ixn['s'], 16) for ixn in posted] == list(range(1, 9))
+    assert all(cur['p'] == prior['d'] for prior, cur in zip(posted, posted[1:]))
+
+    ids.cache.put(dict(hab, name='renamed'))
+    ids.cache.put({'prefix': 'EOtherPrefixxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx', 'name': 'aid2', 'state': {'s': '0'}})
+    assert ids.sequence('aid1') is ids.sequence('renamed')
+    assert ids.sequence('aid1') is not ids.sequence('aid2')
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_anchor_coalescer_merges_seals_into_one_interaction():
+    import threading
+    from requests import HTTPError
+    from signify.app.aiding import AnchorCoalescer, Identifiers
+
+    ids = mock(spec=Identifiers, strict=True)
+    seals = [dict(i=f"E{i}", s="0", d=f"E{i}") for i in range(7)]
+    serder = mock()
+    gate = threading.Event()
+
+    def held(name, data):
+        assert gate.wait(timeout=5)
+        return serder, ['a signature'], {'name': 'op1'}
+
+    expect(ids, times=1).interact("aid1", data=seals[:3]).thenAnswer(held)
+    expect(ids, times=1).interact("aid1", data=seals[3:5]).thenReturn((mock(), [], {'name': 'op2'}))
+    expect(ids, times=1).interact("aid1", data=seals[5:]).thenRaise(HTTPError("500 Server Error"))
+
+    with pytest.raises(ValueError, match="max_seals"):
+        AnchorCoalescer(ids, "aid1", max_seals=0)
+
+    coalescer = AnchorCoalescer(ids, "aid1", window=60.0, max_seals=3)
+    first = coalescer.anchor(seals[0])
+    second = coalescer.anchor(seals[1:3])
+    assert not first.done() and not second.done()  # the full batch is submitted off the caller's thread
+    gate.set()
+
+    assert first.result(timeout=5).serder is second.result(timeout=5).serder is serder
+    assert first.result().op == second.result().op == {'name': 'op1'}
+    assert (first.result().index, second.result().index) == (0, 1)
+
+    with pytest.raises(ValueError, match="max_seals"):
+        coalescer.anchor(seals[:4])
+
+    third = coalescer.anchor(seals[3:5])
+    failed = coalescer.anchor(seals[5:])  # would overflow max_seals so the pending batch goes out alone
+    assert third.result(timeout=5).op == {'name': 'op2'}
+    assert not failed.done()
+    coalescer.close()
+    with pytest.raises(HTTPError):
+        failed.result()
+    with pytest.raises(RuntimeError):
+        coalescer.anchor(seals[0])
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_anchor_coalescer_flushes_when_window_closes():
+    from signify.app.aiding import Identifiers
+
+    ids = Identifiers(client=mock())  # type: ignore
+    seals = [dict(i=f"E{i}", s="0", d=f"E{i}") for i in range(2)]
+    expect(ids, times=1).interact("aid1", data=seals).thenReturn((mock(), [], {'name': 'op1'}))
+
+    coalescer = ids.coalescer("aid1", window=0.01)
+    futures = [coalescer.anchor(seal) for seal in seals]
+
+    assert [future.result(timeout=5).op for future in futures] == [{'name': 'op1'}] * 2
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
+def test_hab_state_cache_drops_entries_it_cannot_advance():
+    from keri.core import eventing
+    from signify.app.aiding import HabStateCache
+
+    cache = HabStateCache()
+    pre = 'EHabPrefixxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx'
+    cache.put({'prefix': pre, 'name': 'aid1', 'state': {'s': '1', 'd': 'EHabDigest'}})
+    cache.put({'prefix': pre, 'name': 'aid2', 'state': {'s': '1', 'd': 'EHabDigest'}})
+
+    cache.advance('aid1', eventing.interact(pre, sn=2, data=[], dig='EOtherDigest'))
+    assert cache.get('aid1') is None
+
+    cache.advance('aid2', eventing.interact(pre, sn=2, data=[], dig='EHabDigest'))
+    assert cache.get('aid2')['state']['s'] == '2'
+
+    # a read issued before the advance and answered after it must not roll the entry back
+    cache.put({'prefix': pre, 'name': 'aid2', 'state': {'s': '1', 'd': 'EHabDigest'}})
+    assert cache.get('aid2')['state']['s'] == '2'
+    cache.put({'prefix': pre, 'name': 'aid2', 'state': {'s': 'a', 'd': 'ELaterDigest'}})
+    assert cache.get('aid2')['state']['d'] == 'ELaterDigest'
+
+    cache.put({'prefix': pre, 'name': 'group1', 'group': {'mhab': {}}, 'state': {'s': '1', 'd': 'EHabDigest'}})
+    assert cache.get('group1') is None
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
 def test_aiding_create_interact_no_submit():
     from signify.app.clienting import SignifyClient
     mock_client = mock(spec=SignifyClient, strict=True)
@@ -831,6 +1119,65 @@ def test_aiding_add_loc_scheme():
     unstub()
 
 
+def test_aiding_add_end_roles_and_loc_schemes(make_mock_response):
+    from signify.app.clienting import SignifyClient
+    from signify.app.coring import Operations
+    from signify.core import keeping
+    mock_client = mock(spec=SignifyClient, strict=True)
+    mock_manager = mock(spec=keeping.Manager, strict=True)
+    mock_client.manager = mock_manager  # type: ignore
+    mock_client.agent = mock({'pre': 'EAgentPre'})  # type: ignore
+
+    from signify.app.aiding import HabStateCache, Identifiers
+    cache = HabStateCache()
+    ids = Identifiers(client=mock_client, cache=cache)  # type: ignore
+    for name in ("aid1", "aid2"):
+        cache.put({'prefix': f'{name} prefix', 'name': name, 'state': {}})
+    expect(ids, times=1).get('missing').thenRaise(ValueError("unknown alias"))
+
+    mock_keeper = mock(spec=keeping.SaltyKeeper, strict=True)
+    expect(mock_manager, times=4).get(aid=ANY).thenReturn(mock_keeper)
+    expect(mock_keeper, times=4).sign(ser=ANY).thenReturn(['a signature'])
+
+    ops = {'aid1': {'name': 'endrole.aid1', 'done': False}, 'aid2': {'name': 'endrole.aid2', 'done': True}}
+    for name, op in ops.items():
+        mock_response = make_mock_response()
+        expect(mock_client, times=1).post(f'/identifiers/{name}/endroles', json=ANY).thenReturn(mock_response)
+        expect(mock_response, times=1).json().thenReturn(op)
+
+    expect(mock_client, times=1).operations().thenReturn(Operations(client=mock_client))  # type: ignore
+    mock_response = make_mock_response()
+    expect(mock_client, times=1).get('/operations/endrole.aid1').thenReturn(mock_response)
+    expect(mock_response, times=1).json().thenReturn({'name': 'endrole.aid1', 'done': True})
+
+    result = ids.add_end_roles(['aid1', {'name': 'aid2', 'role': 'agent'}, 'missing'], max_workers=3)
+
+    aid1, aid2, missing = result
+    assert aid1.rpy.ked['a']['cid'] == 'aid1 prefix'
+    assert aid1.rpy.ked['a']['eid'] == 'EAgentPre'
+    assert aid1.op == {'name': 'endrole.aid1', 'done': True}
+    assert aid2.sigs == ['a signature']
+    assert str(missing.error) == "unknown alias"
+    assert result.summary() == dict(total=3, succeeded=2, failed=1, operations=2, pending=0)
+
+    for name in ("aid1", "aid2"):
+        mock_response = make_mock_response()
+        expect(mock_client, times=1).post(f'/identifiers/{name}/locschemes', json=ANY).thenReturn(mock_response)
+        expect(mock_response, times=1).json().thenReturn({'success': 'yay'})
+
+    result = ids.add_loc_schemes([dict(name=name, url='http://127.0.0.1:3902/', eid='an eid')
+                                  for name in ("aid1", "aid2")])
+
+    assert [item.op for item in result] == [{'success': 'yay'}] * 2
+    assert result.summary() == dict(total=2, succeeded=2, failed=0, operations=0, pending=0)
+
+    with pytest.raises(ValueError):
+        ids.add_loc_schemes([], max_workers=0)
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
 def test_aiding_make_loc_scheme():
     # `makeLocScheme` is intentionally tiny, so the useful assertion here is
     # the exact `/loc/scheme` reply payload shape.
@@ -0,0 +1,432 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.app.test_asyncing module
+
+Testing the asyncio client against an in-process fake KERIA transport
+"""
+import asyncio
+import json
+from urllib.parse import quote
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from keri import kering
+from keri.core import coring, signing
+from keri.help import helping
+from requests import HTTPError
+
+from signify.app.asyncing import AsyncSignifyClient
+from signify.core import authing
+from tests.conftest import TEST_PASSCODE
+
+
+class FakeAgent:
+    """Just enough of a KERIA agent to answer and sign responses."""
+
+    def __init__(self, ctrl, *, forge=False):
+        self.signer = signing.Signer(transferable=False)
+        self.pre = "EAgentAIDxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+        self.ctrl = ctrl
+        self.forge = forge
+        self.requests = []
+        self.total = 1
+        self.states = []
+        self.ops = []
+        self.habs = dict()
+        self.registry = None
+        self.credentials = dict()
+        self.rejected_sn = None
+        self.authn = authing.Authenticater(agent=None, ctrl=self)
+        self.state = dict(i=self.pre, s="0", d=self.pre, di=ctrl.pre, k=[self.signer.verfer.qb64])
+
+    def route(self, request):
+        path = request.url.path
+        if "taken" in path:
+            return 400, dict(title="rejected")
+        if path == f"/agent/{self.ctrl.pre}" and request.method == "GET":
+            return 200, dict(controller=dict(state=self.ctrl.serder.ked, ee=self.ctrl.serder.ked),
+                             agent=self.state, pidx=3)
+        if path == "/identifiers" and request.method == "GET":
+            start, end = map(int, request.headers["range"].split("=")[1].split("-"))
+            return 200, [dict(name=f"aid{i + 1}") for i in range(start, min(end + 1, self.total))]
+        if path == "/identifiers" and request.method == "POST":
+            name = json.loads(request.content)["name"]
+            if name == "taken":
+                return 400, dict(title=f"AID with name {name} already incepted")
+            self.ops.append(f"op.{name}")
+            return 202, dict(name=self.ops[-1], done=False)
+        if path == "/oobis" and request.method == "POST":
+            return 202, dict(name=f"oobi.{json.loads(request.content)['url']}", done=True)
+        if path == "/states":
+            return 200, self.states
+        parts = path.split("/")
+        if len(parts) == 3 and parts[1] == "identifiers" and parts[2] in self.habs and request.method == "GET":
+            return 200, self.habs[parts[2]]
+        if parts[1] == "credentials" and request.method == "GET":
+            return 200, self.credentials[parts[2]]
+        if path.endswith("/registries/reg") and request.method == "GET":
+            return 200, self.registry
+        if path.endswith("/events") and request.method == "POST":
+            ixn = json.loads(request.content)["ixn"]
+            if ixn["s"] == self.rejected_sn:
+                return 400, dict(title="out of order event")
+            return 202, dict(name=f"ixn.{ixn['d']}", done=False)
+        if path.endswith("/credentials") and request.method == "POST":
+            return 202, dict(name=f"credential.{json.loads(request.content)['acdc']['d']}", done=False)
+        if path.endswith("/endroles") and request.method == "POST":
+            return 202, dict(name=f"endrole.{path.split('/')[2]}", done=False)
+        if path.endswith("/locschemes") and request.method == "POST":
+            return 202, dict(success="yay")
+        if path == "/operations":
+            return 200, [dict(name=name, done=len(self.requests) > 6) for name in self.ops]
+        if path.startswith("/operations/"):
+            return 200, dict(name=path.rsplit("/", 1)[1], done=len(self.requests) > 6)
+        return 204, None
+
+    def __call__(self, request):
+        self.requests.append(request)
+        status, body = self.route(request)
+        headers = httpx.Headers({"content-range": f"aids 0-0/{self.total}"})
+        content = b"" if body is None else json.dumps(body).encode("utf-8")
+        if "signature" in request.headers:
+            headers["Signify-Resource"] = self.pre
+            headers["Signify-Timestamp"] = helping.nowIso8601()
+            headers["Content-Length"] = str(len(content))
+            method = "POST" if self.forge else request.method
+            self.authn.sign(headers, method, quote(request.url.path))
+
+        return httpx.Response(status, headers=headers, content=content)
+
+
+async def connected(agent_factory=FakeAgent, **kwargs):
+    client = AsyncSignifyClient(passcode=TEST_PASSCODE)
+    agent = agent_factory(client.ctrl, **kwargs)
+    client.transport = httpx.MockTransport(agent)
+    await client.connect(url="http://keria.example")
+    return client, agent
+
+
+def test_async_client_connects_and_signs_requests():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            assert client.pidx == 3
+            assert client.agent.pre == agent.pre
+            approve = agent.requests[1]
+            assert approve.method == "PUT"
+            assert approve.url.path == f"/agent/{client.controller}"
+
+            res = await client.identifiers().list()
+            assert res == dict(start=0, end=0, total=1, aids=[dict(name="aid1")])
+
+            req = agent.requests[-1]
+            assert req.headers["signify-resource"] == client.controller
+            assert "signature-input" in req.headers
+
+    asyncio.run(run())
+
+
+def test_async_client_iterates_all_identifiers():
+    async def run():
+        client, agent = await connected()
+        agent.total = 7
+        async with client:
+            names = [aid["name"] async for aid in client.identifiers().iter_all(page_size=2, prefetch=2)]
+            assert names == [f"aid{i}" for i in range(1, 8)]
+
+            ranges = [req.headers["range"] for req in agent.requests if req.url.path == "/identifiers"]
+            assert ranges[0] == "aids=0-1"
+            assert sorted(ranges[1:]) == ["aids=2-3", "aids=4-5", "aids=6-7"]
+
+    asyncio.run(run())
+
+
+def test_async_client_creates_identifiers_and_waits():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            identifiers = client.identifiers()
+            results = await asyncio.gather(*[identifiers.create(f"aid{i}") for i in range(3)])
+            assert client.pidx == 6
+
+            bodies = [json.loads(req.content) for req in agent.requests if req.method == "POST"]
+            assert sorted(body["salty"]["pidx"] for body in bodies) == [3, 4, 5]
+            assert all(body["icp"]["t"] == "icp" for body in bodies)
+
+            serder, sigs, op = results[0]
+            assert op == dict(name="op.aid0", done=False)
+            op = await client.operations().wait(op, interval=0.001)
+            assert op["done"] is True
+
+    asyncio.run(run())
+
+
+def test_async_client_creates_many_identifiers():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            result = await client.identifiers().create_many(["a", dict(name="b", algo="bogus"), "taken", "c"],
+                                                            max_workers=2)
+
+            a, b, taken, c = result
+            assert [item.pidx for item in result] == [3, 4, 5, 6]
+            assert result.succeeded == [a, c]
+            assert a.op == dict(name="op.a", done=True)
+            assert b.error is not None and b.serder is None
+            assert isinstance(taken.error, HTTPError)
+            assert client.pidx == 7
+
+            polled = [req.url.path for req in agent.requests if req.url.path.startswith("/operations")]
+            assert polled and set(polled) == {"/operations"}
+
+            _, _, op = await client.identifiers().create("d")
+            assert json.loads(agent.requests[-1].content)["salty"]["pidx"] == 4
+
+            with pytest.raises(HTTPError):
+                await client.identifiers().create("taken")
+            assert await client.reservePidx() == 5
+
+            with pytest.raises(ValueError):
+                await client.identifiers().create_many(["e", dict(algo="salty")])
+            assert client.pidx == 7
+
+    asyncio.run(run())
+
+
+def test_async_client_publishes_many_replies():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            identifiers = client.identifiers()
+            for name in ("aid1", "aid2"):
+                serder, _, _ = await identifiers.create(name)
+                body = json.loads(agent.requests[-1].content)
+                identifiers.cache.put(dict(name=name, prefix=serder.pre, salty=body["salty"], state=serder.ked))
+
+            result = await identifiers.add_end_roles(["aid1", dict(name="aid2", role="agent"), "taken"],
+                                                     max_workers=2)
+
+            aid1, aid2, taken = result
+            assert aid1.rpy.ked["a"]["eid"] == agent.pre
+            assert aid1.op == dict(name="endrole.aid1", done=True)
+            assert aid2.op == dict(name="endrole.aid2", done=True)
+            assert isinstance(taken.error, HTTPError)
+            assert result.summary() == dict(total=3, succeeded=2, failed=1, operations=2, pending=0)
+
+            result = await identifiers.add_loc_schemes([dict(name=name, url="http://127.0.0.1:3902/", eid="an eid")
+                                                        for name in ("aid1", "aid2")])
+            assert [item.op for item in result] == [dict(success="yay")] * 2
+
+            with pytest.raises(ValueError):
+                await identifiers.add_loc_schemes([], max_workers=0)
+
+    asyncio.run(run())
+
+
+def test_async_client_caches_hab_state_and_coalesces_anchors():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            identifiers = client.identifiers()
+            assert identifiers.cache is client.identifiers().cache is not None
+            identifiers.cache.put(dict(name="aid1", prefix="EAid", state=dict(s="0", d="EZero")))
+
+            count = len(agent.requests)
+            assert (await identifiers.getCached("aid1"))["prefix"] == "EAid"
+            assert len(agent.requests) == count
+
+            with pytest.raises(HTTPError):
+                await identifiers.postEvent("aid1", "/identifiers/taken/events", dict(), None)
+            assert identifiers.cache.get("aid1") is None
+
+            identifiers.cache.put(dict(name="aid1", prefix="EAid", state=dict(s="0", d="EZero")))
+            identifiers.cache.put(dict(name="renamed", prefix="EAid", state=dict(s="0", d="EZero")))
+            async with identifiers.sequence("renamed"):
+                with pytest.raises(TimeoutError):
+                    async with asyncio.timeout(0.01):
+                        async with identifiers.sequence("aid1"):
+                            pass
+
+            calls = []
+
+            async def interact(name, data=None):
+                async with identifiers.sequence(name):
+                    calls.append(data)
+                    await asyncio.sleep(0)
+                    return "ixn", [], dict(name=f"op{len(calls)}")
+
+            identifiers.interact = interact
+            async with identifiers.coalescer("aid1", window=0.01, max_seals=3) as anchors:
+                futures = [anchors.anchor(dict(i=str(i))) for i in range(4)]
+                futures.append(anchors.anchor([dict(i="4"), dict(i="5"), dict(i="6")]))
+                with pytest.raises(ValueError, match="max_seals"):
+                    anchors.anchor([dict(i=str(i)) for i in range(4)])
+                with pytest.raises(TypeError):
+                    with anchors:
+                        pass
+
+            assert calls == [[dict(i="0"), dict(i="1"), dict(i="2")], [dict(i="3")],
+                             [dict(i="4"), dict(i="5"), dict(i="6")]]
+            results = [await future for future in futures]
+            assert [(result.op["name"], result.index) for result in results] == [
+                ("op1", 0), ("op1", 1), ("op1", 2), ("op2", 0), ("op3", 0)]
+            with pytest.raises(RuntimeError):
+                anchors.anchor(dict(i="7"))
+
+    asyncio.run(run())
+
+
+def test_async_client_issues_many_credentials():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            identifiers = client.identifiers()
+            serder, _, _ = await identifiers.create("issuer")
+            body = json.loads(agent.requests[-1].content)
+            agent.habs["issuer"] = dict(name="issuer", prefix=serder.pre, salty=body["salty"],
+                                        state=dict(s="0", d=serder.said))
+            regk = coring.Diger(ser=b"registry").qb64
+            agent.registry = dict(regk=regk, pre=serder.pre, state=dict(c=["NB"], s="0", d=regk))
+            agent.rejected_sn = "2"
+
+            schema = coring.Diger(ser=b"schema").qb64
+            items = [dict(data=dict(i=str(i)), schema=schema, timestamp=helping.nowIso8601()) for i in range(4)]
+            items[1]["bogus"] = True
+            result = await client.credentials().issue_many("issuer", "reg", items, chunk_size=2)
+
+            first, bogus, third, fourth = result
+            assert result.succeeded == [first]
+            assert first.anc.ked["s"] == "1"
+            assert first.op() == dict(name=f"credential.{first.acdc.said}", done=False)
+            assert isinstance(bogus.error, TypeError)
+            assert isinstance(third.error, HTTPError) and isinstance(fourth.error, HTTPError)
+            assert third.iss is not None and third.anc is None
+            assert [anc.ked["a"] for anc in result.anchors] == [[dict(i=first.iss.pre, s="0", d=first.iss.said)]]
+            assert result.ops() == [dict(name=f"ixn.{first.anc.said}", done=False)]
+            assert identifiers.cache.get("issuer") == agent.habs["issuer"]
+
+            creder, iserder, anc, sigs, op = await client.credentials().create(
+                agent.habs["issuer"], agent.registry, dict(i="5"), schema)
+            assert op == dict(name=f"credential.{creder.said}", done=False)
+            assert anc.ked["s"] == "1"
+
+    asyncio.run(run())
+
+
+def test_async_client_revokes_many_credentials():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            serder, _, _ = await client.identifiers().create("issuer")
+            body = json.loads(agent.requests[-1].content)
+            agent.habs["issuer"] = dict(name="issuer", prefix=serder.pre, salty=body["salty"],
+                                        state=dict(s="0", d=serder.said))
+            regk = coring.Diger(ser=b"registry").qb64
+            saids = [coring.Diger(ser=f"acdc{i}".encode()).qb64 for i in range(2)]
+            for said in saids:
+                agent.credentials[said] = dict(sad=dict(ri=regk), status=dict(d=coring.Diger(ser=said.encode()).qb64))
+            agent.rejected_sn = "2"
+
+            result = await client.credentials().revoke_many("issuer", [saids[0], "taken", saids[1]], chunk_size=1,
+                                                            max_workers=2)
+
+            first, taken, second = result
+            assert [item.said for item in result] == [saids[0], "taken", saids[1]]
+            assert result.succeeded == [first]
+            assert first.rev.ked["i"] == saids[0] and first.anc.ked["s"] == "1"
+            assert isinstance(taken.error, HTTPError) and taken.rev is None
+            assert isinstance(second.error, HTTPError) and second.anc is None
+            assert len(result.anchors) == 1
+
+            deletes = [req.url.path for req in agent.requests if req.method == "DELETE"]
+            assert deletes == [f"/identifiers/issuer/credentials/{saids[0]}"]
+
+    asyncio.run(run())
+
+
+def test_async_client_waits_for_many_operations():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            waiter = client.operations().waiter([dict(name="op1", done=False), dict(name="op2", done=True)],
+                                                interval=0.001)
+            with pytest.raises(TypeError):
+                iter(waiter)
+
+            ops = [op async for op in waiter]
+            assert ops == [dict(name="op2", done=True), dict(name="op1", done=True)]
+            assert len(waiter) == 0
+
+            polled = [req.url.path for req in agent.requests if req.url.path.startswith("/operations")]
+            assert polled and set(polled) == {"/operations/op1"}
+
+    asyncio.run(run())
+
+
+def test_async_client_resolves_many_oobis():
+    async def run():
+        client, agent = await connected()
+        async with client:
+            result = await client.oobis().resolve_many(["a", ("b", "Bob"), "a"], concurrency=2)
+            assert [item.op["name"] for item in result] == ["oobi.a", "oobi.b", "oobi.a"]
+            assert [item.skipped for item in result] == [False, False, True]
+            assert client.resolved_oobis == {("a", None), ("b", "Bob")}
+
+            result = await client.oobis().resolve_many(["a"])
+            assert result.items[0].skipped and result.items[0].ok
+
+            bodies = [json.loads(req.content) for req in agent.requests if req.url.path == "/oobis"]
+            assert sorted(body["url"] for body in bodies) == ["a", "b"]
+
+    asyncio.run(run())
+
+
+def test_async_client_watches_key_states():
+    from signify.app.coring import KeyStateCache
+
+    async def run():
+        client, agent = await connected()
+        async with client:
+            client.key_state_cache = KeyStateCache()
+            with pytest.raises(ValueError):
+                AsyncSignifyClient(passcode=TEST_PASSCODE).keyStates().watch(print)
+
+            old = dict(i="pre1", s="0", d="d1")
+            new = dict(i="pre1", s="1", d="d1r")
+            client.key_state_cache.put(old)
+            agent.states = [new]
+
+            changes = asyncio.Queue()
+
+            async def callback(*change):
+                await changes.put(change)
+                raise RuntimeError("callback failed")
+
+            async with client.keyStates().watch(callback, interval=0.001) as watcher:
+                assert await asyncio.wait_for(changes.get(), 5) == (old, new)
+                client.key_state_cache.put(old)
+                assert await asyncio.wait_for(changes.get(), 5) == (old, new)
+                assert str(watcher.error) == "callback failed"
+
+            assert watcher._task.done()
+            assert client.key_state_cache.get("pre1") == new
+
+    asyncio.run(run())
+
+
+def test_async_client_rejects_unsigned_agent_response():
+    async def run():
+        client, _ = await connected(forge=True)
+        async with client:
+            with pytest.raises(kering.AuthNError):
+                await client.identifiers().list()
+
+    asyncio.run(run())
+
+
+def test_async_client_bad_passcode_length():
+    with pytest.raises(kering.ConfigurationError, match="too short"):
+        AsyncSignifyClient(passcode="too short")
@@ -53,6 +53,104 @@ def test_signify_client_bad_passcode_length():
         SignifyClient(passcode='too short')
 
 
+def test_signify_client_reserves_pidx_atomically(make_signify_client):
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = make_signify_client()
+    with pytest.raises(ValueError):
+        client.reservePidx(0)
+
+    def reserve(count):
+        return [client.reservePidx(count) for _ in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        blocks = [(start, count) for count, starts in zip([1, 3] * 4, pool.map(reserve, [1, 3] * 4))
+                  for start in starts]
+
+    indexes = sorted(pidx for start, count in blocks for pidx in range(start, start + count))
+    assert indexes == list(range(200 * 4 * (1 + 3)))
+    assert client.pidx == len(indexes)
+
+
+def test_signify_client_parallel_identifier_creation_uses_distinct_pidx(make_signify_client, monkeypatch):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from signify.app.aiding import Identifiers
+
+    def build(self, name, pidx, **kwargs):
+        time.sleep(0.001)
+        return name, [], dict(name=name, salty=dict(pidx=pidx))
+
+    monkeypatch.setattr(Identifiers, "_buildInception", build)
+
+    client = make_signify_client()
+    client.pidx = 5
+    posted = []
+
+    def post(path, json):
+        posted.append(json)
+        return mock({'json': lambda: {'done': False}})
+
+    client.post = post
+
+    identifiers = client.identifiers()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: identifiers.create(f"aid{i}"), range(64)))
+
+    assert sorted(body['salty']['pidx'] for body in posted) == list(range(5, 69))
+    assert client.pidx == 69
+
+
+def test_signify_client_failed_identifier_creation_releases_pidx(make_signify_client, monkeypatch):
+    from requests import HTTPError
+    from signify.app.aiding import Identifiers
+
+    def build(self, name, pidx, **kwargs):
+        if name == "bad":
+            raise ValueError("bad key params")
+        return name, [], dict(name=name, salty=dict(pidx=pidx))
+
+    monkeypatch.setattr(Identifiers, "_buildInception", build)
+
+    client = make_signify_client()
+    client.pidx = 3
+    posted = []
+
+    def post(path, json):
+        if json["name"] in ("rejected", "offline"):
+            status = 400 if json["name"] == "rejected" else 503
+            raise HTTPError(f"{status} Error", response=mock({'status_code': status}))
+        posted.append(json['salty']['pidx'])
+        return mock({'json': lambda: {'done': False}})
+
+    client.post = post
+    identifiers = client.identifiers()
+
+    for name, error in [("bad", ValueError), ("rejected", HTTPError)]:
+        with pytest.raises(error):
+            identifiers.create(name)
+        assert client.pidx == 3
+
+    # an unknown outcome keeps the index, KERIA may have stored the identifier
+    with pytest.raises(HTTPError):
+        identifiers.create("offline")
+    assert client.pidx == 4
+
+    # an index released below the top is handed out again before new ones
+    first, second = client.reservePidx(), client.reservePidx()
+    client.releasePidx(first)
+    assert client.pidx == 6
+    identifiers.create("aid1")
+    identifiers.create("aid2")
+    assert posted == [4, 6]
+
+    client.releasePidx(second)
+    assert client.pidx == 7
+    identifiers.create("aid3")
+    assert posted == [4, 6, 5]
+    assert client.pidx == 7
+
+
 def test_signify_client_boot_caches_booted_agent(make_signify_client):
     import requests
 
@@ -77,7 +175,7 @@ def test_signify_client_connect_no_delegation(make_signify_client, make_mock_ses
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_init_controller = mock(spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_init_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_init_controller)
 
     client = make_signify_client()
     client._booted_agent = authing.Agent(make_agent_state(pre="stale_boot_agent", said="stale_boot_said"))
@@ -85,6 +183,7 @@ def test_signify_client_connect_no_delegation(make_signify_client, make_mock_ses
     import requests
     mock_session = make_mock_session()
     expect(requests, times=1).Session().thenReturn(mock_session)
+    expect(mock_session, times=2).mount(ANY, ANY)
 
     from signify.signifying import SignifyState
     mock_state = mock({'pidx': 0, 'agent': 'agent info', 'controller': 'controller info'}, spec=SignifyState, strict=True)
@@ -98,12 +197,15 @@ def test_signify_client_connect_no_delegation(make_signify_client, make_mock_ses
     mock_serder = mock({'sn': 1}, spec=serdering.Serder, strict=True)
     from keri.core import signing
     mock_salter = mock(spec=signing.Salter, strict=True)
-    mock_controller = mock({'pre': 'a prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, state=mock_state.controller).thenReturn(mock_controller)
+    mock_controller = mock_init_controller
+    mock_controller.pre = 'a prefix'
+    mock_controller.salter = mock_salter
+    mock_controller.serder = mock_serder
+    expect(mock_controller, times=1).rebind(mock_state.controller).thenReturn(mock_controller)
     
     from signify.core import keeping
     mock_manager = mock(spec=keeping.Manager, strict=True)
-    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None).thenReturn(mock_manager)
+    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None, executor=None).thenReturn(mock_manager)
 
     from signify.core import authing
     mock_authenticator = mock({'verify': lambda: {'hook1': 'hook1 info', 'hook2': 'hook2 info'}}, spec=authing.Authenticater, strict=True)
@@ -128,7 +230,7 @@ def test_signify_client_connect_delegation(make_signify_client, make_mock_sessio
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_init_controller = mock(spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_init_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_init_controller)
 
     client = make_signify_client()
     client._booted_agent = authing.Agent(make_agent_state(pre="booted_agent", said="booted_said"))
@@ -137,6 +239,7 @@ def test_signify_client_connect_delegation(make_signify_client, make_mock_sessio
     import requests
     mock_session = make_mock_session()
     expect(requests, times=1).Session().thenReturn(mock_session)
+    expect(mock_session, times=2).mount(ANY, ANY)
 
     from signify.signifying import SignifyState
     mock_state = mock({'pidx': 0, 'agent': 'agent info', 'controller': 'controller info'}, spec=SignifyState, strict=True)
@@ -150,13 +253,15 @@ def test_signify_client_connect_delegation(make_signify_client, make_mock_sessio
     mock_serder = mock({'sn': 0}, spec=serdering.Serder, strict=True)
     from keri.core import signing
     mock_salter = mock(spec=signing.Salter, strict=True)
-    mock_controller = mock({'pre': 'a prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=authing.Controller, strict=True)
-    # when(authing.Controller).thenReturn(mock_controller)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, state=mock_state.controller).thenReturn(mock_controller)
+    mock_controller = mock_init_controller
+    mock_controller.pre = 'a prefix'
+    mock_controller.salter = mock_salter
+    mock_controller.serder = mock_serder
+    expect(mock_controller, times=1).rebind(mock_state.controller).thenReturn(mock_controller)
     
     from signify.core import keeping
     mock_manager = mock(spec=keeping.Manager, strict=True)
-    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None).thenReturn(mock_manager)
+    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None, executor=None).thenReturn(mock_manager)
 
     expect(client, times=1).approveDelegation()
 
@@ -174,6 +279,41 @@ def test_signify_client_connect_delegation(make_signify_client, make_mock_sessio
     verifyNoUnwantedInteractions()
     unstub()
 
+def test_signify_client_connect_derives_controller_keys_once(make_signify_client, make_mock_session, monkeypatch):
+    from keri.app import keeping as keri_keeping
+    calls = []
+    create = keri_keeping.SaltyCreator.create
+
+    def counting(self, *args, **kwargs):
+        calls.append(kwargs.get("ridx"))
+        return create(self, *args, **kwargs)
+
+    monkeypatch.setattr(keri_keeping.SaltyCreator, "create", counting)
+
+    client = make_signify_client()
+    assert calls == [0, 1]
+    ctrl = client.ctrl
+
+    import requests
+    mock_session = make_mock_session()
+    expect(requests, times=1).Session().thenReturn(mock_session)
+    expect(mock_session, times=2).mount(ANY, ANY)
+
+    from signify.signifying import SignifyState
+    agent_state = make_agent_state(pre="connected_agent", said="connected_said")
+    agent_state["di"] = ctrl.pre
+    state = SignifyState(controller={"ee": {"s": "0"}}, agent=agent_state, pidx=3)
+    expect(client, times=1).states().thenReturn(state)
+    expect(client, times=1).approveDelegation()
+
+    client.connect('http://example.com')
+
+    assert calls == [0, 1]
+    assert client.ctrl is ctrl
+    assert client.pidx == 3
+    assert client.authn.ctrl is ctrl
+
+
 def test_signify_client_connect_bad_scheme(make_signify_client):
     client = make_signify_client()
 
@@ -185,7 +325,7 @@ def test_signify_client_connect_bad_delegation():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_init_controller = mock(spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_init_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_init_controller)
     
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -193,6 +333,7 @@ def test_signify_client_connect_bad_delegation():
     import requests
     mock_session = mock(spec=requests.Session, strict=True)
     expect(requests, times=1).Session().thenReturn(mock_session)
+    expect(mock_session, times=2).mount(ANY, ANY)
 
     from signify.signifying import SignifyState
     mock_state = mock({'pidx': 0, 'agent': 'agent info', 'controller': 'controller info'}, spec=SignifyState, strict=True)
@@ -206,12 +347,15 @@ def test_signify_client_connect_bad_delegation():
     mock_serder = mock({'sn': 1}, spec=serdering.Serder, strict=True)
     from keri.core import signing
     mock_salter = mock(spec=signing.Salter, strict=True)
-    mock_controller = mock({'pre': 'a different prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, state=mock_state.controller).thenReturn(mock_controller)
+    mock_controller = mock_init_controller
+    mock_controller.pre = 'a different prefix'
+    mock_controller.salter = mock_salter
+    mock_controller.serder = mock_serder
+    expect(mock_controller, times=1).rebind(mock_state.controller).thenReturn(mock_controller)
     
     from signify.core import keeping
     mock_manager = mock(spec=keeping.Manager, strict=True)
-    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None).thenReturn(mock_manager)
+    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None, executor=None).thenReturn(mock_manager)
 
     from keri.kering import ConfigurationError
     with pytest.raises(ConfigurationError, match='commitment to controller AID missing in agent inception event'):
@@ -225,7 +369,7 @@ def test_signify_client_connect_rejects_mismatched_booted_agent(make_signify_cli
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_init_controller = mock(spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_init_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_init_controller)
 
     client = make_signify_client()
     client._booted_agent = authing.Agent(make_agent_state(pre="booted_agent", said="booted_said"))
@@ -233,6 +377,7 @@ def test_signify_client_connect_rejects_mismatched_booted_agent(make_signify_cli
     import requests
     mock_session = make_mock_session()
     expect(requests, times=1).Session().thenReturn(mock_session)
+    expect(mock_session, times=2).mount(ANY, ANY)
 
     from signify.signifying import SignifyState
     mock_state = mock({'pidx': 0, 'agent': 'agent info', 'controller': 'controller info'}, spec=SignifyState, strict=True)
@@ -245,12 +390,15 @@ def test_signify_client_connect_rejects_mismatched_booted_agent(make_signify_cli
     mock_serder = mock({'sn': 0}, spec=serdering.Serder, strict=True)
     from keri.core import signing
     mock_salter = mock(spec=signing.Salter, strict=True)
-    mock_controller = mock({'pre': 'a prefix', 'salter': mock_salter, 'serder': mock_serder}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, state=mock_state.controller).thenReturn(mock_controller)
+    mock_controller = mock_init_controller
+    mock_controller.pre = 'a prefix'
+    mock_controller.salter = mock_salter
+    mock_controller.serder = mock_serder
+    expect(mock_controller, times=1).rebind(mock_state.controller).thenReturn(mock_controller)
 
     from signify.core import keeping
     mock_manager = mock(spec=keeping.Manager, strict=True)
-    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None).thenReturn(mock_manager)
+    expect(keeping, times=1).Manager(salter=mock_salter, extern_modules=None, executor=None).thenReturn(mock_manager)
 
     from keri.kering import ConfigurationError
     with pytest.raises(ConfigurationError, match='booted agent does not match connected agent state'):
@@ -263,7 +411,7 @@ def test_signify_client_approve_delegation():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
     
     from signify.core import authing
     mock_agent = mock({'delpre': 'a prefix'}, spec=authing.Agent, strict=True)
@@ -289,7 +437,7 @@ def test_signify_client_rotate():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     expect(mock_controller, times=1).rotate(nbran="new bran", aids=["aid1", "aid2"]).thenReturn({'rotate': 'data'})
 
@@ -303,6 +451,47 @@ def test_signify_client_rotate():
     verifyNoUnwantedInteractions()
     unstub()
 
+def test_signify_client_rotate_passcode_pages_identifiers():
+    from signify.core import authing
+    from keri.core.coring import Tiers
+    mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
+
+    from signify.app.clienting import SignifyClient
+    client = SignifyClient(passcode='abcdefghijklmnop01234')
+
+    mock_rotation = mock({'done': 0}, spec=authing.PasscodeRotation, strict=True)
+    expect(authing, times=1).PasscodeRotation(mock_controller, "new bran", checkpoint="rotation.json",
+                                              max_workers=4).thenReturn(mock_rotation)
+
+    from signify.app.aiding import Identifiers
+    mock_ids = mock(spec=Identifiers, strict=True)
+    expect(client, times=1).identifiers().thenReturn(mock_ids)
+    expect(mock_ids, times=1).list(start=0, end=1).thenReturn(dict(start=0, end=1, total=3, aids=["aid1", "aid2"]))
+    expect(mock_ids, times=1).list(start=2, end=3).thenReturn(dict(start=2, end=2, total=3, aids=["aid3"]))
+
+    def recrypt(aids):
+        mock_rotation.done += len(aids)
+        return len(aids)
+
+    mock_rotation.recrypt = recrypt
+    expect(mock_rotation, times=1).finish().thenReturn({'rotate': 'data'})
+    expect(client, times=1).put(path="/agent/a_prefix", json={'rotate': 'data'})
+    expect(mock_rotation, times=1).discard()
+
+    progress = []
+    client.rotatePasscode("new bran", page_size=2, max_workers=4, checkpoint="rotation.json",
+                          progress=lambda done, total: progress.append((done, total)))
+
+    assert progress == [(2, 3), (3, 3)]
+
+    with pytest.raises(ValueError):
+        client.rotatePasscode("new bran", page_size=0)
+
+    verifyNoUnwantedInteractions()
+    unstub()
+
+
 def test_signify_client_properties():
     from keri.core import serdering
     mock_serder = mock(spec=serdering.Serder, strict=True)
@@ -317,7 +506,7 @@ def test_signify_client_properties():
         'serder': mock_serder, 
         'salter': mock_salter
         }, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -342,7 +531,7 @@ def test_signify_client_states(data, expected_pidx):
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -379,7 +568,7 @@ def test_signify_client_states_agent_error():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -409,7 +598,7 @@ def test_signify_client_save_old_salt(status_code, expected):
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -444,7 +633,7 @@ def test_signify_client_delete_old_salt(status_code, expected):
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -472,7 +661,7 @@ def test_signify_client_get():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -519,7 +708,7 @@ def test_signify_client_get_not_ok():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -543,7 +732,7 @@ def test_signify_client_stream():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -568,7 +757,7 @@ def test_signify_client_delete():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -591,7 +780,7 @@ def test_signify_client_delete_not_ok():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -615,7 +804,7 @@ def test_signify_client_post():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -639,7 +828,7 @@ def test_signify_client_post_not_ok():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -664,7 +853,7 @@ def test_signify_client_put():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -688,7 +877,7 @@ def test_signify_client_put_not_ok():
     from signify.core import authing
     from keri.core.coring import Tiers
     mock_controller = mock({'pre': 'a_prefix'}, spec=authing.Controller, strict=True)
-    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low).thenReturn(mock_controller)
+    expect(authing, times=1).Controller(bran='abcdefghijklmnop01234', tier=Tiers.low, executor=None).thenReturn(mock_controller)
 
     from signify.app.clienting import SignifyClient
     client = SignifyClient(passcode='abcdefghijklmnop01234')
@@ -214,6 +214,264 @@ def test_operations_wait_raises_timeout_with_latest_operation(monkeypatch):
     assert "still waiting" in str(excinfo.value)
 
 
+def test_operation_waiter_yields_as_completed_with_shared_backoff(monkeypatch):
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ops = coring.Operations(client=client)  # type: ignore
+
+    lists = []
+    gets = []
+    sleeps = []
+
+    def fake_list(type=None):
+        lists.append(type)
+        return [{"name": "witness.a", "done": False}, {"name": "witness.b", "done": True}]
+
+    def fake_get(name):
+        gets.append(name)
+        return {"name": name, "done": name == "witness.a" or gets.count(name) > 1}
+
+    monkeypatch.setattr(ops, "list", fake_list)
+    monkeypatch.setattr(ops, "get", fake_get)
+    monkeypatch.setattr(coring.time, "sleep", lambda seconds: sleeps.append(seconds))
+
+    waiter = ops.waiter(
+        [
+            {"name": "witness.a", "done": False},
+            {"name": "witness.b", "done": False},
+            {"name": "done.c", "done": True},
+            {"name": "delegation.d", "done": False},
+        ],
+        interval=0.01,
+        backoff=2.0,
+    )
+
+    completed = [op["name"] for op in waiter]
+
+    assert completed == ["done.c", "witness.b", "witness.a", "delegation.d"]
+    assert lists == ["witness"]
+    assert gets == ["delegation.d", "witness.a", "delegation.d"]
+    assert sleeps == [0.01]
+    assert len(waiter) == 0
+
+
+def test_operation_waiter_resolves_dependency_chains(monkeypatch):
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ops = coring.Operations(client=client)  # type: ignore
+
+    states = {
+        "credential.a": iter([
+            {"name": "credential.a", "done": True,
+             "metadata": {"depends": {"name": "witness.x", "done": False}}},
+        ]),
+        "witness.x": iter([
+            {"name": "witness.x", "done": False},
+            {"name": "witness.x", "done": True},
+        ]),
+    }
+
+    def fake_get(name):
+        return next(states[name])
+
+    monkeypatch.setattr(ops, "get", fake_get)
+    monkeypatch.setattr(coring.time, "sleep", lambda seconds: None)
+
+    waiter = coring.OperationWaiter(ops, [
+        {"name": "credential.a", "done": False, "metadata": {"depends": {"name": "witness.x", "done": False}}},
+    ])
+
+    out = waiter.wait()
+
+    assert [op["name"] for op in out] == ["credential.a"]
+
+
+def test_operation_waiter_raises_timeout_with_pending_names(monkeypatch):
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ops = coring.Operations(client=client)  # type: ignore
+
+    now = [0.0]
+    monkeypatch.setattr(ops, "get", lambda name: {"name": name, "done": False})
+    monkeypatch.setattr(coring.time, "sleep", lambda seconds: now.append(now.pop() + 0.4))
+    monkeypatch.setattr(coring.time, "monotonic", lambda: now[0])
+
+    waiter = ops.waiter([{"name": "witness.a", "done": False}], timeout=1.0)
+
+    with pytest.raises(TimeoutError, match="witness.a"):
+        waiter.wait()
+
+
+@pytest.fixture()
+def operation_server(make_signify_client):
+    """Stand-in KERIA serving operation reads and an operation event stream."""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    import requests
+
+    state = dict(ops={}, gets=[], stream_status=200, pushes=[], polled=threading.Event(), done=threading.Event())
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.path == "/operations/stream":
+                self.send_response(state["stream_status"])
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                if state["stream_status"] != 200:
+                    return
+
+                state["polled"].wait(5)
+                for op in state["pushes"]:
+                    self.wfile.write(f"data: {json.dumps(op)}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+                state["done"].wait(5)
+                return
+
+            name = self.path.rsplit("/", 1)[1]
+            state["gets"].append(name)
+            body = json.dumps(state["ops"][name].pop(0)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            state["polled"].set()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    client = make_signify_client()
+    client.base = f"http://127.0.0.1:{server.server_address[1]}"
+    client.session = requests.Session()
+    state["client"] = client
+
+    yield state
+
+    state["done"].set()
+    server.shutdown()
+    server.server_close()
+
+
+def test_operations_wait_completes_on_stream_push(operation_server):
+    import time
+    from signify.app import coring
+
+    operation_server["ops"]["witness.a"] = [{"name": "witness.a", "done": False}]
+    operation_server["pushes"] = [{"name": "other.b", "done": True}, {"name": "witness.a", "done": True, "response": 1}]
+
+    client = operation_server["client"]
+    start = time.monotonic()
+    with coring.OperationStream(client) as stream:
+        out = coring.Operations(client=client).wait(
+            {"name": "witness.a", "done": False},
+            max_interval=30.0,
+            timeout=20.0,
+            stream=stream,
+        )
+
+    assert out == {"name": "witness.a", "done": True, "response": 1}
+    assert operation_server["gets"] == ["witness.a"]
+
+    # closing shuts the response down and joins the reader while the server still holds the stream open
+    assert not stream._thread.is_alive()
+    assert stream.error is None
+    assert stream._ops == {}
+    assert time.monotonic() - start < 10
+
+
+def test_operation_stream_notifies_every_waiter():
+    import json
+    import threading
+    import time
+    from signify.app import coring
+
+    stream = coring.OperationStream(client=None)  # type: ignore
+    stream.connected = True
+
+    stream._push(json.dumps({"name": "other.b", "done": True}))
+    assert stream._ops == {}
+
+    results = []
+    waiters = [threading.Thread(target=lambda: results.append(stream.wait("witness.a", timeout=5)))
+               for _ in range(2)]
+    for waiter in waiters:
+        waiter.start()
+    while stream._waiting.get("witness.a") != 2:
+        time.sleep(0.001)
+
+    stream._push(json.dumps({"name": "witness.a", "done": False}))
+    stream._push(json.dumps({"name": "witness.a", "done": True}))
+    for waiter in waiters:
+        waiter.join(5)
+
+    assert results == [{"name": "witness.a", "done": True}] * 2
+    assert stream._ops == {} and stream._waiting == {}
+
+
+def test_operations_wait_keeps_a_push_landing_between_poll_and_wait():
+    import json
+    import time
+    from signify.app import coring
+
+    stream = coring.OperationStream(client=None)  # type: ignore
+    stream.connected = True
+
+    class RacingOperations(coring.Operations):
+        def get(self, name):
+            # the operation completes right after KERIA answered the poll
+            stream._push(json.dumps({"name": name, "done": True}))
+            return {"name": name, "done": False}
+
+    start = time.monotonic()
+    out = RacingOperations(client=None).wait(  # type: ignore
+        {"name": "witness.a", "done": False},
+        max_interval=30.0,
+        timeout=20.0,
+        stream=stream,
+    )
+
+    assert out == {"name": "witness.a", "done": True}
+    assert time.monotonic() - start < 5
+    assert stream._ops == {} and stream._waiting == {}
+
+
+def test_operations_wait_falls_back_to_polling_when_stream_disconnects(operation_server):
+    from signify.app import coring
+
+    operation_server["stream_status"] = 500
+    operation_server["ops"]["witness.a"] = [{"name": "witness.a", "done": False}, {"name": "witness.a", "done": True}]
+
+    client = operation_server["client"]
+    stream = coring.OperationStream(client).start()
+    stream._thread.join(5)
+
+    assert stream.connected is False
+    assert stream.error is not None
+
+    out = coring.Operations(client=client).wait(
+        {"name": "witness.a", "done": False},
+        interval=0.01,
+        max_interval=30.0,
+        timeout=20.0,
+        stream=stream,
+    )
+
+    assert out == {"name": "witness.a", "done": True}
+    assert operation_server["gets"] == ["witness.a", "witness.a"]
+
+
 def test_operations_wait_options_compatibility_path(monkeypatch):
     from signify.app.clienting import SignifyClient
     client = mock(spec=SignifyClient, strict=True)
@@ -284,6 +542,49 @@ def test_oobis_resolve(make_mock_response):
 
     oobis.resolve("my oobi", alias="Harry")
 
+def test_oobis_resolve_many(make_mock_response):
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+    client.resolved_oobis = {("http://known", None)}
+
+    from signify.app import coring
+    oobis = coring.Oobis(client=client)  # type: ignore
+
+    ops = {
+        "http://a": {"name": "oobi.a", "done": False},
+        "http://b": {"name": "oobi.b", "done": True, "error": {"code": 404}},
+        "http://known": {"name": "oobi.known", "done": True},
+    }
+    for url, alias in (("http://a", "Alice"), ("http://b", None), ("http://known", "Ken")):
+        body = {"url": url} if alias is None else {"url": url, "oobialias": alias}
+        mock_response = make_mock_response()
+        expect(client, times=1).post('/oobis', json=body).thenReturn(mock_response)
+        expect(mock_response, times=1).json().thenReturn(ops[url])
+
+    operations = coring.Operations(client=client)  # type: ignore
+    expect(client, times=1).operations().thenReturn(operations)
+    mock_response = make_mock_response()
+    expect(client, times=1).get('/operations/oobi.a').thenReturn(mock_response)
+    expect(mock_response, times=1).json().thenReturn({"name": "oobi.a", "done": True, "response": {}})
+
+    result = oobis.resolve_many([("http://a", "Alice"), "http://b", "http://known", ("http://a", "Alice"),
+                                 ("http://known", "Ken")], concurrency=2)
+
+    a, b, known, again, alias = result
+    assert [item.url for item in result.succeeded] == ["http://a", "http://known", "http://a", "http://known"]
+    assert result.failed == [b]
+    assert b.error == {"code": 404}
+    assert a.op == again.op == {"name": "oobi.a", "done": True, "response": {}}
+    assert a.elapsed >= 0 and again.elapsed == a.elapsed
+    assert (a.skipped, known.skipped, again.skipped, alias.skipped) == (False, True, True, False)
+    assert known.op is None and known.elapsed is None
+    assert alias.op == {"name": "oobi.known", "done": True}
+    assert client.resolved_oobis == {("http://known", None), ("http://a", "Alice"), ("http://known", "Ken")}
+
+    with pytest.raises(ValueError):
+        oobis.resolve_many(["http://a"], concurrency=0)
+
+
 def test_key_states_get(make_mock_response):
     from signify.app.clienting import SignifyClient
     client = mock(spec=SignifyClient, strict=True)
@@ -306,9 +607,28 @@ def test_key_states_list(make_mock_response):
 
     mock_response = make_mock_response()
     expect(client, times=1).get('/states?pre=pre1&pre=pre2').thenReturn(mock_response)
-    expect(mock_response, times=1).json().thenReturn({'some': 'json'})
+    expect(mock_response, times=1).json().thenReturn([{'i': 'pre2'}, {'i': 'pre1'}])
+
+    assert ks.list(["pre1", "pre2", "pre1"]) == [{'i': 'pre1'}, {'i': 'pre2'}]
 
-    ks.list(["pre1", "pre2"])
+
+def test_key_states_list_chunked(make_mock_response):
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ks = coring.KeyStates(client=client)  # type: ignore
+
+    pres = [f"pre{i}" for i in range(5)]
+    for chunk in (pres[0:2], pres[2:4], pres[4:]):
+        mock_response = make_mock_response()
+        args = "&".join(f"pre={pre}" for pre in chunk)
+        expect(client, times=1).get(f'/states?{args}').thenReturn(mock_response)
+        expect(mock_response, times=1).json().thenReturn([{'i': pre} for pre in reversed(chunk) if pre != "pre3"])
+
+    out = ks.list(pres + pres[::-1], chunk=2, max_workers=3)
+
+    assert out == [{'i': pre} for pre in pres if pre != "pre3"]
 
 def test_key_states_query(make_mock_response):
     from signify.app.clienting import SignifyClient
@@ -324,6 +644,91 @@ def test_key_states_query(make_mock_response):
 
     ks.query("a_prefix", sn=0, anchor={'my': 'anchor'})
 
+def test_key_states_cached(make_mock_response):
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    now = [0.0]
+    cache = coring.KeyStateCache(ttl=10.0, size=2, clock=lambda: now[0])
+    ks = coring.KeyStates(client=client, cache=cache)  # type: ignore
+
+    pre1 = dict(i="pre1", s="0", d="d1")
+    pre2 = dict(i="pre2", s="0", d="d2")
+    first = make_mock_response()
+    expect(client, times=1).get('/states?pre=pre1').thenReturn(first)
+    expect(first, times=1).json().thenReturn([pre1])
+    second = make_mock_response()
+    expect(client, times=1).get('/states?pre=pre2').thenReturn(second)
+    expect(second, times=1).json().thenReturn([pre2])
+
+    assert ks.get("pre1") == [pre1]
+    assert ks.get("pre1") == [pre1]
+    assert ks.list(["pre2", "pre1", "pre2"]) == [pre2, pre1]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    now[0] = 10.0
+    rotated = dict(i="pre1", s="1", d="d1r")
+    third = make_mock_response()
+    expect(client, times=1).get('/states?pre=pre1&pre=pre2').thenReturn(third)
+    expect(third, times=1).json().thenReturn([rotated, pre2])
+
+    assert ks.refresh(["pre1", "pre2"]) == [(pre1, rotated)]
+    assert ks.get("pre1") == [rotated]
+
+    cache.put(dict(i="pre3", s="0", d="d3"))
+    assert cache.prefixes() == ["pre1", "pre3"]
+
+
+def test_key_states_watch(make_mock_response):
+    import threading
+    from signify.app.clienting import SignifyClient
+    client = mock(spec=SignifyClient, strict=True)
+
+    from signify.app import coring
+    ks = coring.KeyStates(client=client, cache=coring.KeyStateCache())  # type: ignore
+    with pytest.raises(ValueError):
+        coring.KeyStates(client=client).watch(print)  # type: ignore
+
+    old = dict(i="pre1", s="0", d="d1")
+    new = dict(i="pre1", s="1", d="d1r")
+    ks.cache.put(old)
+    response = make_mock_response()
+    expect(client, atleast=1).get('/states?pre=pre1').thenReturn(response)
+    expect(response, atleast=1).json().thenReturn([new])
+
+    changes = []
+    changed = threading.Event()
+
+    def callback(*change):
+        changes.append(change)
+        changed.set()
+
+    with ks.watch(callback, interval=0.01):
+        assert changed.wait(5)
+
+    assert changes == [(old, new)]
+    assert ks.cache.get("pre1") == new
+
+    # a failing callback is recorded and the watcher keeps refreshing
+    ks.cache.put(old)
+    calls = []
+
+    def failing(*change):
+        calls.append(change)
+        ks.cache.put(old)
+        raise RuntimeError("callback failed")
+
+    watcher = ks.watch(failing, interval=0.01)
+    try:
+        while len(calls) < 2:
+            threading.Event().wait(0.01)
+        assert str(watcher.error) == "callback failed"
+        assert watcher._thread.is_alive()
+    finally:
+        watcher.close()
+
+
 def test_key_events(make_mock_response):
     from signify.app.clienting import SignifyClient
     client = mock(spec=SignifyClient, strict=True)
@@ -336,3 +741,25 @@ def test_key_events(make_mock_response):
     expect(mock_response, times=1).json().thenReturn({'some': 'json'})
 
     ke.get("my_prefix")
+
+
+def test_key_events_verify(make_mock_response):
+    from signify.app.clienting import SignifyClient
+    from signify.core.verifying import KelVerifier
+    client = mock(spec=SignifyClient, strict=True)
+    verifier = mock(spec=KelVerifier, strict=True)
+
+    from signify.app import coring
+    ke = coring.KeyEvents(client=client)  # type: ignore
+
+    delegate = [{'ked': {'t': 'dip', 'd': 'dip_said', 'di': 'delegator'}, 'atc': ''}]
+    delegator = [{'ked': {'t': 'icp', 'd': 'icp_said'}, 'atc': ''}]
+    for pre, events in (("delegate", delegate), ("delegator", delegator)):
+        mock_response = make_mock_response()
+        expect(client, times=1).get(f'/events?pre={pre}').thenReturn(mock_response)
+        expect(mock_response, times=1).json().thenReturn(events)
+
+    expect(verifier, times=1).verify("delegate", delegate,
+                                     delegators={"delegator": delegator}).thenReturn({'s': '0'})
+
+    assert ke.verify("delegate", verifier) == {'s': '0'}
@@ -5,6 +5,8 @@ signify.app.test_credentialing module
 
 Testing credentialing with unit tests
 """
+from contextlib import nullcontext
+
 import pytest
 from keri.core import eventing, coring
 from keri.peer import exchanging
@@ -12,6 +14,7 @@ from keri.vdr import eventing as veventing
 from mockito import mock, verify, expect, ANY
 
 from signify.app import credentialing
+from signify.app.aiding import Identifiers
 
 
 def test_registries_legacy_create_returns_registry_result(make_mock_client_with_manager, make_mock_response):
@@ -27,6 +30,12 @@ def test_registries_legacy_create_returns_registry_result(make_mock_client_with_
     expect(mock_keeper, times=1).sign(ser=ANY()).thenReturn(['a signature'])
     expect(mock_client, times=1).post(path="/identifiers/aid1/registries", json=ANY()).thenReturn(mock_response)
 
+    from signify.app.aiding import Identifiers
+    mock_ids = mock(spec=Identifiers, strict=True)
+    expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
+    expect(mock_ids, times=1).sequence("aid1").thenReturn(nullcontext())
+    expect(mock_ids, times=1).advance("aid1", ANY())
+
     from signify.app.credentialing import Registries
 
     registries = Registries(client=mock_client)
@@ -51,12 +60,14 @@ def test_registries_name_create_returns_registry_result(make_mock_client_with_ma
                 'name': 'aid1', 'state': {'s': '1', 'd': "ABCDEFG"}}
     regName = "reg1"
 
-    expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
+    expect(mock_client, times=2).identifiers().thenReturn(mock_ids)
+    expect(mock_ids, times=2).sequence("aid1").thenReturn(nullcontext())
     expect(mock_ids, times=1).get("aid1").thenReturn(mock_hab)
     mock_keeper = mock({'algo': 'salty', 'params': lambda: {'keeper': 'params'}}, spec=keeping.SaltyKeeper, strict=True)
     expect(mock_manager, times=2).get(aid=mock_hab).thenReturn(mock_keeper)
     expect(mock_keeper, times=1).sign(ser=ANY()).thenReturn(['a signature'])
     expect(mock_client, times=1).post(path="/identifiers/aid1/registries", json=ANY()).thenReturn(mock_response)
+    expect(mock_ids, times=1).advance("aid1", ANY())
 
     result = credentialing.Registries(client=mock_client).create(
         "aid1",
@@ -77,6 +88,7 @@ def test_registries_name_create_establishment_only_not_implemented(make_mock_cli
     from signify.app.aiding import Identifiers
     mock_ids = mock(spec=Identifiers, strict=True)
     expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
+    expect(mock_ids, times=1).sequence("aid1").thenReturn(nullcontext())
     expect(mock_ids, times=1).get("aid1").thenReturn({
         "prefix": "EPREFIX",
         "name": "aid1",
@@ -234,6 +246,9 @@ def test_registries_create_uses_nb_trait_for_backerless_registry():
             self.manager = DummyManager()
             self.last_post = None
 
+        def identifiers(self):
+            return Identifiers(client=self)
+
         def post(self, path, json):
             self.last_post = (path, json)
             return DummyResponse()
@@ -268,6 +283,39 @@ def test_credentials_list(make_mock_response):
     verify(mock_response, times=1).json()
 
 
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_credentials_iter_pages_through_query(prefetch):
+    from signify.app.credentialing import Credentials
+
+    stored = [{'sad': {'d': f"ESaid{i}"}} for i in range(7)]
+    queries = []
+
+    def post(path, json):
+        assert path == "/credentials/query"
+        queries.append((json['skip'], json['limit']))
+        assert json['filter'] == {'-s': 'ESchema'} and json['sort'] == ['-d']
+        page = stored[json['skip']:json['skip'] + json['limit']]
+        return mock({'json': lambda: page})
+
+    credentials = Credentials(client=mock({'post': post}))  # type: ignore
+
+    out = list(credentials.iter(filter={'-s': 'ESchema'}, sort=['-d'], page_size=3, prefetch=prefetch))
+    assert out == stored
+    assert queries == [(0, 3), (3, 3), (6, 3)]
+
+    queries.clear()
+    stored = stored[:6]
+    gen = credentials.iter(filter={'-s': 'ESchema'}, sort=['-d'], page_size=3, prefetch=prefetch)
+    assert [next(gen) for _ in range(2)] == stored[:2]
+    gen.close()
+    assert queries[0] == (0, 3) and len(queries) <= (2 if prefetch else 1)
+
+    assert list(credentials.iter(filter={'-s': 'ESchema'}, sort=['-d'], page_size=6, prefetch=prefetch)) == stored
+
+    with pytest.raises(ValueError):
+        next(credentials.iter(page_size=0))
+
+
 def test_credentials_get_json(make_mock_response):
     from signify.app.clienting import SignifyClient
     mock_client = mock(spec=SignifyClient, strict=True)
@@ -394,7 +442,8 @@ def test_credentials_issue(make_mock_client_with_manager, make_mock_response):
     recp = "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose"
 
     expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
-    expect(mock_ids, times=1).get("aid1").thenReturn(mock_hab)
+    expect(mock_ids, times=1).sequence("aid1").thenReturn(nullcontext())
+    expect(mock_ids, times=1).getCached("aid1").thenReturn(mock_hab)
     expect(mock_client, times=1).registries().thenReturn(mock_regs)
     expect(mock_regs, times=1).get("aid1", "reg1").thenReturn(mock_registry)
 
@@ -421,6 +470,7 @@ def test_credentials_issue(make_mock_client_with_manager, make_mock_response):
             'salty': {'keeper': 'params'}}
 
     expect(mock_client, times=1).post("/identifiers/aid1/credentials", json=body).thenReturn(mock_response)
+    expect(mock_ids, times=1).advance("aid1", ANY())
 
     result = credentialing.Credentials(client=mock_client).issue(
         "aid1",
@@ -498,6 +548,152 @@ def test_credentials_create(make_mock_client_with_manager, make_mock_response):
     assert op == {'v': 'ACDC10JSON00014c_'}
 
 
+def test_credentials_issue_many_anchors_each_chunk_once(make_mock_client_with_manager, make_mock_response):
+    mock_client, mock_manager = make_mock_client_with_manager()
+
+    from signify.app.aiding import Identifiers
+    from signify.app.credentialing import Registries
+    from signify.core import keeping
+
+    mock_ids = mock(spec=Identifiers, strict=True)
+    mock_regs = mock(spec=Registries, strict=True)
+    mock_hab = {'prefix': 'ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose', 'name': 'aid1',
+                'state': {'s': '1', 'd': "ABCDEFG"}}
+    mock_registry = {'regk': "EKRg7i8jS4O6BYUYiQG7X8YiMYdDXdw28tJRhFndCdGF",
+                     'pre': 'EHpwssa6tmD2U5W7-aogym-r1NobKBNXydP4MmaebA4O', 'state': {'c': ['NB']}}
+    schema = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+    items = [dict(data=dict(dt="2023-09-27T16:27:14.376928+00:00", LEI=f"LEI{i}"), schema=schema) for i in range(3)]
+
+    expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
+    expect(mock_ids, times=1).sequence("aid1").thenReturn(nullcontext())
+    expect(mock_ids, times=1).getCached("aid1").thenReturn(mock_hab)
+    expect(mock_client, times=1).registries().thenReturn(mock_regs)
+    expect(mock_regs, times=1).get("aid1", "reg1").thenReturn(mock_registry)
+
+    mock_keeper = mock({'algo': 'salty', 'params': lambda: {'keeper': 'params'}}, spec=keeping.SaltyKeeper, strict=True)
+    expect(mock_manager, times=7).get(aid=mock_hab).thenReturn(mock_keeper)
+    expect(mock_keeper, times=2).sign(ser=ANY()).thenReturn(['a signature'])
+    mock_anchor_response = make_mock_response({})
+    expect(mock_anchor_response, times=2).json().thenReturn({'name': 'witness.op'})
+    mock_credential_response = make_mock_response({})
+    expect(mock_ids, times=2).postEvent("aid1", "/identifiers/aid1/events", ANY(), ANY()).thenReturn(
+        mock_anchor_response)
+    expect(mock_client, times=3).post("/identifiers/aid1/credentials", json=ANY()).thenReturn(
+        mock_credential_response)
+
+    result = credentialing.Credentials(client=mock_client).issue_many("aid1", "reg1", items, chunk_size=2)
+
+    assert isinstance(result, credentialing.CredentialBatchResult)
+    assert len(result) == 3
+    assert result.ops() == [{'name': 'witness.op'}, {'name': 'witness.op'}]
+
+    first, second = result.anchors
+    assert first.sn == 2
+    assert first.ked['p'] == "ABCDEFG"
+    assert first.ked['a'] == [dict(i=r.iss.ked['i'], s='0', d=r.iss.said) for r in result.results[:2]]
+    assert second.sn == 3
+    assert second.ked['p'] == first.said
+    assert second.ked['a'] == [dict(i=result.results[2].iss.ked['i'], s='0', d=result.results[2].iss.said)]
+    assert [r.anc for r in result] == [first, first, second]
+    assert len({r.acdc.said for r in result}) == 3
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        credentialing.Credentials(client=mock_client).issue_many("aid1", "reg1", items, chunk_size=0)
+
+
+def test_credentials_issue_many_records_failures_and_continues():
+    from signify.app.aiding import HabStateCache
+
+    registry = {'regk': "EKRg7i8jS4O6BYUYiQG7X8YiMYdDXdw28tJRhFndCdGF",
+                'pre': 'EHpwssa6tmD2U5W7-aogym-r1NobKBNXydP4MmaebA4O', 'state': {'c': ['NB']}}
+    schema = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+    items = [dict(data=dict(dt="2023-09-27T16:27:14.376928+00:00", LEI=f"LEI{i}"), schema=schema) for i in range(5)]
+    items[1]["data"] = None
+
+    class DummyKeeper:
+        algo = "salty"
+
+        @staticmethod
+        def params():
+            return {"keeper": "params"}
+
+        @staticmethod
+        def sign(ser):
+            return ["a signature"]
+
+    class DummyManager:
+        @staticmethod
+        def get(aid):
+            return DummyKeeper()
+
+    class DummyRegistries:
+        @staticmethod
+        def get(name, registryName):
+            return registry
+
+    class DummyResponse:
+        def __init__(self, body):
+            self.body = body
+
+        def json(self):
+            return self.body
+
+    class DummyClient:
+        def __init__(self):
+            self.manager = DummyManager()
+            self.state = {"s": "1", "d": "ABCDEFG"}
+            self.cache = HabStateCache()
+            self.reads = 0
+            self.anchors = []
+            self.credentials = []
+
+        def identifiers(self):
+            return Identifiers(client=self, cache=self.cache)
+
+        def registries(self):
+            return DummyRegistries()
+
+        def get(self, path, headers=None):
+            self.reads += 1
+            return DummyResponse({"prefix": "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose", "name": "aid1",
+                                  "state": dict(self.state)})
+
+        def post(self, path, json):
+            if path == "/identifiers/aid1/events":
+                self.anchors.append(json["ixn"])
+                if len(self.anchors) == 2:
+                    raise ConnectionError("anchor dropped")
+                self.state = {"s": json["ixn"]["s"], "d": json["ixn"]["d"]}
+                return DummyResponse({"name": f"witness.{json['ixn']['s']}"})
+
+            self.credentials.append(json["acdc"]["a"]["LEI"])
+            if json["acdc"]["a"]["LEI"] == "LEI0":
+                raise ConnectionError("credential dropped")
+            return DummyResponse({"done": True})
+
+    client = DummyClient()
+    result = credentialing.Credentials(client=client).issue_many("aid1", "reg1", items, chunk_size=2)
+
+    assert len(result) == 5
+    assert [r.ok for r in result] == [False, False, False, False, True]
+    assert result.succeeded == [result.results[4]]
+    assert str(result.results[0].error) == "credential dropped"
+    assert result.results[0].anc is not None
+    assert isinstance(result.results[1].error, TypeError)
+    assert result.results[1].acdc is None
+    assert [str(r.error) for r in result.results[2:4]] == ["anchor dropped"] * 2
+    assert all(r.iss is not None and r.anc is None for r in result.results[2:4])
+
+    # the chunk after the failed anchoring is built on the state read back from KERIA
+    assert client.reads == 2
+    first, third = result.anchors
+    assert [a["s"] for a in client.anchors] == ["2", "3", "3"]
+    assert third.ked["p"] == first.said
+    assert third.ked["a"] == [dict(i=result.results[4].iss.ked["i"], s="0", d=result.results[4].iss.said)]
+    assert client.credentials == ["LEI0", "LEI4"]
+    assert result.ops() == [{"name": "witness.2"}, {"name": "witness.3"}]
+
+
 def test_credentials_revoke_uses_ri_and_returns_result(make_mock_response):
     credential_said = "EMwcsEMUEruPXVwPCW7zmqmN8m0I3CihxolBm-RDrsJo"
     registry_said = "EGK216v1yguLfex4YRFnG7k1sXRjh3OKY7QqzdKsx7df"
@@ -519,9 +715,8 @@ def test_credentials_revoke_uses_ri_and_returns_result(make_mock_response):
         def get(aid):
             return DummyKeeper()
 
-    class DummyIdentifiers:
-        @staticmethod
-        def get(name):
+    class DummyIdentifiers(Identifiers):
+        def get(self, name):
             assert name == "aid1"
             return {"prefix": "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose", "name": "aid1",
                     "state": {"s": "1", "d": "ABCDEFG"}}
@@ -536,9 +731,8 @@ def test_credentials_revoke_uses_ri_and_returns_result(make_mock_response):
             self.manager = DummyManager()
             self.last_delete = None
 
-        @staticmethod
-        def identifiers():
-            return DummyIdentifiers()
+        def identifiers(self):
+            return DummyIdentifiers(client=self)
 
         @staticmethod
         def get(path, headers=None):
@@ -600,9 +794,8 @@ def test_credentials_revoke_falls_back_to_rd(make_mock_response):
         def get(aid):
             return DummyKeeper()
 
-    class DummyIdentifiers:
-        @staticmethod
-        def get(name):
+    class DummyIdentifiers(Identifiers):
+        def get(self, name):
             return {"prefix": "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose", "name": name,
                     "state": {"s": "1", "d": "ABCDEFG"}}
 
@@ -616,9 +809,8 @@ def test_credentials_revoke_falls_back_to_rd(make_mock_response):
             self.manager = DummyManager()
             self.last_delete = None
 
-        @staticmethod
-        def identifiers():
-            return DummyIdentifiers()
+        def identifiers(self):
+            return DummyIdentifiers(client=self)
 
         @staticmethod
         def get(path, headers=None):
@@ -643,6 +835,187 @@ def test_credentials_revoke_falls_back_to_rd(make_mock_response):
     assert result.rev.ked["ri"] == registry_said
     assert client.last_delete[1]["rev"]["ri"] == registry_said
 
+def test_credentials_revoke_many_anchors_each_chunk_once():
+    import threading
+
+    registry_said = "EGK216v1yguLfex4YRFnG7k1sXRjh3OKY7QqzdKsx7df"
+    status_said = "ELUvZ8aJEHAQE-0nsevyYTP98rBbGJUrTj5an-pCmwrK"
+    saids = [coring.Diger(ser=f"credential{i}".encode("utf-8")).qb64 for i in range(3)]
+
+    class DummyKeeper:
+        algo = "salty"
+
+        @staticmethod
+        def params():
+            return {"keeper": "params"}
+
+        @staticmethod
+        def sign(ser):
+            return ["a signature"]
+
+    class DummyManager:
+        @staticmethod
+        def get(aid):
+            return DummyKeeper()
+
+    class DummyIdentifiers(Identifiers):
+        def get(self, name):
+            assert name == "aid1"
+            return {"prefix": "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose", "name": "aid1",
+                    "state": {"s": "1", "d": "ABCDEFG"}}
+
+    class DummyResponse:
+        def __init__(self, body):
+            self.body = body
+
+        def json(self):
+            return self.body
+
+    class DummyClient:
+        def __init__(self):
+            self.manager = DummyManager()
+            self.lock = threading.Lock()
+            self.reads = []
+            self.posts = []
+            self.deletes = []
+
+        def identifiers(self):
+            return DummyIdentifiers(client=self)
+
+        def get(self, path, headers=None):
+            with self.lock:
+                self.reads.append(path)
+            said = path.rsplit("/", 1)[1]
+            return DummyResponse({"sad": {"d": said, "ri": registry_said}, "status": {"d": status_said}})
+
+        def post(self, path, json):
+            self.posts.append((path, json))
+            return DummyResponse({"name": f"witness.{json['ixn']['s']}"})
+
+        def delete(self, path, body=None):
+            with self.lock:
+                self.deletes.append((path, body))
+            return DummyResponse({"done": True})
+
+    client = DummyClient()
+    result = credentialing.Credentials(client=client).revoke_many(
+        "aid1",
+        saids,
+        chunk_size=2,
+        max_workers=2,
+        timestamp="2023-09-27T16:27:14.376928+00:00",
+    )
+
+    assert isinstance(result, credentialing.CredentialBatchResult)
+    assert sorted(client.reads) == sorted(f"/credentials/{said}" for said in saids)
+    assert [r.rev.ked["i"] for r in result] == saids
+    assert all(isinstance(r, credentialing.CredentialRevokeResult) for r in result)
+    assert result.ops() == [{"name": "witness.2"}, {"name": "witness.3"}]
+
+    first, second = result.anchors
+    assert [path for path, _ in client.posts] == ["/identifiers/aid1/events"] * 2
+    assert first.ked["a"] == [dict(i=r.rev.ked["i"], s="1", d=r.rev.said) for r in result.results[:2]]
+    assert second.ked["p"] == first.said
+    assert [r.anc for r in result] == [first, first, second]
+
+    assert sorted(path for path, _ in client.deletes) == sorted(f"/identifiers/aid1/credentials/{said}"
+                                                                for said in saids)
+    for path, body in client.deletes:
+        said = path.rsplit("/", 1)[1]
+        assert body["rev"]["i"] == said
+        assert body["ixn"] == (first.ked if said in saids[:2] else second.ked)
+        assert body["salty"] == {"keeper": "params"}
+
+
+def test_credentials_revoke_many_reports_each_said():
+    import threading
+
+    registry_said = "EGK216v1yguLfex4YRFnG7k1sXRjh3OKY7QqzdKsx7df"
+    status_said = "ELUvZ8aJEHAQE-0nsevyYTP98rBbGJUrTj5an-pCmwrK"
+    saids = [coring.Diger(ser=f"credential{i}".encode("utf-8")).qb64 for i in range(5)]
+
+    class DummyKeeper:
+        algo = "salty"
+
+        @staticmethod
+        def params():
+            return {"keeper": "params"}
+
+        @staticmethod
+        def sign(ser):
+            return ["a signature"]
+
+    class DummyManager:
+        @staticmethod
+        def get(aid):
+            return DummyKeeper()
+
+    class DummyResponse:
+        def __init__(self, body):
+            self.body = body
+
+        def json(self):
+            return self.body
+
+    class DummyClient:
+        def __init__(self):
+            self.manager = DummyManager()
+            self.lock = threading.Lock()
+            self.state = {"s": "1", "d": "ABCDEFG"}
+            self.anchors = []
+            self.deletes = []
+
+        def identifiers(self):
+            return Identifiers(client=self)
+
+        def get(self, path, headers=None):
+            if path == "/identifiers/aid1":
+                return DummyResponse({"prefix": "ELI7pg979AdhmvrjDeam2eAO2SR5niCgnjAJXJHtJose", "name": "aid1",
+                                      "state": dict(self.state)})
+
+            said = path.rsplit("/", 1)[1]
+            if said == saids[0]:
+                raise ConnectionError("read dropped")
+            return DummyResponse({"sad": {"d": said, "ri": registry_said}, "status": {"d": status_said}})
+
+        def post(self, path, json):
+            self.anchors.append(json["ixn"])
+            if len(self.anchors) == 2:
+                raise ConnectionError("anchor dropped")
+            self.state = {"s": json["ixn"]["s"], "d": json["ixn"]["d"]}
+            return DummyResponse({"name": f"witness.{json['ixn']['s']}"})
+
+        def delete(self, path, body=None):
+            said = path.rsplit("/", 1)[1]
+            with self.lock:
+                self.deletes.append(said)
+            if said == saids[2]:
+                raise ConnectionError("revoke dropped")
+            return DummyResponse({"done": True})
+
+    client = DummyClient()
+    result = credentialing.Credentials(client=client).revoke_many(
+        "aid1",
+        saids,
+        chunk_size=2,
+        max_workers=2,
+        timestamp="2023-09-27T16:27:14.376928+00:00",
+    )
+
+    assert [r.said for r in result] == saids
+    assert [r.ok for r in result] == [False, True, False, False, False]
+    assert [str(r.error) for r in result.failed] == ["read dropped", "revoke dropped", "anchor dropped",
+                                                     "anchor dropped"]
+    assert result.results[0].rev is None
+    assert [r.said for r in result.succeeded] == [saids[1]]
+    assert sorted(client.deletes) == sorted(saids[1:3])
+
+    # the state was read back after the failed anchoring, nothing was left to anchor
+    assert len(result.anchors) == 1
+    assert [a["s"] for a in client.anchors] == ["2", "3"]
+    assert result.ops() == [{"name": "witness.2"}]
+
+
 def test_ipex_grant():
     from signify.app.clienting import SignifyClient
     mock_client = mock(spec=SignifyClient, strict=True)
@@ -696,7 +1069,7 @@ def test_ipex_apply():
     mock_atc = ""
 
     expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
-    expect(mock_ids, times=1).get("aid1").thenReturn(mock_hab)
+    expect(mock_ids, times=1).getCached("aid1").thenReturn(mock_hab)
     expect(mock_client, times=1).exchanges().thenReturn(mock_excs)
     expect(mock_excs, times=1).createExchangeMessage(
         sender=mock_hab,
@@ -741,7 +1114,7 @@ def test_ipex_offer():
     mock_atc = ""
 
     expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
-    expect(mock_ids, times=1).get("aid1").thenReturn(mock_hab)
+    expect(mock_ids, times=1).getCached("aid1").thenReturn(mock_hab)
     expect(mock_client, times=1).exchanges().thenReturn(mock_excs)
     expect(mock_excs, times=1).createExchangeMessage(
         sender=mock_hab,
@@ -784,7 +1157,7 @@ def test_ipex_agree():
     mock_atc = ""
 
     expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
-    expect(mock_ids, times=1).get("aid1").thenReturn(mock_hab)
+    expect(mock_ids, times=1).getCached("aid1").thenReturn(mock_hab)
     expect(mock_client, times=1).exchanges().thenReturn(mock_excs)
     expect(mock_excs, times=1).createExchangeMessage(
         sender=mock_hab,
@@ -832,7 +1205,7 @@ def test_ipex_name_grant():
     mock_atc = ""
 
     expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
-    expect(mock_ids, times=1).get("aid1").thenReturn(mock_hab)
+    expect(mock_ids, times=1).getCached("aid1").thenReturn(mock_hab)
     expect(mock_client, times=1).exchanges().thenReturn(mock_excs)
     expect(mock_excs, times=1).createExchangeMessage(
         sender=mock_hab,
@@ -880,7 +1253,7 @@ def test_ipex_name_admit():
     mock_atc = ""
 
     expect(mock_client, times=1).identifiers().thenReturn(mock_ids)
-    expect(mock_ids, times=1).get("aid1").thenReturn(mock_hab)
+    expect(mock_ids, times=1).getCached("aid1").thenReturn(mock_hab)
     expect(mock_client, times=1).exchanges().thenReturn(mock_excs)
     expect(mock_excs, times=1).createExchangeMessage(
         sender=mock_hab,
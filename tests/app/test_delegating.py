@@ -6,6 +6,8 @@ interaction event locally, sign it with the keeper, and post it to the
 delegation endpoint.
 """
 
+from contextlib import nullcontext
+
 from mockito import expect, mock, unstub, verifyNoUnwantedInteractions
 
 
@@ -24,7 +26,8 @@ def test_delegations_approve():
         },
     }
     expect(mock_client, times=1).identifiers().thenReturn(mock_client)
-    expect(mock_client, times=1).get("delegator").thenReturn(hab)
+    expect(mock_client, times=1).getCached("delegator").thenReturn(hab)
+    expect(mock_client, times=1).sequence("delegator").thenReturn(nullcontext())
 
     from keri.core import eventing
     mock_serder = mock({"ked": {"t": "ixn"}, "raw": b"ixn-bytes"}, strict=True)
@@ -41,13 +44,15 @@ def test_delegations_approve():
     expect(mock_keeper, times=1).params().thenReturn({"keeper": "params"})
 
     mock_response = mock({"json": lambda: {"name": "op1", "done": False}}, strict=True)
-    expect(mock_client, times=1).post(
+    expect(mock_client, times=1).postEvent(
+        "delegator",
         "/identifiers/delegator/delegation",
-        json={
+        {
             "ixn": {"t": "ixn"},
             "sigs": ["sig1", "sig2"],
             "salty": {"keeper": "params"},
         },
+        mock_serder,
     ).thenReturn(mock_response)
 
     from signify.app.delegating import Delegations
@@ -63,3 +68,57 @@ def test_delegations_approve():
 
     unstub()
     verifyNoUnwantedInteractions()
+
+
+def test_delegations_approve_many():
+    # Anchors are chunked into consecutive ixn events, each built on the
+    # locally advanced delegator state, and their operations waited on together.
+    # KERIA names the operation of each event after the delegate of its first seal.
+    from mockito import ANY
+
+    from signify.app.aiding import EventSequencer, HabStateCache, Identifiers
+    from signify.app.clienting import SignifyClient
+    from signify.app.coring import Operations
+    from signify.core import keeping
+
+    mock_client = mock(spec=SignifyClient, strict=True)
+    mock_manager = mock(spec=keeping.Manager, strict=True)
+    mock_client.manager = mock_manager  # type: ignore
+
+    from keri.core import coring
+    pre, dig = (coring.Diger(ser=ser).qb64 for ser in (b"delegator", b"anchor"))
+    cache = HabStateCache()
+    cache.put({"name": "delegator", "prefix": pre, "state": {"s": "4", "d": dig, "p": ""}})
+    identifiers = Identifiers(client=mock_client, cache=cache, sequencer=EventSequencer())  # type: ignore
+    expect(mock_client, times=1).identifiers().thenReturn(identifiers)
+
+    mock_keeper = mock({"algo": "salty"}, strict=True)
+    expect(mock_manager, times=3).get(aid=ANY).thenReturn(mock_keeper)
+    expect(mock_keeper, times=3).sign(ser=ANY).thenReturn(["sig"])
+    expect(mock_keeper, times=3).params().thenReturn({"keeper": "params"})
+
+    posted = []
+
+    def post(path, json):
+        posted.append(json["ixn"])
+        return mock({"json": lambda: {"name": f"delegation.{json['ixn']['a'][0]['i']}", "done": True}})
+
+    mock_client.post = post  # type: ignore
+    expect(mock_client, times=1).operations().thenReturn(Operations(client=mock_client))  # type: ignore
+
+    from signify.app.delegating import Delegations
+
+    delegates = [coring.Diger(ser=f"delegate{i}".encode()).qb64 for i in range(5)]
+    anchors = [{"i": delegate, "s": "0", "d": delegate} for delegate in delegates]
+    approvals = Delegations(client=mock_client).approve_many("delegator", anchors, chunk=2)
+
+    assert [ixn["s"] for ixn in posted] == ["5", "6", "7"]
+    assert [ixn["a"] for ixn in posted] == [anchors[0:2], anchors[2:4], anchors[4:]]
+    assert posted[0]["p"] == dig
+    assert posted[1]["p"] == posted[0]["d"] and posted[2]["p"] == posted[1]["d"]
+    assert [op["name"] for _, _, op in approvals] == [f"delegation.{delegates[i]}" for i in (0, 2, 4)]
+    assert [serder.ked["a"] for serder, _, _ in approvals] == [anchors[0:2], anchors[2:4], anchors[4:]]
+    assert cache.get("delegator")["state"]["s"] == "7"
+
+    unstub()
+    verifyNoUnwantedInteractions()
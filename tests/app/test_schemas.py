@@ -41,3 +41,26 @@ def test_schemas_list(make_mock_response):
 
     verifyNoUnwantedInteractions()
     unstub()
+
+
+def test_schemas_get_cached(make_mock_response):
+    from keri.core import coring
+    from signify.app.clienting import SignifyClient
+    from signify.core.caching import SaidCache
+    mock_client = mock(spec=SignifyClient, strict=True)
+
+    _, sad = coring.Saider.saidify(sad={"$id": "", "title": "Cached"}, label=coring.Saids.dollar)
+    said = sad["$id"]
+    mock_response = make_mock_response({"json": lambda: {}})
+    expect(mock_client, times=1).get(f"/schema/{said}").thenReturn(mock_response)
+    expect(mock_response, times=1).json().thenReturn(sad)
+
+    from signify.app.schemas import Schemas
+    schemas = Schemas(client=mock_client, cache=SaidCache())  # type: ignore
+
+    assert schemas.get(said) == sad
+    assert schemas.get(said) == sad
+    assert schemas.cache.hits == 1
+
+    verifyNoUnwantedInteractions()
+    unstub()
@@ -180,6 +180,23 @@ def test_controller_derive():
                           b'A3jjXxqYawLcV"],"bt":"0","br":[],"ba":[],"a":[]}')
 
 
+def test_controller_rebind_keeps_signers():
+    from signify.core.authing import Controller
+    from signify.signifying import SignifyState
+    ctrl = Controller(bran="abcdefghijklmnop01234", tier=Tiers.low)
+    signer, nsigner = ctrl.signer, ctrl.nsigner
+    icp = ctrl.serder
+
+    assert ctrl.rebind({"ee": {"s": "0"}}) is ctrl
+    assert ctrl.serder.raw == icp.raw
+    assert ctrl.signer is signer
+    assert ctrl.nsigner is nsigner
+
+    ctrl.rebind(SignifyState(controller={"ee": icp.ked}))
+    assert ctrl.serder.said == icp.said
+    assert ctrl.signer is signer
+
+
 def test_approve_delegation_builds_expected_interact_event():
     from signify.core.authing import Controller
     ctrl = Controller(bran="abcdefghijklmnop01234", tier=Tiers.low)
@@ -241,10 +258,13 @@ def test_approve_delegation_returns_controller_signature():
     unstub()
 
 
-def test_controller_rotate_salty():
+@pytest.mark.parametrize("backend", [None, "thread"])
+def test_controller_rotate_salty(backend):
     from signify.core.authing import Controller
+    from signify.core.keeping import DerivationExecutor
     from keri.core.coring import Tiers
-    ctrl = Controller(bran="abcdefghijklmnop01234", tier=Tiers.low)    
+    executor = DerivationExecutor(backend) if backend is not None else None
+    ctrl = Controller(bran="abcdefghijklmnop01234", tier=Tiers.low, executor=executor)
 
     aid_one = {
                "name": "aid1", 
@@ -269,6 +289,10 @@ def test_controller_rotate_salty():
     assert out['keys']['ELUvZ8aJEHAQE-0nsevyYTP98rBbGJUrTj5an-pCmwrK']['sxlt'] != "1AAH2R_SPhr_5vIBGGtyVamaGVDQAcYlgmwDOkJwM-q6Qw8K5NT7jLzJ0k6_7sa3oyKK33ym8JX1Il4MoUiy8ixYwsVWYhaU3sMT" # type: ignore
     assert signing.Cipher(qb64=out["sxlt"]).code == coring.MtrDex.X25519_Cipher_Salt
     assert signing.Cipher(qb64=out["keys"]["ELUvZ8aJEHAQE-0nsevyYTP98rBbGJUrTj5an-pCmwrK"]["sxlt"]).code == coring.MtrDex.X25519_Cipher_Salt
+    assert out["rot"]["k"] == [ctrl.signer.verfer.qb64, Controller(bran="abcdefghijklmnop01234", tier=Tiers.low).nsigner.verfer.qb64]
+
+    if executor is not None:
+        executor.close()
 
 
 def test_ctlr_rotate_migrates_on_write_4C_to_1AAH_salty_sxlt_cipher():
@@ -352,3 +376,41 @@ def test_controller_rotate_randy():
         for nxt in rotated["nxts"]
     ]
     assert [coring.Diger(ser=nsigner.verfer.qb64b).qb64 for nsigner in nsigners] == digers
+
+
+def test_passcode_rotation_resumes_from_checkpoint(tmp_path):
+    from signify.core.authing import Controller, PasscodeRotation
+    from signify.core.keeping import RandyKeeper
+    ctrl = Controller(bran="abcdefghijklmnop01234", tier=Tiers.low)
+
+    aids = []
+    for i in range(3):
+        keeper = RandyKeeper(ctrl.salter, transferable=True)
+        pubs, _ = keeper.incept(transferable=True)
+        aids.append({"name": f"aid{i}", "prefix": f"EPrefix{i}", "randy": keeper.params(), "state": {"k": pubs}})
+    aids.append({"name": "group", "prefix": "EGroup", "group": {"mhab": {}}, "state": {"k": []}})
+
+    broken = dict(aids[1], state={"k": ["DWrongKey"]})
+    checkpoint = str(tmp_path / "rotation.json")
+
+    rotation = PasscodeRotation(ctrl, "0123456789abcdefghijk", checkpoint=checkpoint, max_workers=2)
+    with pytest.raises(kering.ValidationError):
+        rotation.recrypt([aids[0], broken, aids[2], aids[3]])
+    assert rotation.done == 3
+
+    resumed = PasscodeRotation(ctrl, "0123456789abcdefghijk", checkpoint=checkpoint)
+    assert resumed.seen == {"EPrefix0", "EPrefix2", "EGroup"}
+    assert resumed.keys == rotation.keys
+    assert resumed.recrypt(aids) == 1
+
+    data = resumed.finish()
+    assert sorted(data["keys"]) == ["EPrefix0", "EPrefix1", "EPrefix2"]
+    assert data["keys"]["EPrefix0"] == rotation.keys["EPrefix0"]
+    assert data["rot"]["k"][0] == ctrl.signer.verfer.qb64
+
+    # a checkpoint written for another controller state is ignored
+    assert PasscodeRotation(Controller(bran="0123456789abcdefghijk", tier=Tiers.low), "abcdefghijklmnop01234",
+                            checkpoint=checkpoint).done == 0
+
+    resumed.discard()
+    assert not (tmp_path / "rotation.json").exists()
@@ -0,0 +1,86 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.test_caching module
+
+Testing the content-addressed SAID cache
+"""
+import json
+import os
+
+from keri.core import coring
+
+from signify.core.caching import SaidCache, verifyExchange, verifySchema
+
+
+def schema(title):
+    sad = {"$id": "", "$schema": "http://json-schema.org/draft-07/schema#", "title": title, "type": "object"}
+    _, sad = coring.Saider.saidify(sad=sad, label=coring.Saids.dollar)
+    return sad["$id"], json.dumps(sad).encode("utf-8")
+
+
+def test_said_cache_lru_and_counters():
+    cache = SaidCache(size=2)
+    docs = [schema(f"Schema {i}") for i in range(3)]
+
+    for said, raw in docs:
+        assert cache.put(said, raw, verifySchema) is True
+
+    assert len(cache) == 2
+    assert cache.get(docs[0][0], verifySchema) is None
+    assert cache.get(docs[2][0], verifySchema) == docs[2][1]
+    assert cache.stats() == dict(size=2, hits=1, misses=1, bytes=len(docs[1][1]) + len(docs[2][1]),
+                                 hitBytes=len(docs[2][1]))
+
+    said, raw = docs[0]
+    assert cache.put(said, raw.replace(b"Schema 0", b"Schema X"), verifySchema) is False
+    assert cache.put("../" + said, raw, verifySchema) is False
+    assert cache.get("../" + said, verifySchema) is None
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.bytes == 0
+
+
+def test_said_cache_fetches_once(tmp_path):
+    said, raw = schema("Fetched")
+    calls = []
+
+    def fetch():
+        calls.append(said)
+        return json.loads(raw)
+
+    cache = SaidCache(directory=str(tmp_path))
+    assert cache.getJson(said, fetch, verifySchema) == json.loads(raw)
+    assert cache.getJson(said, fetch, verifySchema) == json.loads(raw)
+    assert calls == [said]
+
+    # a fresh process only has the disk tier
+    cache = SaidCache(directory=str(tmp_path))
+    assert cache.getJson(said, fetch, verifySchema) == json.loads(raw)
+    assert calls == [said]
+    assert cache.hits == 1
+
+
+def test_said_cache_drops_tampered_disk_entries(tmp_path):
+    said, raw = schema("Tampered")
+    cache = SaidCache(size=0, directory=str(tmp_path))
+    assert cache.put(said, raw, verifySchema) is True
+
+    path = os.path.join(tmp_path, said)
+    with open(path, "wb") as f:
+        f.write(raw.replace(b"Tampered", b"Tampxred"))
+
+    assert cache.get(said, verifySchema) is None
+    assert not os.path.exists(path)
+    assert cache.misses == 1
+
+
+def test_verify_exchange():
+    exn = dict(v="KERI10JSON000000_", t="exn", d="", i="EAID", r="/ipex/grant", a={})
+    _, exn = coring.Saider.saidify(sad=exn)
+    raw = json.dumps(dict(exn=exn, pathed={})).encode("utf-8")
+
+    assert verifyExchange(exn["d"], raw) is True
+    assert verifyExchange(exn["d"], raw.replace(b"grant", b"admit")) is False
+    assert verifyExchange(exn["d"], b"not json") is False
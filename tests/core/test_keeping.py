@@ -130,7 +130,8 @@ def test_keeping_manager_get_salty():
 
     from signify.core import keeping
     mock_keeper = mock(spec=keeping.SaltyKeeper, strict=True)
-    expect(keeping, times=1).SaltyKeeper(salter=mock_salter, pidx=0, dcode='E').thenReturn(mock_keeper)
+    expect(keeping, times=1).SaltyKeeper(salter=mock_salter, cache=manager.signer_cache, executor=manager.executor,
+                                         pidx=0, dcode='E').thenReturn(mock_keeper)
 
     actual = manager.get({'prefix': 'aid1 prefix', 'salty': {'dcode': 'E', 'pidx': 0}})
 
@@ -252,6 +253,52 @@ def test_keeping_manager_get_group_uses_group_ndigs_for_prior_next_snapshot():
     verifyNoUnwantedInteractions()
     unstub()
 
+def test_keeping_manager_get_caches_keepers():
+    from keri.core import signing
+    from signify.core.keeping import Manager, SaltyKeeper
+
+    salter = signing.Salter(raw=b'0123456789abcdef')
+    manager = Manager(salter=salter)
+
+    keeper = manager.new('salty', 0, bran='0123456789abcdefghijk')
+    verfers, _ = keeper.incept(transferable=True)
+    prefix = core_coring.Prefixer(qb64=verfers[0]).qb64
+    aid = dict(prefix=prefix, state=dict(d='digest 0'), salty=keeper.params())
+
+    calls = []
+    original = SaltyKeeper.__init__
+
+    def counting(self, *args, **kwargs):
+        calls.append(kwargs)
+        original(self, *args, **kwargs)
+
+    SaltyKeeper.__init__ = counting
+    try:
+        first = manager.get(aid)
+        second = manager.get(aid)
+        assert len(calls) == 1
+        assert first is not second
+        assert [s.qb64 for s in second.signers()] == [s.qb64 for s in first.signers()]
+        assert manager.signer_cache.hits == 1
+
+        # mutating a handed out keeper does not leak into the cache
+        second.rotate(ncodes=[core_coring.MtrDex.Ed25519_Seed], transferable=True)
+        assert manager.get(aid).kidx == 0
+        assert len(calls) == 1
+
+        manager.get(dict(aid, state=dict(d='digest 1')))
+        assert len(calls) == 2
+
+        manager.invalidate(prefix)
+        manager.get(aid)
+        assert len(calls) == 3
+
+        manager.invalidate()
+        assert len(manager.signer_cache) == 0
+    finally:
+        SaltyKeeper.__init__ = original
+
+
 def test_salty_keeper():
     # salty keep init mocks
     from keri.core.signing import Salter, Signer
@@ -580,6 +627,114 @@ def test_salty_keeper_sign():
     verifyNoUnwantedInteractions()
     unstub()
 
+def test_salty_keeper_signers_use_cache():
+    from keri.core import signing
+    from signify.core.keeping import SaltyKeeper, SignerCache
+
+    salter = signing.Salter(raw=b'0123456789abcdef')
+    cache = SignerCache(size=4)
+    sk = SaltyKeeper(salter, pidx=0, bran='0123456789abcdefghijk', cache=cache)
+    sk.incept(transferable=True)
+
+    first = sk.signers()
+    assert [s.qb64 for s in sk.signers()] == [s.qb64 for s in first]
+    assert sk.signers()[0] is not first[0]
+    assert cache.stats() == dict(size=1, hits=2, misses=1, evictions=0, hitRate=2 / 3)
+
+    # A keeper rebuilt from the same stored params shares the cached signers
+    other = SaltyKeeper(salter, cache=cache, **sk.params())
+    assert [s.qb64 for s in other.signers()] == [s.qb64 for s in first]
+    assert cache.hits == 3
+
+    uncached = SaltyKeeper(salter, pidx=0, bran='0123456789abcdefghijk')
+    uncached.incept(transferable=True)
+    assert [s.qb64 for s in uncached.signers()] == [s.qb64 for s in first]
+
+    sk.rotate(ncodes=[core_coring.MtrDex.Ed25519_Seed], transferable=True)
+    assert len(cache) == 0
+    assert first[0].raw != bytes(len(first[0].raw))
+    assert sk.signers()[0].verfer.qb64 != first[0].verfer.qb64
+
+
+def test_salty_keeper_signers_survive_eviction():
+    from keri.core import signing
+    from signify.core.keeping import SaltyKeeper, SignerCache
+
+    salter = signing.Salter(raw=b'0123456789abcdef')
+    cache = SignerCache(size=1)
+    a = SaltyKeeper(salter, pidx=0, bran='0123456789abcdefghijk', cache=cache)
+    a.incept(transferable=True)
+    b = SaltyKeeper(salter, pidx=1, bran='0123456789abcdefghijk', cache=cache)
+    b.incept(transferable=True)
+
+    signers = a.signers()
+    b.signers()
+    assert cache.evictions == 1
+
+    # signers handed out before the eviction still produce valid signatures
+    signer = signers[0]
+    assert signer.verfer.verify(signer.sign(b'abcdef').raw, b'abcdef')
+    assert a.sign(b'abcdef') == [signer.sign(b'abcdef', index=0).qb64]
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_derivation_executor_matches_inline_derivation(backend):
+    from keri import kering
+    from keri.core import signing
+    from signify.core.keeping import DerivationExecutor, SaltyKeeper
+
+    salter = signing.Salter(raw=b'0123456789abcdef')
+    inline = SaltyKeeper(salter, pidx=0, bran='0123456789abcdefghijk', count=2)
+    keys = inline.incept(transferable=True)
+    rotated = inline.rotate(ncodes=[core_coring.MtrDex.Ed25519_Seed] * 2, transferable=True)
+
+    with DerivationExecutor(backend, max_workers=2) as executor:
+        sk = SaltyKeeper(salter, pidx=0, bran='0123456789abcdefghijk', count=2, executor=executor)
+        assert sk.incept(transferable=True) == keys
+        assert sk.rotate(ncodes=[core_coring.MtrDex.Ed25519_Seed] * 2, transferable=True) == rotated
+        assert [s.qb64 for s in sk.signers()] == [s.qb64 for s in inline.signers()]
+        assert all(s.verfer.transferable for s in sk.signers())
+
+        assert executor.createMany([]) == []
+
+    with pytest.raises(kering.ConfigurationError):
+        DerivationExecutor("gpu")
+
+
+def test_signer_cache_evicts_and_scrubs():
+    from keri.core import signing
+    from signify.core.keeping import SignerCache
+
+    cache = SignerCache(size=2)
+    made = {}
+
+    def creator(name):
+        def create():
+            made[name] = [signing.Signer()]
+            return made[name]
+        return create
+
+    cache.get(('a',), creator('a'))
+    handed = cache.get(('b',), creator('b'))
+    cache.get(('a',), creator('a2'))
+    cache.get(('c',), creator('c'))
+
+    assert 'a2' not in made
+    assert cache.evictions == 1
+    assert made['b'][0].raw == bytes(32)
+    assert made['a'][0].raw != bytes(32)
+    assert handed[0].raw != bytes(32)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert made['a'][0].raw == bytes(32)
+
+    disabled = SignerCache(size=0)
+    disabled.get(('a',), creator('d'))
+    assert len(disabled) == 0
+    assert disabled.misses == 1
+
+
 def test_randy_keeper():
     from keri.core.signing import Salter, Signer
     mock_salter = mock(spec=Salter, strict=True)
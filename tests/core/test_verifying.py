@@ -0,0 +1,114 @@
+# -*- encoding: utf-8 -*-
+"""
+SIGNIFY
+signify.core.test_verifying module
+
+Testing offline KEL verification against KELs exported from keripy habitats
+"""
+import pytest
+from keri import core, kering
+from keri.app import habbing
+from keri.core import coring, eventing, serdering, signing
+
+from signify.core.verifying import KelVerifier
+
+
+def export(hby, pre):
+    """Export a KEL the way KERIA's ``/events`` endpoint serves it."""
+    events = []
+    for _, fn, dig in hby.db.getFelItemPreIter(pre.encode("utf-8"), fn=0):
+        raw = hby.db.cloneEvtMsg(pre=pre.encode("utf-8"), fn=fn, dig=dig)
+        serder = serdering.SerderKERI(raw=raw)
+        events.append(dict(ked=serder.ked, atc=bytes(raw[serder.size:]).decode("utf-8")))
+    return events
+
+
+@pytest.fixture()
+def hby():
+    salt = signing.Salter(raw=b"0123456789abcdef").qb64
+    with habbing.openHby(name="verifier", temp=True, salt=salt) as hby:
+        yield hby
+
+
+def delegate(delegator):
+    """Incept a delegated AID anchored by ``delegator`` and return its KEL."""
+    signer = signing.Signer(raw=b"1" * 32, transferable=True)
+    nsigner = signing.Signer(raw=b"2" * 32, transferable=True)
+    dip = eventing.delcept(keys=[signer.verfer.qb64], delpre=delegator.pre,
+                           ndigs=[coring.Diger(ser=nsigner.verfer.qb64b).qb64])
+    ixn = serdering.SerderKERI(raw=delegator.interact(data=[dict(i=dip.pre, s="0", d=dip.said)]))
+
+    msg = eventing.messagize(dip, sigers=[signer.sign(dip.raw, index=0)])
+    atc = bytearray(msg[dip.size:])
+    atc.extend(core.Counter(code=core.Codens.SealSourceCouples, count=1, gvrsn=kering.Vrsn_1_0).qb64b)
+    atc.extend(coring.Seqner(sn=ixn.sn).qb64b + ixn.saidb)
+    return dip.pre, [dict(ked=dip.ked, atc=atc.decode("utf-8"))]
+
+
+def test_kel_verifier_checkpoints(hby, tmp_path):
+    hab = hby.makeHab(name="aid1", icount=1, isith="1", ncount=1, nsith="1")
+    hab.interact(data=[])
+    hab.rotate()
+
+    verifier = KelVerifier(directory=str(tmp_path))
+    state = verifier.verify(hab.pre, export(hby, hab.pre))
+    assert state["s"] == "2"
+    assert state["et"] == "rot"
+    assert state["k"] == [verfer.qb64 for verfer in hab.kever.verfers]
+
+    hab.interact(data=[])
+    events = export(hby, hab.pre)
+
+    # earlier events are not replayed again, the tail is checked against the checkpointed state
+    verifier = KelVerifier(directory=str(tmp_path))
+    tampered = [dict(events[0], atc=events[1]["atc"])] + events[1:]
+    state = verifier.verify(hab.pre, tampered)
+    assert state["s"] == "3"
+    assert state["d"] == hab.kever.serder.said
+
+    with pytest.raises(kering.ValidationError, match="diverges from its checkpoint"):
+        verifier.verify(hab.pre, events[:2])
+
+
+def test_kel_verifier_rejects_bad_signatures(hby):
+    hab = hby.makeHab(name="aid1", icount=1, isith="1", ncount=1, nsith="1")
+    hab.interact(data=[])
+    other = hby.makeHab(name="aid2", icount=1, isith="1", ncount=1, nsith="1")
+    other.interact(data=[])
+
+    events = export(hby, hab.pre)
+    events[1]["atc"] = export(hby, other.pre)[1]["atc"]
+
+    states, errors = KelVerifier().verifyMany({hab.pre: events, other.pre: export(hby, other.pre), "Eempty": []})
+    assert list(states) == [other.pre]
+    assert errors[hab.pre] == f"key event log of {hab.pre} failed verification after sn=0"
+    assert errors["Eempty"] == "key event log of Eempty is empty"
+
+
+def test_kel_verifier_delegation(hby):
+    delegator = hby.makeHab(name="delegator", icount=1, isith="1", ncount=1, nsith="1")
+    pre, events = delegate(delegator)
+
+    with pytest.raises(kering.ValidationError):
+        KelVerifier().verify(pre, events)
+
+    state = KelVerifier().verify(pre, events, delegators={delegator.pre: export(hby, delegator.pre)})
+    assert state["di"] == delegator.pre
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_kel_verifier_fans_out(hby, backend):
+    delegator = hby.makeHab(name="delegator", icount=1, isith="1", ncount=1, nsith="1")
+    pre, events = delegate(delegator)
+
+    kels = {pre: events}
+    for i in range(4):
+        hab = hby.makeHab(name=f"aid{i}", icount=1, isith="1", ncount=1, nsith="1")
+        hab.rotate()
+        kels[hab.pre] = export(hby, hab.pre)
+    kels[delegator.pre] = export(hby, delegator.pre)
+
+    states, errors = KelVerifier(backend=backend, max_workers=3).verifyMany(kels)
+
+    assert errors == {}
+    assert set(states) == set(kels)
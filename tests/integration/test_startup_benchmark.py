@@ -0,0 +1,67 @@
+"""Live startup timing per controller tier.
+
+Startup cost is dominated by stretching the passcode into the controller
+signer and next signer. This benchmark boots and connects a fresh controller
+for each tier and records how long it takes until the first authenticated
+request succeeds, so regressions such as re-deriving the controller keys on
+``connect()`` show up as a jump in the recorded numbers.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from keri.core import signing
+from keri.core.coring import Tiers
+
+from signify.app.clienting import SignifyClient
+
+from .helpers import random_passcode
+
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.parametrize("tier", [Tiers.low, Tiers.med, Tiers.high])
+def test_time_to_first_authenticated_request(live_stack, tier, record_property, monkeypatch):
+    # Workflow:
+    # 1. Build a client for the tier, which derives the controller keys.
+    # 2. Boot the agent and connect, which must reuse those keys.
+    # 3. Issue the first signed request and verify the signed response.
+    stretches = []
+    stretch = signing.Salter.stretch
+
+    def counting(self, *args, **kwargs):
+        stretches.append(kwargs.get("path"))
+        return stretch(self, *args, **kwargs)
+
+    monkeypatch.setattr(signing.Salter, "stretch", counting)
+
+    start = time.perf_counter()
+    client = SignifyClient(
+        passcode=random_passcode(),
+        tier=tier,
+        url=live_stack["keria_admin_url"],
+        boot_url=live_stack["keria_boot_url"],
+    )
+    derived = time.perf_counter()
+    assert len(stretches) == 2  # controller signer and next signer
+    client.boot()
+    client.connect()
+    connected = time.perf_counter()
+    state = client.states()
+    first = time.perf_counter()
+
+    assert state.agent["i"] == client.agent.pre
+    assert len(stretches) == 2, "connect() must not stretch the passcode again"
+    assert client.ctrl.pre == client.agent.delpre
+
+    timings = dict(
+        derive=derived - start,
+        boot_connect=connected - derived,
+        first_request=first - connected,
+        total=first - start,
+    )
+    for key, value in timings.items():
+        record_property(f"{tier}_{key}_seconds", round(value, 4))
@@ -173,7 +173,7 @@ def test_exchanges_send_multiple_recipients(mockHelpingNowIso8601, make_mock_cli
     from signify.core import keeping
     sender = {'prefix': 'a_prefix', 'name': 'aid1', 'state': {'s': '1', 'd': "ABCDEFG"}}
     mock_keeper = mock({'algo': 'salty', 'params': lambda: {'keeper': 'params'}}, spec=keeping.SaltyKeeper, strict=True)
-    expect(mock_manager, times=2).get(sender).thenReturn(mock_keeper)
+    expect(mock_manager, times=1).get(sender).thenReturn(mock_keeper)
     expect(mock_keeper, times=2).sign(ser=ANY()).thenReturn(['a signature'])
 
     first_response = make_mock_response({'content': 'first'})
@@ -219,3 +219,40 @@ def test_exchanges_send_multiple_recipients(mockHelpingNowIso8601, make_mock_cli
     assert results[0][2] == {'content': 'first'}
     assert results[1][0].said == "ENONx6LhzT1C6_BzCfSGjt7T6DzW39Upi228PFksG_dE"
     assert results[1][2] == {'content': 'second'}
+
+
+def test_exchanges_send_reports_failed_recipients(mockHelpingNowIso8601, make_mock_client_with_manager,
+                                                   make_mock_response):
+    mock_client, mock_manager = make_mock_client_with_manager()
+
+    from signify.core import keeping
+    sender = {'prefix': 'a_prefix', 'name': 'aid1', 'state': {'s': '1', 'd': "ABCDEFG"}}
+    mock_keeper = mock({'algo': 'salty'}, spec=keeping.SaltyKeeper, strict=True)
+    expect(mock_manager, times=1).get(sender).thenReturn(mock_keeper)
+    expect(mock_keeper, times=3).sign(ser=ANY()).thenReturn(['a signature'])
+
+    recipients = ['Eqbc123', 'Eqbc456', 'Eqbc789']
+    responses = {'Eqbc123': {'rec': 'Eqbc123'}, 'Eqbc789': {'rec': 'Eqbc789'}}
+
+    def post(path, json):
+        recipient = json['rec'][0]
+        if recipient == 'Eqbc456':
+            raise ConnectionError("agent unreachable")
+        response = make_mock_response()
+        expect(response, times=1).json().thenReturn(responses[recipient])
+        return response
+
+    mock_client.post = post  # type: ignore
+
+    from signify.peer.exchanging import Exchanges, ExchangeSendError
+    with pytest.raises(ExchangeSendError, match="1 of 3 recipients: Eqbc456") as ex:
+        Exchanges(client=mock_client).send('aid1', 'multisig', sender=sender, route="/multisig/icp",
+                                           payload=dict(gid='a_group'), embeds=dict(), recipients=recipients,
+                                           max_workers=3)  # type: ignore
+
+    first, failed, last = ex.value.results
+    assert failed is None
+    assert isinstance(ex.value.errors['Eqbc456'], ConnectionError)
+    assert first[0].ked['rp'] == 'Eqbc123' and first[0].ked['a'] == {'i': 'Eqbc123', 'gid': 'a_group'}
+    assert last[0].ked['rp'] == 'Eqbc789' and last[2] == {'rec': 'Eqbc789'}
+    assert last[0].ked['dt'] == first[0].ked['dt']